@@ -9,4 +9,29 @@ also contains a wrapper function to perform the job for you.
 """
 
 # Import sub-functions ...
+from .batch import batch
+from .branch_and_bound import branch_and_bound
+from .calc_cascade_min_dists import calc_cascade_min_dists
+from .calc_dists_between_locs import calc_dists_between_locs
+from .calc_min_dists import calc_min_dists
+from .calc_pruned_min_dists import calc_pruned_min_dists
+from .compute import compute
+from .extract_coast import extract_coast
+from .fibonacci_lattice import fibonacci_lattice
+from .find_furthest import find_furthest
+from .find_hull_of_locs import find_hull_of_locs
+from .flush_plots import flush_plots
+from .land_mask import land_mask
+from .ll2xyz import ll2xyz
+from .load_countries import load_countries
+from .load_country import load_country
+from .load_result import load_result
+from .make_coast_tree import make_coast_tree
+from .make_grid import make_grid
+from .make_result_key import make_result_key
+from .plot import plot
+from .polygon_grid import polygon_grid
 from .run import run
+from .save_raster import save_raster
+from .save_result import save_result
+from .submit_plot import submit_plot
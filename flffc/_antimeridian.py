@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def _off_antimeridian(
+    coastLons,
+    /,
+):
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Find the coordinates of the coast which are on the anti-meridian ...
+    on = numpy.abs(coastLons) >= 180.0
+
+    # Find the coordinates of the coast which are on the anti-meridian and which
+    # are between two other coordinates on the same side of the anti-meridian
+    # (these are where Natural Earth has split the Polygon, whereas the first
+    # and last coordinates of each split are where the actual coast crosses the
+    # anti-meridian) ...
+    # NOTE: The first and last coordinates of the coast are always kept, so
+    #       that there is always at least one coordinate left.
+    split = numpy.zeros(coastLons.size, dtype = bool)
+    split[1:-1] = on[1:-1] & (coastLons[:-2] == coastLons[1:-1]) & (coastLons[2:] == coastLons[1:-1])
+
+    # Return answer ...
+    return numpy.logical_not(split)
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def _find(
+    country,
+    kwargs,
+    keep,
+    /,
+):
+    # Import standard modules ...
+    import time
+
+    # Import sub-functions ...
+    from .compute import compute
+
+    # **************************************************************************
+
+    # Start timer ...
+    start = time.perf_counter()                                                 # [s]
+
+    # Try to find the location furthest from the coast ...
+    try:
+        result = compute(country, **kwargs)
+    except Exception as err:
+        # Return failure ...
+        return {
+                 "country" : country,
+            "duration [s]" : time.perf_counter() - start,
+                   "error" : str(err),
+        }
+
+    # Create answer ...
+    row = {
+              "country" : country,
+        "distance [km]" : result["bestDist"] / 1000.0,
+         "duration [s]" : time.perf_counter() - start,
+                "error" : None,
+         "latitude [°]" : result["bestLat"],
+        "longitude [°]" : result["bestLon"],
+           "points [#]" : int(result["lons"].size),
+    }
+
+    # Keep the whole answer too (if requested) ...
+    if keep:
+        row["result"] = result
+
+    # Return answer ...
+    return row
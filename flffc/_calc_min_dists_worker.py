@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+
+# Initialize the coast which is shared by all of the jobs in this process ...
+_coast = {}
+
+# Define function ...
+def _init(
+    coastLons,
+    coastLats,
+    /,
+    *,
+     backend = "Vincenty",
+         eps = 1.0e-12,
+       nIter = 100,
+    ramLimit = 1073741824,
+     useTree = False,
+):
+    # Import sub-functions ...
+    from .make_coast_tree import make_coast_tree
+
+    # **************************************************************************
+
+    # Store the coast (and everything else that is needed) for this process ...
+    # NOTE: This is called once per process, so the coast is only pickled once
+    #       per process rather than once per job.
+    _coast.clear()
+    _coast.update(
+        {
+              "backend" : backend,
+            "coastLats" : coastLats,
+            "coastLons" : coastLons,
+                  "eps" : eps,
+                "nIter" : nIter,
+             "ramLimit" : ramLimit,
+                 "tree" : make_coast_tree(coastLons, coastLats) if useTree else None,
+        }
+    )
+
+# Define function ...
+def _calc(
+    lons,
+    lats,
+    /,
+):
+    # Import sub-functions ...
+    from .calc_min_dists import calc_min_dists
+
+    # **************************************************************************
+
+    # Return answer ...
+    return calc_min_dists(
+        lons,
+        lats,
+        _coast["coastLons"],
+        _coast["coastLats"],
+         backend = _coast["backend"],
+           debug = False,
+             eps = _coast["eps"],
+           nIter = _coast["nIter"],
+        ramLimit = _coast["ramLimit"],
+            tree = _coast["tree"],
+         workers = 1,
+    )
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+# Initialize the background queue of plots which is shared by all of the calls
+# to "submit_plot()" in this process ...
+_queue = {
+    "futures" : [],
+       "pool" : None,
+}
+
+# Define function ...
+def _plot(
+    dirOut,
+    result,
+    kwargs,
+    /,
+):
+    # Import sub-functions ...
+    from .plot import plot
+    from .save_raster import save_raster
+    from .save_result import save_result
+
+    # **************************************************************************
+
+    # Create short-hand ...
+    # NOTE: Finding the middle of the sampled locations can take a while, so
+    #       the answer is saved to the cache of results again if it changes.
+    middle = (result.get("middle"), result.get("middleFrom"))
+
+    # Plot the location furthest from the coast ...
+    plot(
+        dirOut,
+        result,
+             debug = kwargs["debug"],
+               eps = kwargs["eps"],
+             nIter = kwargs["nIter"],
+         onlyValid = kwargs["onlyValid"],
+            render = kwargs["render"],
+            repair = kwargs["repair"],
+           timeout = kwargs["timeout"],
+           useHull = kwargs["useHull"],
+        verifyHull = kwargs["verifyHull"],
+    )
+
+    # Save the distances as a raster (if requested) ...
+    if kwargs["raster"]:
+        save_raster(
+            dirOut,
+            result,
+            debug = kwargs["debug"],
+        )
+
+    # Save the answer (including the middle of the sampled locations) to the
+    # cache of results (if the middle has changed) ...
+    if kwargs["cacheSize"] > 0 and (result.get("middle"), result.get("middleFrom")) != middle:
+        save_result(
+            result,
+             cacheDir = kwargs["cacheDir"],
+            cacheSize = kwargs["cacheSize"],
+        )
+
+    # Return answer ...
+    return f"{dirOut}/{result['country']}.png"
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+
+# Initialize the profile which is shared by all of the phases in this process
+# ...
+_profile = {
+       "counters" : {},
+        "enabled" : False,
+         "phases" : {},
+          "stack" : [],
+    "tracemalloc" : False,
+}
+
+# Define function ...
+def _start(
+    profile = None,
+    /,
+):
+    # Import standard modules ...
+    import copy
+    import tracemalloc
+
+    # **************************************************************************
+
+    # Start the profile (carrying on from an existing one, if provided) ...
+    _profile["counters"] = copy.deepcopy(profile["counters"]) if profile is not None else {}
+    _profile["enabled"] = True
+    _profile["phases"] = copy.deepcopy(profile["phases"]) if profile is not None else {}
+    _profile["stack"] = []
+    _profile["tracemalloc"] = not tracemalloc.is_tracing()
+    if _profile["tracemalloc"]:
+        tracemalloc.start()
+
+# Define function ...
+def _stop():
+    # Import standard modules ...
+    import copy
+    import tracemalloc
+
+    # **************************************************************************
+
+    # Stop the profile (and stop tracing memory, if it was started by the
+    # profile) ...
+    _profile["enabled"] = False
+    if _profile["tracemalloc"]:
+        tracemalloc.stop()
+        _profile["tracemalloc"] = False
+
+    # Return answer ...
+    return {
+        "counters" : copy.deepcopy(_profile["counters"]),
+          "phases" : copy.deepcopy(_profile["phases"]),
+    }
+
+# Define function ...
+def _count(
+    name,
+    n = 1,
+    /,
+):
+    # Increment the counter (if the profile is running) ...
+    if _profile["enabled"]:
+        _profile["counters"][name] = _profile["counters"].get(name, 0) + int(n)
+
+# Define function ...
+def _peak():
+    # Import standard modules ...
+    import tracemalloc
+
+    # **************************************************************************
+
+    # Pass the peak of the traced memory since it was last reset to all of the
+    # phases which are running ...
+    if not tracemalloc.is_tracing():
+        return
+    peak = tracemalloc.get_traced_memory()[1]                                   # [B]
+    for entry in _profile["stack"]:
+        entry["peak"] = max(entry["peak"], peak)                                # [B]
+    tracemalloc.reset_peak()
+
+# Define function ...
+def _phase(
+    name,
+    /,
+):
+    # Import standard modules ...
+    import contextlib
+    import resource
+    import time
+
+    # **************************************************************************
+
+    # Define a generator which times the phase ...
+    @contextlib.contextmanager
+    def timer():
+        # Do nothing if the profile is not running ...
+        if not _profile["enabled"]:
+            yield
+            return
+
+        # Start the phase ...
+        _peak()
+        entry = {
+             "cpu" : time.process_time(),
+            "peak" : 0,
+             "rss" : resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,        # [KiB]
+            "wall" : time.perf_counter(),
+        }
+        _profile["stack"].append(entry)
+
+        # Run the phase ...
+        try:
+            yield
+        finally:
+            # Stop the phase and add it to the profile ...
+            _peak()
+            _profile["stack"].pop()
+            phase = _profile["phases"].setdefault(
+                name,
+                {
+                                 "calls [#]" : 0,
+                                   "cpu [s]" : 0.0,
+                   "peak RSS increase [KiB]" : 0,
+                    "peak traced memory [B]" : 0,
+                                  "wall [s]" : 0.0,
+                },
+            )
+            phase["calls [#]"] += 1
+            phase["cpu [s]"] += time.process_time() - entry["cpu"]
+            # NOTE: The peak RSS is the peak of the whole process since it
+            #       started, so only the amount that it went up by during the
+            #       phase can be attributed to the phase.
+            phase["peak RSS increase [KiB]"] = max(phase["peak RSS increase [KiB]"], resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - entry["rss"])
+            phase["peak traced memory [B]"] = max(phase["peak traced memory [B]"], entry["peak"])
+            phase["wall [s]"] += time.perf_counter() - entry["wall"]
+
+    # Return answer ...
+    return timer()
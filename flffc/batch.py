@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def batch(
+    fname,
+    /,
+    *,
+       backend = "Vincenty",
+      cacheDir = "~/.cache/flffc",
+     cacheSize = 1073741824,
+       cascade = False,
+          conv = 1000.0,
+     countries = None,
+         debug = __debug__,
+       density = 1.0,
+        dirOut = None,
+         dtype = "float64",
+           eps = 1.0e-12,
+        method = "UniformGrid",
+         nIter = 100,
+     onlyValid = False,
+      plotters = 1,
+       profile = False,
+         prune = False,
+      ramLimit = 1073741824,
+        raster = False,
+        render = "Scatter",
+        repair = False,
+         steps = 50,
+       timeout = 60.0,
+       useHull = False,
+     useKDTree = False,
+    verifyHull = False,
+       workers = 1,
+):
+    """Find the location furthest from the coast in lots of countries
+
+    This function loads the index of the on-disk cache of the Natural Earth
+    countries (see :func:`flffc.load_countries`) and then finds the location
+    furthest from the coast in every country (or in every country in the list
+    provided by the user). The countries are spread across a pool of processes,
+    starting with the countries which have the most coordinates in their coasts,
+    each process only loads the countries which it is given from the cache and
+    the answers are written to the output file as soon as each country is
+    finished (so the order of the lines in the output file is not the same as
+    the order of the countries).
+
+    Parameters
+    ----------
+    fname : str
+        the name of the output file, which will be a CSV file if it ends in
+        ".csv" and a newline-delimited JSON file otherwise
+    backend : str, optional
+        the formula to use for the distances ("Haversine", "AndoyerLambert",
+        "Vincenty", "Karney" or "Hybrid"), see
+        :func:`flffc.calc_dists_between_locs` and :func:`flffc.calc_min_dists`
+    cacheDir : str, optional
+        the directory to store the cache in
+    cacheSize : int, optional
+        the maximum size of the cache of results (in bytes), if it is zero then
+        results are neither loaded from nor saved to the cache
+    cascade : bool, optional
+        use the coasts of the countries in the 110m and 50m Natural Earth
+        Shapefiles to discard the sampled locations which cannot be the
+        furthest from the coast, see :func:`flffc.calc_cascade_min_dists`
+    conv : float, optional
+        the distance that defines the branch-and-bound search as being
+        converged (in metres)
+    countries : list of str, optional
+        the names of the countries (if not provided then all of the countries
+        are done)
+    debug : bool, optional
+        print debug messages
+    density : float, optional
+        the number of locations per 1,000 km² in the Fibonacci lattice
+    dirOut : str, optional
+        the directory to save the PNGs in (if not provided then no PNGs are
+        made)
+    dtype : str, optional
+        the type of the arrays of the sampled locations and their distances
+        which are cached ("float64" or "float32")
+    eps : float, optional
+        the tolerance of the Vincenty formula iterations
+    method : str, optional
+        the method for finding the location ("UniformGrid", "PolygonGrid",
+        "FibonacciLattice" or "BranchAndBound")
+    nIter : int, optional
+        the maximum number of iterations (particularly the Vincenty formula)
+    onlyValid : bool, optional
+        only return valid Polygons (checks for validity can take a while, if
+        being called often)
+    plotters : int, optional
+        the number of processes to make the PNGs with
+    profile : bool, optional
+        record how long each phase takes and how much memory it uses, and save
+        it as a JSON file next to each PNG (this needs "dirOut")
+    prune : bool, optional
+        stop calculating the distance from a sampled location to the coast as
+        soon as it cannot be the furthest from the coast (the distances of the
+        pruned locations are then only upper bounds)
+    ramLimit : int, optional
+        the maximum RAM usage of each "large" array (in bytes), which is shared
+        equally between the processes
+    raster : bool, optional
+        save the distances as rasters too, next to each PNG (this needs
+        "dirOut", and can only be used with the "UniformGrid" method)
+    render : str, optional
+        how to draw the sampled locations ("Scatter" or "PColorMesh", which
+        can only be used with the "UniformGrid" method)
+    repair : bool, optional
+        attempt to repair invalid Polygons
+    steps : int, optional
+        the number of longitudes and latitudes in the uniform grid
+    timeout : float, optional
+        the timeout for any requests/subprocess calls (in seconds)
+    useHull : bool, optional
+        find the middle of just the sampled locations which are on their
+        convex hull
+    useKDTree : bool, optional
+        use a KD-tree to find the nearest coordinates of the coast
+    verifyHull : bool, optional
+        find the middle of all of the sampled locations and of just the ones
+        which are on their convex hull, and warn if they differ
+    workers : int, optional
+        the number of processes to spread the countries across
+
+    Returns
+    -------
+    results : list of dict
+        the answers for each country (in the order that they finished)
+
+    Notes
+    -----
+    The processes are started using the "spawn" method, so scripts which call
+    this function must use the ``if __name__ == "__main__":`` idiom, see `the
+    Python documentation
+    <https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods>`_ .
+
+    If a country fails (for example, if none of the points of the uniform grid
+    are within it) then the error is recorded in the output file and the other
+    countries carry on.
+
+    If "dirOut" is provided then each answer is added to the background queue
+    of plots (see :func:`flffc.submit_plot`) as soon as it is found, so the
+    PNGs are drawn and optimized by their own pool of "plotters" processes
+    while the next countries are being done. The PNGs are all finished (see
+    :func:`flffc.flush_plots`) before this function returns and any which
+    fail are reported, without stopping the others.
+
+    Copyright 2017 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FLFFC, https://github.com/Guymer/flffc
+    """
+
+    # Import standard modules ...
+    import concurrent.futures
+    import csv
+    import json
+    import multiprocessing
+    import os
+
+    # Import sub-functions ...
+    from ._batch_worker import _find
+    from .flush_plots import flush_plots
+    from .load_countries import load_countries
+    from .submit_plot import submit_plot
+
+    # **************************************************************************
+
+    # Check that the rasters can be saved (if requested) before finding any
+    # locations (they are saved next to the PNGs) ...
+    if raster and dirOut is None:
+        raise ValueError("\"raster\" can only be used with \"dirOut\"") from None
+
+    # Check that the distances can be put back onto the uniform grid (if
+    # requested, when the PNGs are made) before finding any locations ...
+    if dirOut is not None and method != "UniformGrid":
+        if raster:
+            raise ValueError(f"\"raster\" can only be used with the \"UniformGrid\" method (not {repr(method)})") from None
+        if render == "PColorMesh":
+            raise ValueError(f"the \"PColorMesh\" render can only be used with the \"UniformGrid\" method (not {repr(method)})") from None
+
+    # Create short-hands ...
+    fields = [
+        "country",
+        "longitude [°]",
+        "latitude [°]",
+        "distance [km]",
+        "points [#]",
+        "duration [s]",
+        "error",
+    ]
+    kwargs = {
+          "backend" : backend,
+         "cacheDir" : cacheDir,
+        "cacheSize" : cacheSize,
+          "cascade" : cascade,
+             "conv" : conv,
+            "debug" : debug,
+          "density" : density,
+            "dtype" : dtype,
+              "eps" : eps,
+           "method" : method,
+            "nIter" : nIter,
+        "onlyValid" : onlyValid,
+          "profile" : profile,
+            "prune" : prune,
+         "ramLimit" : max(1, ramLimit // workers),
+           "repair" : repair,
+            "steps" : steps,
+        "useKDTree" : useKDTree,
+          "workers" : 1,
+    }
+
+    # Make output directory ...
+    if os.path.dirname(fname) and not os.path.exists(os.path.dirname(fname)):
+        os.makedirs(os.path.dirname(fname))
+
+    # Load the index of the cache of countries (making the cache if required,
+    # which only reads the Shapefile once) ...
+    _, index, _ = load_countries(
+          cacheDir = cacheDir,
+             debug = debug,
+         onlyValid = onlyValid,
+            repair = repair,
+        resolution = "10m",
+    )
+
+    # Make the caches of the coarser countries too (if required), so that the
+    # processes do not all try to make them at the same time ...
+    if cascade:
+        for resolution in ["110m", "50m"]:
+            load_countries(
+                  cacheDir = cacheDir,
+                     debug = debug,
+                 onlyValid = onlyValid,
+                    repair = repair,
+                resolution = resolution,
+            )
+
+    # Initialize list ...
+    jobs = []
+
+    # Loop over countries ...
+    for neName, info in index.items():
+        # Skip this country if it is not one that we are looking for ...
+        if countries is not None and neName not in countries:
+            continue
+
+        # Estimate how long this country will take, based on the number of
+        # coordinates in the coast, and append it to the list ...
+        jobs.append((info["nCoast"], neName))
+
+    # Check that all of the countries were found ...
+    if countries is not None:
+        for country in countries:
+            if country not in index:
+                print(f"WARNING: \"{country}\" is not a country in the 10m Natural Earth Shapefile.")
+
+    # Sort the jobs so that the largest countries are done first ...
+    jobs.sort(key = lambda job: job[0], reverse = True)
+
+    print(f"Finding the location furthest from the coast in {len(jobs):,d} countries using {workers:,d} processes ...")
+
+    # Initialize list ...
+    results = []
+
+    # Open output file ...
+    with open(fname, mode = "wt", encoding = "utf-8", newline = "") as fObj:
+        # Check what format the user wants ...
+        if fname.endswith(".csv"):
+            writer = csv.DictWriter(fObj, fieldnames = fields)
+            writer.writeheader()
+        else:
+            writer = None
+
+        # Define a helper function to save a result as soon as it is done (and
+        # to add the whole answer to the background queue of plots, if
+        # requested) ...
+        def save(result):
+            answer = result.pop("result", None)
+            if answer is not None:
+                submit_plot(
+                    dirOut,
+                    answer,
+                      cacheDir = cacheDir,
+                     cacheSize = cacheSize,
+                         debug = debug,
+                           eps = eps,
+                         nIter = nIter,
+                     onlyValid = onlyValid,
+                      plotters = plotters,
+                        raster = raster,
+                        render = render,
+                        repair = repair,
+                       timeout = timeout,
+                       useHull = useHull,
+                    verifyHull = verifyHull,
+                )
+            results.append(result)
+            if writer is None:
+                fObj.write(json.dumps(result, ensure_ascii = False, sort_keys = True) + "\n")
+            else:
+                writer.writerow(result)
+            fObj.flush()
+            if result["error"] is None:
+                print(f"  [{len(results):,d}/{len(jobs):,d}] The furthest you can get from the coast in {result['country']} is ~{result['distance [km]']:.1f} km (took {result['duration [s]']:.1f} s).")
+            else:
+                print(f"  [{len(results):,d}/{len(jobs):,d}] Failed to find the location in {result['country']} ({result['error']}).")
+
+        # Check if the user wants to use more than one process ...
+        if workers > 1:
+            # Create a pool of workers and submit all of the jobs (largest
+            # first) ...
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers = workers,
+                 mp_context = multiprocessing.get_context("spawn"),
+            ) as pool:
+                futures = [
+                    pool.submit(_find, neName, kwargs, dirOut is not None) for _, neName in jobs
+                ]
+
+                # Loop over jobs as they complete ...
+                for future in concurrent.futures.as_completed(futures):
+                    save(future.result())
+        else:
+            # Loop over jobs ...
+            for _, neName in jobs:
+                save(_find(neName, kwargs, dirOut is not None))
+
+    # Wait for the background queue of plots to finish (if required) ...
+    if dirOut is not None:
+        print(f"Waiting for the PNGs to finish using {plotters:,d} processes ...")
+        plots = flush_plots(debug = debug)
+        nFailed = sum(plot["error"] is not None for plot in plots)              # [#]
+        if nFailed > 0:
+            print(f"WARNING: {nFailed:,d} of the {len(plots):,d} PNGs failed.")
+
+    # Return answers ...
+    return results
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def branch_and_bound(
+    geom,
+    coastLons,
+    coastLats,
+    /,
+    *,
+     backend = "Vincenty",
+        conv = 1000.0,
+       debug = __debug__,
+         eps = 1.0e-12,
+       nIter = 100,
+    ramLimit = 1073741824,
+        tree = None,
+):
+    """Find the location furthest from the coast using branch-and-bound
+
+    This function searches for the location within the geometry which is the
+    furthest from the coast using a quadtree of longitude/latitude cells, in the
+    same way as `polylabel <https://github.com/mapbox/polylabel>`_ does. Each
+    cell has an upper bound on the distance to the coast of any location within
+    it, which is the distance from the centre of the cell to the coast plus the
+    distance from the centre of the cell to its boundary. Cells which cannot
+    beat the best location found so far (by more than "conv") are discarded and
+    the others are split into four, starting with the most promising cells.
+
+    Parameters
+    ----------
+    geom : shapely.geometry.polygon.Polygon, shapely.geometry.multipolygon.MultiPolygon
+        the Shapely geometry of the country
+    coastLons : numpy.ndarray
+        the longitudes of the coast (in degrees)
+    coastLats : numpy.ndarray
+        the latitudes of the coast (in degrees)
+    backend : str, optional
+        the formula to use ("Haversine", "AndoyerLambert", "Vincenty",
+        "Karney" or "Hybrid"), see :func:`flffc.calc_dists_between_locs`
+    conv : float, optional
+        the distance that defines the search as being converged (in metres),
+        which must be positive
+    debug : bool, optional
+        print debug messages
+    eps : float, optional
+        the tolerance of the Vincenty formula iterations
+    nIter : int, optional
+        the maximum number of iterations (particularly the Vincenty formula)
+    ramLimit : int, optional
+        the maximum RAM usage of each "large" array (in bytes)
+    tree : scipy.spatial.KDTree, optional
+        the KD-tree of the coast (as made by :func:`flffc.make_coast_tree`)
+
+    Returns
+    -------
+    bestLon : float
+        the longitude of the location furthest from the coast (in degrees)
+    bestLat : float
+        the latitude of the location furthest from the coast (in degrees)
+    bestDist : float
+        the distance from the location furthest from the coast to the coast (in
+        metres)
+    lons : numpy.ndarray
+        the longitudes of the centres of the cells which are within the
+        geometry (in degrees)
+    lats : numpy.ndarray
+        the latitudes of the centres of the cells which are within the geometry
+        (in degrees)
+    dists : numpy.ndarray
+        the distances from the centres of the cells which are within the
+        geometry to the coast (in metres)
+
+    Notes
+    -----
+    The distance from the centre of a cell to its boundary is taken to be the
+    maximum Geodesic distance from the centre to the four corners and the four
+    mid-points of the edges of the cell.
+
+    The distance to the coast is the distance to the nearest coordinate of the
+    coast, just like :func:`flffc.calc_min_dists`, so the triangle inequality
+    makes the upper bound of each cell valid. Cells which do not intersect the
+    geometry at all (for example, cells over a lake) are discarded straight
+    away.
+
+    Copyright 2017 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FLFFC, https://github.com/Guymer/flffc
+    """
+
+    # Import standard modules ...
+    import heapq
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+    try:
+        import shapely
+    except:
+        raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+    # Import sub-functions ...
+    from .calc_dists_between_locs import calc_dists_between_locs
+    from .calc_min_dists import calc_min_dists
+    from .land_mask import land_mask
+
+    # **************************************************************************
+
+    # Check that the search can converge ...
+    # NOTE: The upper bounds of the cells only shrink as they are split, so the
+    #       search might never stop if it has to be perfectly converged.
+    if conv <= 0.0:
+        raise ValueError(f"\"conv\" must be positive ({conv:.6e} m was requested)") from None
+
+    # Define a helper function to evaluate lots of cells at once ...
+    def evaluate(cxs, cys, hs):
+        # Find out which cells intersect the geometry ...
+        keep = shapely.intersects(
+            geom,
+            shapely.box(cxs - hs, cys - hs, cxs + hs, cys + hs),
+        )
+        cxs = cxs[keep]                                                         # [°]
+        cys = cys[keep]                                                         # [°]
+        hs = hs[keep]                                                           # [°]
+
+        # Find the distance from the centre of each cell to the coast and find
+        # out which centres are within the geometry ...
+        ds = calc_min_dists(
+            cxs,
+            cys,
+            coastLons,
+            coastLats,
+             backend = backend,
+               debug = False,
+                 eps = eps,
+               nIter = nIter,
+            ramLimit = ramLimit,
+                tree = tree,
+        )                                                                       # [m]
+        lands = land_mask(geom, cxs, cys)
+
+        # Find the distance from the centre of each cell to its boundary ...
+        offs = numpy.array(
+            [
+                [-1.0, -1.0],
+                [-1.0,  0.0],
+                [-1.0, +1.0],
+                [ 0.0, -1.0],
+                [ 0.0, +1.0],
+                [+1.0, -1.0],
+                [+1.0,  0.0],
+                [+1.0, +1.0],
+            ],
+            dtype = numpy.float64,
+        )
+        rs = calc_dists_between_locs(
+            cxs.reshape(-1, 1),
+            cys.reshape(-1, 1),
+            cxs.reshape(-1, 1) + hs.reshape(-1, 1) * offs[:, 0].reshape(1, -1),
+            numpy.clip(cys.reshape(-1, 1) + hs.reshape(-1, 1) * offs[:, 1].reshape(1, -1), -90.0, +90.0),
+            backend = "Vincenty" if backend == "Hybrid" else backend,
+                eps = eps,
+              nIter = nIter,
+        ).max(axis = 1)                                                         # [m]
+
+        # Return answers ...
+        return cxs, cys, hs, ds, lands, ds + rs
+
+    # **************************************************************************
+
+    # Prepare the geometry (so that the spatial index is only built once) ...
+    shapely.prepare(geom)
+
+    # Create short-hands ...
+    lon_min, lat_min, lon_max, lat_max = geom.bounds                            # [°], [°], [°], [°]
+    size = max(min(lon_max - lon_min, lat_max - lat_min), 1.0e-6)               # [°]
+    nPop = 64                                                                   # [#]
+
+    # Initialize lists ...
+    lons = []                                                                   # [°]
+    lats = []                                                                   # [°]
+    dists = []                                                                  # [m]
+
+    # Use a location which is guaranteed to be within the geometry as the first
+    # guess ...
+    pnt = geom.representative_point()
+    bestLon = pnt.x                                                             # [°]
+    bestLat = pnt.y                                                             # [°]
+    bestDist = float(
+        calc_min_dists(
+            numpy.array([bestLon]),
+            numpy.array([bestLat]),
+            coastLons,
+            coastLats,
+             backend = backend,
+               debug = False,
+                 eps = eps,
+               nIter = nIter,
+            ramLimit = ramLimit,
+                tree = tree,
+        )[0]
+    )                                                                           # [m]
+    nEval = 1                                                                   # [#]
+
+    # Cover the bounding box with square cells ...
+    cxs, cys = numpy.meshgrid(
+        numpy.arange(lon_min, lon_max, size) + 0.5 * size,
+        numpy.arange(lat_min, lat_max, size) + 0.5 * size,
+        indexing = "ij",
+    )                                                                           # [°], [°]
+    cxs = cxs.flatten()                                                         # [°]
+    cys = cys.flatten()                                                         # [°]
+    hs = numpy.full(cxs.size, 0.5 * size, dtype = numpy.float64)                # [°]
+
+    # Initialize queue ...
+    # NOTE: "heapq" is a min-heap, so store the negative of the upper bound so
+    #       that the most promising cell is always at the front of the queue.
+    # NOTE: The counter stops the comparison ever reaching the NumPy values.
+    queue = []
+    counter = 0                                                                 # [#]
+
+    # Start infinite loop ...
+    while True:
+        # Evaluate cells ...
+        cxs, cys, hs, ds, lands, maxs = evaluate(cxs, cys, hs)                  # [°], [°], [°], [m], [bool], [m]
+        nEval += cxs.size                                                       # [#]
+
+        # Append the cells which are within the geometry to the lists ...
+        lons.append(cxs[lands])                                                 # [°]
+        lats.append(cys[lands])                                                 # [°]
+        dists.append(ds[lands])                                                 # [m]
+
+        # Replace the best location if required ...
+        if lands.any():
+            i = numpy.argmax(numpy.where(lands, ds, -1.0))
+            if ds[i] > bestDist:
+                bestLon = float(cxs[i])                                         # [°]
+                bestLat = float(cys[i])                                         # [°]
+                bestDist = float(ds[i])                                         # [m]
+
+        # Add the cells which might contain a better location to the queue ...
+        for cx, cy, h, mx in zip(cxs, cys, hs, maxs, strict = True):
+            if mx - bestDist > conv:
+                heapq.heappush(queue, (-mx, counter, cx, cy, h))
+                counter += 1                                                    # [#]
+
+        # Pop the most promising cells from the queue (stopping if the queue is
+        # empty or if even the most promising cell cannot beat the best
+        # location) ...
+        cells = []
+        while queue and len(cells) < nPop:
+            if -queue[0][0] - bestDist <= conv:
+                queue = []
+                break
+            cells.append(heapq.heappop(queue))
+        if not cells:
+            break
+
+        # Split the cells into four ...
+        cxs = []                                                                # [°]
+        cys = []                                                                # [°]
+        hs = []                                                                 # [°]
+        for _, _, cx, cy, h in cells:
+            for dx, dy in [(-1.0, -1.0), (-1.0, +1.0), (+1.0, -1.0), (+1.0, +1.0)]:
+                cxs.append(cx + 0.5 * h * dx)
+                cys.append(cy + 0.5 * h * dy)
+                hs.append(0.5 * h)
+        cxs = numpy.array(cxs, dtype = numpy.float64)                           # [°]
+        cys = numpy.array(cys, dtype = numpy.float64)                           # [°]
+        hs = numpy.array(hs, dtype = numpy.float64)                             # [°]
+
+        if debug:
+            print(f"INFO: The best distance so far is {0.001 * bestDist:,.3f} km after {nEval:,d} evaluations ({len(queue):,d} cells are queued).")
+
+    if debug:
+        print(f"INFO: The best distance is {0.001 * bestDist:,.3f} km after {nEval:,d} evaluations.")
+
+    # Return answers ...
+    return bestLon, bestLat, bestDist, numpy.concatenate(lons), numpy.concatenate(lats), numpy.concatenate(dists)
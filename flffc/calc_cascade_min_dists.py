@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def calc_cascade_min_dists(
+    lons,
+    lats,
+    coastLons,
+    coastLats,
+    coarseCoasts,
+    /,
+    *,
+     backend = "Vincenty",
+       debug = __debug__,
+         eps = 1.0e-12,
+       nIter = 100,
+       prune = False,
+    ramLimit = 1073741824,
+        tree = None,
+     workers = 1,
+):
+    """Calculate the distances from lots of locations to the coast (using
+    coarser coasts to discard the locations which cannot be the furthest from
+    the coast)
+
+    This function reads in arrays of locations (in degrees), arrays of the
+    coordinates of the coast (in degrees) and a list of arrays of the
+    coordinates of coarser versions of the same coast (in degrees). It
+    calculates the distances from the locations to each coarser coast in turn
+    (coarsest first) and discards the locations which cannot be the furthest
+    from the coast, before calculating the Geodesic distance (in metres) from
+    the remaining locations to the nearest coordinate of the coast.
+
+    Parameters
+    ----------
+    lons : numpy.ndarray
+        the longitudes of the locations (in degrees)
+    lats : numpy.ndarray
+        the latitudes of the locations (in degrees)
+    coastLons : numpy.ndarray
+        the longitudes of the coast (in degrees)
+    coastLats : numpy.ndarray
+        the latitudes of the coast (in degrees)
+    coarseCoasts : list of tuple of numpy.ndarray
+        the longitudes and latitudes of the coarser coasts (in degrees), with
+        the coarsest first
+    backend : str, optional
+        the formula to use ("Haversine", "AndoyerLambert", "Vincenty",
+        "Karney" or "Hybrid"), see :func:`flffc.calc_dists_between_locs`
+    debug : bool, optional
+        print debug messages
+    eps : float, optional
+        the tolerance of the Vincenty formula iterations
+    nIter : int, optional
+        the maximum number of iterations (particularly the Vincenty formula)
+    prune : bool, optional
+        use :func:`flffc.calc_pruned_min_dists` (rather than
+        :func:`flffc.calc_min_dists`) for the remaining locations
+    ramLimit : int, optional
+        the maximum RAM usage of each "large" array (in bytes)
+    tree : scipy.spatial.KDTree, optional
+        the KD-tree of the coast (as made by :func:`flffc.make_coast_tree`)
+    workers : int, optional
+        the number of processes to spread the locations across (which cannot
+        be more than 1 if "prune" is True)
+
+    Returns
+    -------
+    dists : numpy.ndarray
+        the distances from each location to the coast (in metres), which are
+        only estimates (from the coarser coasts) for the locations which were
+        discarded
+
+    Notes
+    -----
+    The distance to the coast is the distance to the nearest coordinate of the
+    coast, therefore the triangle inequality means that the distance from any
+    location to a coarser coast is within the Hausdorff distance between the
+    coordinates of the two coasts of the distance from the same location to the
+    coast. The Hausdorff distance is the largest distance from any coordinate
+    of either coast to the nearest coordinate of the other coast and it is
+    found (exactly) using a KD-tree of each coast.
+
+    At each level, the largest of the distances to the coarser coast minus the
+    Hausdorff distance is a lower bound on the answer, so any location whose
+    distance to the coarser coast plus the Hausdorff distance is less than it
+    cannot be the furthest from the coast and is discarded. The distances of
+    the locations which are not discarded are exactly the same as from
+    :func:`flffc.calc_min_dists`, so the location with the largest distance is
+    too.
+
+    Copyright 2017 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FLFFC, https://github.com/Guymer/flffc
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .calc_min_dists import calc_min_dists
+    from .calc_pruned_min_dists import calc_pruned_min_dists
+    from .make_coast_tree import make_coast_tree
+
+    # **************************************************************************
+
+    # Check that the user has not asked to prune the locations and to spread
+    # them across a pool of processes (the locations are pruned one at a time)
+    # ...
+    if prune and workers > 1:
+        raise ValueError(f"\"prune\" cannot be used with more than one worker ({workers:,d} were requested)") from None
+
+    # Flatten the arrays ...
+    shape = numpy.shape(lons)
+    lons = numpy.asarray(lons, dtype = numpy.float64).flatten()                 # [°]
+    lats = numpy.asarray(lats, dtype = numpy.float64).flatten()                 # [°]
+    coastLons = numpy.asarray(coastLons, dtype = numpy.float64).flatten()       # [°]
+    coastLats = numpy.asarray(coastLats, dtype = numpy.float64).flatten()       # [°]
+
+    # Make a KD-tree of the coast (if one was not provided) ...
+    fineTree = make_coast_tree(coastLons, coastLats) if tree is None else tree
+
+    # Initialize the answers, the locations which are still being considered
+    # and the lower bound on the answer ...
+    dists = numpy.zeros(lons.size, dtype = numpy.float64)                       # [m]
+    keep = numpy.arange(lons.size)
+    lower = -1.0                                                                # [m]
+
+    # Loop over coarser coasts (coarsest first) ...
+    for cLons, cLats in coarseCoasts:
+        # Flatten the arrays and make a KD-tree of the coarser coast ...
+        cLons = numpy.asarray(cLons, dtype = numpy.float64).flatten()           # [°]
+        cLats = numpy.asarray(cLats, dtype = numpy.float64).flatten()           # [°]
+        cTree = make_coast_tree(cLons, cLats)
+
+        # Find the Hausdorff distance between the coarser coast and the coast
+        # ...
+        err = max(
+            calc_min_dists(
+                coastLons,
+                coastLats,
+                cLons,
+                cLats,
+                 backend = backend,
+                   debug = False,
+                     eps = eps,
+                   nIter = nIter,
+                ramLimit = ramLimit,
+                    tree = cTree,
+            ).max(),
+            calc_min_dists(
+                cLons,
+                cLats,
+                coastLons,
+                coastLats,
+                 backend = backend,
+                   debug = False,
+                     eps = eps,
+                   nIter = nIter,
+                ramLimit = ramLimit,
+                    tree = fineTree,
+            ).max(),
+        )                                                                       # [m]
+
+        # Find the distances from the remaining locations to the coarser coast
+        # ...
+        dists[keep] = calc_min_dists(
+            lons[keep],
+            lats[keep],
+            cLons,
+            cLats,
+             backend = backend,
+               debug = False,
+                 eps = eps,
+               nIter = nIter,
+            ramLimit = ramLimit,
+                tree = cTree,
+        )                                                                       # [m]
+        del cTree
+
+        # Update the lower bound and discard the locations which cannot be the
+        # furthest from the coast ...
+        lower = max(lower, float(dists[keep].max()) - err)                      # [m]
+        nKeep = keep.size                                                       # [#]
+        keep = keep[dists[keep] + err >= lower]
+
+        if debug:
+            print(f"INFO: The coarser coast has {cLons.size:,d} coordinates and is within {0.001 * err:,.3f} km of the coast; {keep.size:,d} of the {nKeep:,d} locations are still being considered.")
+
+    # Find the distances from the remaining locations to the coast ...
+    if prune:
+        dists[keep] = calc_pruned_min_dists(
+            lons[keep],
+            lats[keep],
+            coastLons,
+            coastLats,
+             backend = backend,
+               debug = debug,
+                 eps = eps,
+               nIter = nIter,
+            ramLimit = ramLimit,
+                tree = fineTree,
+        )                                                                       # [m]
+    else:
+        dists[keep] = calc_min_dists(
+            lons[keep],
+            lats[keep],
+            coastLons,
+            coastLats,
+             backend = backend,
+               debug = debug,
+                 eps = eps,
+               nIter = nIter,
+            ramLimit = ramLimit,
+                tree = tree,
+             workers = workers,
+        )                                                                       # [m]
+
+    # Return answer ...
+    return dists.reshape(shape)
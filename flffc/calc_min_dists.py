@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def calc_min_dists(
+    lons,
+    lats,
+    coastLons,
+    coastLats,
+    /,
+    *,
+     backend = "Vincenty",
+       debug = __debug__,
+         eps = 1.0e-12,
+       nIter = 100,
+    ramLimit = 1073741824,
+        tree = None,
+     workers = 1,
+):
+    """Calculate the distances from lots of locations to the coast.
+
+    This function reads in arrays of locations (in degrees) and arrays of the
+    coordinates of the coast (in degrees) and calculates the Geodesic distance
+    (in metres) from each location to the nearest coordinate of the coast.
+
+    Parameters
+    ----------
+    lons : numpy.ndarray
+        the longitudes of the locations (in degrees)
+    lats : numpy.ndarray
+        the latitudes of the locations (in degrees)
+    coastLons : numpy.ndarray
+        the longitudes of the coast (in degrees)
+    coastLats : numpy.ndarray
+        the latitudes of the coast (in degrees)
+    backend : str, optional
+        the formula to use ("Haversine", "AndoyerLambert", "Vincenty",
+        "Karney" or "Hybrid"), see :func:`flffc.calc_dists_between_locs`
+    debug : bool, optional
+        print debug messages
+    eps : float, optional
+        the tolerance of the Vincenty formula iterations
+    nIter : int, optional
+        the maximum number of iterations (particularly the Vincenty formula)
+    ramLimit : int, optional
+        the maximum RAM usage of each "large" array (in bytes)
+    tree : scipy.spatial.KDTree, optional
+        the KD-tree of the coast (as made by :func:`flffc.make_coast_tree`), if
+        it is not provided then every location is compared with every
+        coordinate of the coast
+    workers : int, optional
+        the number of processes to spread the locations across (each process
+        gets an equal share of "ramLimit")
+
+    Returns
+    -------
+    dists : numpy.ndarray
+        the distances from each location to the coast (in metres)
+
+    Notes
+    -----
+    The locations are processed in blocks and the coordinates of the coast are
+    processed in chunks, such that all of the temporary arrays used by the
+    Vincenty formula for each block and each chunk (about 32 arrays, each the
+    size of the array of distances) do not use more than "ramLimit" bytes. A
+    running minimum is kept for each location as the chunks are processed.
+
+    If the "Hybrid" backend is requested (and a KD-tree is not provided) then
+    the minimum "AndoyerLambert" distance from each location to the coast is
+    found first, and the "AndoyerLambert" distances which could be the nearest
+    are kept as each chunk is calculated (so that they are only calculated
+    once). For distances up to 10,000 km the "AndoyerLambert" distance was
+    measured to be never more than 0.00015% away from the Geodesic distance
+    (see :func:`flffc.calc_dists_between_locs`), therefore, allowing for an
+    error of 0.001%, the coordinate of the coast which is actually the nearest
+    must have an "AndoyerLambert" distance within 0.002% of that minimum. Only
+    the Geodesic distances to those few candidates are then calculated (using
+    the "Vincenty" backend). The "AndoyerLambert" distance is a lot less
+    accurate for longer distances, so the Geodesic distances from any location
+    which might be more than 10,000 km from the coast to every coordinate of
+    the coast are calculated instead. Either way, the answer is exactly the
+    same as using the "Vincenty" backend for every coordinate of the coast. If
+    a KD-tree is provided then the "Hybrid" backend is the same as the
+    "Vincenty" backend, as only a few candidates are compared with each
+    location anyway.
+
+    If a KD-tree is provided then only a small set of candidate coordinates is
+    compared with each location. The "nNear" nearest coordinates on a sphere
+    are found first and the minimum Geodesic distance to them is an upper bound
+    on the answer. The great-circle distance on a sphere (of the mean radius of
+    the Earth) is never more than 0.6% longer than the Geodesic distance on the
+    WGS84 ellipsoid, therefore the coordinate of the coast which is actually the
+    nearest must be within a sphere-distance of 1% more than that upper bound.
+    All of the coordinates within that radius are then found using the KD-tree
+    and the Geodesic distances to them are calculated, which makes the answer
+    exactly the same as comparing with every coordinate of the coast.
+
+    If more than one worker is requested then the locations are split into
+    blocks and the blocks are spread across a pool of processes (which are
+    started using the "spawn" method). The coast is sent to each process once,
+    when it starts, and the answers are put back together in the original order
+    so that they are exactly the same as using one process. Scripts which call
+    this function must therefore use the ``if __name__ == "__main__":`` idiom,
+    see `the Python documentation
+    <https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods>`_ .
+
+    Copyright 2017 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FLFFC, https://github.com/Guymer/flffc
+    """
+
+    # Import standard modules ...
+    import concurrent.futures
+    import functools
+    import multiprocessing
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # Import sub-functions ...
+    from ._calc_min_dists_worker import _calc, _init
+    from .calc_dists_between_locs import calc_dists_between_locs
+    from .ll2xyz import ll2xyz
+
+    # **************************************************************************
+
+    # Flatten the arrays ...
+    shape = numpy.shape(lons)
+    lons = numpy.asarray(lons, dtype = numpy.float64).flatten()                 # [°]
+    lats = numpy.asarray(lats, dtype = numpy.float64).flatten()                 # [°]
+    coastLons = numpy.asarray(coastLons, dtype = numpy.float64).flatten()       # [°]
+    coastLats = numpy.asarray(coastLats, dtype = numpy.float64).flatten()       # [°]
+
+    # Check if the user wants to use more than one process ...
+    if workers > 1 and lons.size > 1:
+        # Create short-hand ...
+        nBlock = max(1, (lons.size + 4 * workers - 1) // (4 * workers))         # [#]
+
+        if debug:
+            print(f"INFO: Calculating the distances from {lons.size:,d} locations to {coastLons.size:,d} coordinates using {workers:,d} processes in blocks of up to {nBlock:,d} locations ...")
+
+        # Create a pool of workers which all have their own copy of the coast
+        # and calculate the distances from each block of locations ...
+        with concurrent.futures.ProcessPoolExecutor(
+            initializer = functools.partial(
+                _init,
+                 backend = backend,
+                     eps = eps,
+                   nIter = nIter,
+                ramLimit = max(1, ramLimit // workers),
+                 useTree = tree is not None,
+            ),
+               initargs = (coastLons, coastLats),
+            max_workers = workers,
+             mp_context = multiprocessing.get_context("spawn"),
+        ) as pool:
+            dists = numpy.concatenate(
+                list(
+                    pool.map(
+                        _calc,
+                        [lons[i:i + nBlock] for i in range(0, lons.size, nBlock)],
+                        [lats[i:i + nBlock] for i in range(0, lats.size, nBlock)],
+                    )
+                )
+            )                                                                   # [m]
+
+        # Return answer ...
+        return dists.reshape(shape)
+
+    # Set a silly initial minimum ...
+    dists = numpy.full(lons.size, 2.0 * pyguymer3.CIRCUMFERENCE_OF_EARTH, dtype = numpy.float64)   # [m]
+
+    # Find out how many pairs of coordinates can be calculated at once ...
+    nPair = max(1, ramLimit // (32 * 8))                                        # [#]
+
+    # Create short-hands ...
+    # NOTE: "exact" is the backend to use when the "Hybrid" backend needs
+    #       exact distances, "err" is the (generous) maximum fractional
+    #       difference between the "AndoyerLambert" distance and the Geodesic
+    #       distance for distances up to "screenMax" (the largest difference
+    #       measured was 1.41e-6) and "tol" is therefore the maximum fractional
+    #       difference between two "AndoyerLambert" distances when the Geodesic
+    #       distances are in the opposite order.
+    exact = "Vincenty" if backend == "Hybrid" else backend
+    err = 1.0e-5
+    screenMax = 1.0e7                                                           # [m]
+    tol = 2.0 * err / (1.0 - err)
+
+    # Check if a KD-tree was provided ...
+    if tree is None:
+        # Create short-hands ...
+        nChunk = max(1, min(coastLons.size, nPair))                             # [#]
+        nBlock = max(1, nPair // nChunk)                                        # [#]
+        nBlocks = (lons.size + nBlock - 1) // nBlock                            # [#]
+
+        if debug:
+            print(f"INFO: Calculating the distances from {lons.size:,d} locations to {coastLons.size:,d} coordinates in {nBlocks:,d} blocks of up to {nBlock:,d} locations ...")
+
+        # Loop over blocks of locations ...
+        for iBlock in range(nBlocks):
+            if debug:
+                print(f"INFO: Calculating block {iBlock + 1:,d} of {nBlocks:,d} ...")
+
+            # Create short-hand ...
+            block = slice(iBlock * nBlock, min(lons.size, (iBlock + 1) * nBlock))
+
+            # Initialize lists ...
+            owner = []
+            cands = []
+            screens = []
+
+            # Loop over chunks of coordinates ...
+            for iChunk in range(0, coastLons.size, nChunk):
+                # Create short-hand ...
+                chunk = slice(iChunk, min(coastLons.size, iChunk + nChunk))
+
+                # Find distances between the locations and the coordinates and
+                # replace the current minimums if required ...
+                tmp = calc_dists_between_locs(
+                    lons[block].reshape(-1, 1),
+                    lats[block].reshape(-1, 1),
+                    coastLons[chunk].reshape(1, -1),
+                    coastLats[chunk].reshape(1, -1),
+                    backend = "AndoyerLambert" if backend == "Hybrid" else backend,
+                        eps = eps,
+                      nIter = nIter,
+                )                                                               # [m]
+                dists[block] = numpy.minimum(dists[block], tmp.min(axis = 1))   # [m]
+
+                # Skip this chunk if the exact distances are not needed ...
+                if backend != "Hybrid":
+                    continue
+
+                # Find the coordinates which could possibly be the nearest
+                # (given the current minimums, which only ever get smaller) ...
+                iOwner, iCand = numpy.nonzero(tmp <= (1.0 + tol) * dists[block].reshape(-1, 1))
+                owner.append(iOwner + block.start)
+                cands.append(iCand + chunk.start)
+                screens.append(tmp[iOwner, iCand])                              # [m]
+                del tmp, iOwner, iCand
+
+            # Skip this block if the exact distances are not needed ...
+            if backend != "Hybrid":
+                continue
+
+            # Remove the candidates which cannot be the nearest (given the final
+            # minimums) ...
+            owner = numpy.concatenate(owner)
+            cands = numpy.concatenate(cands)
+            screens = numpy.concatenate(screens)                                # [m]
+            keep = screens <= (1.0 + tol) * dists[owner]
+            owner = owner[keep]
+            cands = cands[keep]
+            del screens, keep
+
+            # Find the locations which might be too far from the coast for the
+            # "AndoyerLambert" distances to be trusted ...
+            far = numpy.nonzero((1.0 + tol) * dists[block] > screenMax)[0] + block.start
+
+            # Find the exact distances to the candidates and replace the
+            # approximate minimums ...
+            dists[block] = 2.0 * pyguymer3.CIRCUMFERENCE_OF_EARTH               # [m]
+            for iChunk in range(0, cands.size, nPair):
+                # Create short-hand ...
+                chunk = slice(iChunk, min(cands.size, iChunk + nPair))
+
+                # Find distances between the locations and the candidates and
+                # replace the current minimums if required ...
+                numpy.minimum.at(
+                    dists,
+                    owner[chunk],
+                    calc_dists_between_locs(
+                        lons[owner[chunk]],
+                        lats[owner[chunk]],
+                        coastLons[cands[chunk]],
+                        coastLats[cands[chunk]],
+                        backend = exact,
+                            eps = eps,
+                          nIter = nIter,
+                    ),
+                )                                                               # [m]
+            del owner, cands
+
+            # Loop over the locations which might be too far from the coast ...
+            for iLoc in far:
+                # Loop over chunks of coordinates ...
+                for iChunk in range(0, coastLons.size, nPair):
+                    # Create short-hand ...
+                    chunk = slice(iChunk, min(coastLons.size, iChunk + nPair))
+
+                    # Find distances between the location and the coordinates
+                    # and replace the current minimum if required ...
+                    dists[iLoc] = min(
+                        dists[iLoc],
+                        calc_dists_between_locs(
+                            numpy.full(chunk.stop - chunk.start, lons[iLoc]),
+                            numpy.full(chunk.stop - chunk.start, lats[iLoc]),
+                            coastLons[chunk],
+                            coastLats[chunk],
+                            backend = exact,
+                                eps = eps,
+                              nIter = nIter,
+                        ).min(),
+                    )                                                           # [m]
+            del far
+    else:
+        # Create short-hands ...
+        # NOTE: "radius" is the mean radius of the Earth and "ratio" is the
+        #       (generous) maximum ratio of the great-circle distance on the
+        #       sphere to the Geodesic distance on the WGS84 ellipsoid.
+        nNear = min(8, coastLons.size)                                          # [#]
+        nChunk = nPair                                                          # [#]
+        nBlock = max(1, nPair // 256)                                           # [#]
+        nBlocks = (lons.size + nBlock - 1) // nBlock                            # [#]
+        radius = 6371008.8                                                      # [m]
+        ratio = 1.01
+
+        if debug:
+            print(f"INFO: Calculating the distances from {lons.size:,d} locations to {coastLons.size:,d} coordinates (using a KD-tree) in {nBlocks:,d} blocks of up to {nBlock:,d} locations ...")
+
+        # Loop over blocks of locations ...
+        for iBlock in range(nBlocks):
+            if debug:
+                print(f"INFO: Calculating block {iBlock + 1:,d} of {nBlocks:,d} ...")
+
+            # Create short-hands ...
+            block = slice(iBlock * nBlock, min(lons.size, (iBlock + 1) * nBlock))
+            xyz = ll2xyz(lons[block], lats[block])
+
+            # Find the nearest coordinates on the sphere and the minimum
+            # Geodesic distance to them (which is an upper bound) ...
+            _, near = tree.query(xyz, k = nNear)
+            near = near.reshape(-1, nNear)
+            upper = calc_dists_between_locs(
+                lons[block].reshape(-1, 1),
+                lats[block].reshape(-1, 1),
+                coastLons[near],
+                coastLats[near],
+                backend = exact,
+                    eps = eps,
+                  nIter = nIter,
+            ).min(axis = 1)                                                     # [m]
+            del near
+
+            # Find all of the coordinates which could possibly be nearer than
+            # the upper bound ...
+            chord = 2.0 * numpy.sin(0.5 * numpy.minimum(numpy.pi, ratio * upper / radius))
+            cands = tree.query_ball_point(xyz, chord)
+            del xyz, chord
+
+            # Flatten the lists of candidates ...
+            owner = numpy.repeat(
+                numpy.arange(upper.size),
+                numpy.fromiter((len(cand) for cand in cands), dtype = numpy.int64, count = upper.size),
+            )
+            cands = numpy.fromiter((i for cand in cands for i in cand), dtype = numpy.int64, count = owner.size)
+            owner += block.start
+
+            # Loop over chunks of candidates ...
+            for iChunk in range(0, cands.size, nChunk):
+                # Create short-hand ...
+                chunk = slice(iChunk, min(cands.size, iChunk + nChunk))
+
+                # Find distances between the locations and the candidates and
+                # replace the current minimums if required ...
+                numpy.minimum.at(
+                    dists,
+                    owner[chunk],
+                    calc_dists_between_locs(
+                        lons[owner[chunk]],
+                        lats[owner[chunk]],
+                        coastLons[cands[chunk]],
+                        coastLats[cands[chunk]],
+                        backend = exact,
+                            eps = eps,
+                          nIter = nIter,
+                    ),
+                )                                                               # [m]
+            del owner, cands
+
+            # Replace the current minimums if required ...
+            dists[block] = numpy.minimum(dists[block], upper)                   # [m]
+
+    # Return answer ...
+    return dists.reshape(shape)
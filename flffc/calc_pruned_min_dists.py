@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def calc_pruned_min_dists(
+    lons,
+    lats,
+    coastLons,
+    coastLats,
+    /,
+    *,
+     backend = "Vincenty",
+       debug = __debug__,
+         eps = 1.0e-12,
+       nIter = 100,
+    ramLimit = 1073741824,
+        tree = None,
+):
+    """Calculate the distances from lots of locations to the coast (pruning
+    the locations which cannot be the furthest from the coast)
+
+    This function reads in arrays of locations (in degrees) and arrays of the
+    coordinates of the coast (in degrees) and calculates the Geodesic distance
+    (in metres) from each location to the nearest coordinate of the coast, but
+    it stops working on a location as soon as it is certain that it is not the
+    location which is the furthest from the coast.
+
+    Parameters
+    ----------
+    lons : numpy.ndarray
+        the longitudes of the locations (in degrees)
+    lats : numpy.ndarray
+        the latitudes of the locations (in degrees)
+    coastLons : numpy.ndarray
+        the longitudes of the coast (in degrees)
+    coastLats : numpy.ndarray
+        the latitudes of the coast (in degrees)
+    backend : str, optional
+        the formula to use ("Haversine", "AndoyerLambert", "Vincenty",
+        "Karney" or "Hybrid"), see :func:`flffc.calc_dists_between_locs`
+    debug : bool, optional
+        print debug messages
+    eps : float, optional
+        the tolerance of the Vincenty formula iterations
+    nIter : int, optional
+        the maximum number of iterations (particularly the Vincenty formula)
+    ramLimit : int, optional
+        the maximum RAM usage of each "large" array (in bytes)
+    tree : scipy.spatial.KDTree, optional
+        the KD-tree of the coast (as made by :func:`flffc.make_coast_tree`), if
+        it is not provided then one is made
+
+    Returns
+    -------
+    dists : numpy.ndarray
+        the distances from each location to the coast (in metres), which are
+        only upper bounds for the locations which were pruned
+
+    Notes
+    -----
+    The coordinates of the coast are put into a KD-tree, which is used to find
+    the "nNear" nearest coordinates on a sphere (of the mean radius of the
+    Earth) to every location. The locations are then visited in order, starting
+    with the one which is the furthest from the coast on the sphere, and the
+    best distance so far is kept.
+
+    For each location, the Geodesic distances to its "nNear" nearest
+    coordinates on the sphere are calculated first and their minimum is an
+    upper bound on the answer. If it is less than the best distance so far then
+    the location is pruned straight away. Otherwise, the other coordinates
+    which could possibly be nearer (those within a sphere-distance of 1% more
+    than the upper bound, see :func:`flffc.calc_min_dists`) are found using the
+    KD-tree and the Geodesic distances to them are calculated in batches,
+    nearest first, and the location is pruned as soon as its running minimum is
+    less than the best distance so far.
+
+    The distances of the locations which are not pruned are exactly the same
+    as from :func:`flffc.calc_min_dists`, so the location with the largest
+    distance is too. The "Hybrid" backend is the same as the "Vincenty"
+    backend, as only a few candidates are compared with each location anyway.
+    The distances of the locations which are pruned are the running minimums
+    when they were pruned, which are all less than the largest distance.
+
+    The locations are visited one at a time, as the best distance so far
+    depends on all of the locations which were visited before, so this
+    function cannot spread the locations across a pool of processes.
+
+    Copyright 2017 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FLFFC, https://github.com/Guymer/flffc
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .calc_dists_between_locs import calc_dists_between_locs
+    from .ll2xyz import ll2xyz
+    from .make_coast_tree import make_coast_tree
+
+    # **************************************************************************
+
+    # Flatten the arrays ...
+    shape = numpy.shape(lons)
+    lons = numpy.asarray(lons, dtype = numpy.float64).flatten()                 # [°]
+    lats = numpy.asarray(lats, dtype = numpy.float64).flatten()                 # [°]
+    coastLons = numpy.asarray(coastLons, dtype = numpy.float64).flatten()       # [°]
+    coastLats = numpy.asarray(coastLats, dtype = numpy.float64).flatten()       # [°]
+
+    # Make a KD-tree of the coast (if one was not provided) ...
+    if tree is None:
+        tree = make_coast_tree(coastLons, coastLats)
+
+    # Create short-hands ...
+    # NOTE: "radius" is the mean radius of the Earth and "ratio" is the
+    #       (generous) maximum ratio of the great-circle distance on the
+    #       sphere to the Geodesic distance on the WGS84 ellipsoid.
+    exact = "Vincenty" if backend == "Hybrid" else backend
+    nNear = min(8, coastLons.size)                                              # [#]
+    radius = 6371008.8                                                          # [m]
+    ratio = 1.01
+
+    # Find the "nNear" nearest coordinates on the sphere (and the distance to
+    # the nearest one) for each location ...
+    xyz = ll2xyz(lons, lats)
+    chords, near = tree.query(xyz, k = nNear)
+    near = near.reshape(-1, nNear)
+    sphDists = chords.reshape(-1, nNear)[:, 0]
+    del chords
+
+    # Find the minimum Geodesic distance to the nearest coordinates on the
+    # sphere for each location (which is an upper bound) ...
+    # NOTE: The Vincenty formula uses about 32 temporary arrays, each the size
+    #       of the array of distances.
+    uppers = numpy.zeros(lons.size, dtype = numpy.float64)                      # [m]
+    nBlock = max(1, ramLimit // (32 * 8 * nNear))                               # [#]
+    for iBlock in range(0, lons.size, nBlock):
+        # Create short-hand ...
+        block = slice(iBlock, min(lons.size, iBlock + nBlock))
+
+        # Find the upper bounds ...
+        uppers[block] = calc_dists_between_locs(
+            lons[block].reshape(-1, 1),
+            lats[block].reshape(-1, 1),
+            coastLons[near[block, :]],
+            coastLats[near[block, :]],
+            backend = exact,
+                eps = eps,
+              nIter = nIter,
+        ).min(axis = 1)                                                         # [m]
+    del near
+
+    # Initialize the answers and the best distance so far ...
+    dists = numpy.zeros(lons.size, dtype = numpy.float64)                       # [m]
+    bestDist = -1.0                                                             # [m]
+    nPruned = 0                                                                 # [#]
+
+    # Loop over locations (furthest from the coast on the sphere first) ...
+    for i in numpy.argsort(-sphDists, kind = "stable"):
+        # Create short-hand ...
+        upper = float(uppers[i])                                                # [m]
+
+        # Prune this location if it cannot be the furthest from the coast ...
+        if upper < bestDist:
+            dists[i] = upper                                                    # [m]
+            nPruned += 1                                                        # [#]
+            continue
+
+        # Find all of the coordinates which could possibly be nearer than the
+        # upper bound and put them in order (nearest first) ...
+        cands = numpy.array(
+            tree.query_ball_point(
+                xyz[i, :],
+                2.0 * numpy.sin(0.5 * min(numpy.pi, ratio * upper / radius)),
+            ),
+            dtype = numpy.int64,
+        )
+        cands = cands[numpy.argsort(numpy.linalg.norm(tree.data[cands, :] - xyz[i, :], axis = 1), kind = "stable")]
+
+        # Loop over batches of candidates (which get larger each time) ...
+        iCand = 0                                                               # [#]
+        nCand = nNear                                                           # [#]
+        while iCand < cands.size:
+            # Find the distances to this batch of candidates and replace the
+            # running minimum if required ...
+            batch = cands[iCand:iCand + nCand]
+            upper = min(
+                upper,
+                float(
+                    calc_dists_between_locs(
+                        lons[i],
+                        lats[i],
+                        coastLons[batch],
+                        coastLats[batch],
+                        backend = exact,
+                            eps = eps,
+                          nIter = nIter,
+                    ).min()
+                ),
+            )                                                                   # [m]
+            iCand += nCand                                                      # [#]
+            nCand *= 2                                                          # [#]
+
+            # Stop if this location cannot be the furthest from the coast ...
+            if upper < bestDist:
+                break
+
+        # Save the answer and replace the best distance so far if required ...
+        dists[i] = upper                                                        # [m]
+        if upper < bestDist:
+            nPruned += 1                                                        # [#]
+        else:
+            bestDist = upper                                                    # [m]
+
+    if debug:
+        print(f"INFO: {nPruned:,d} of the {lons.size:,d} locations were pruned.")
+
+    # Return answer ...
+    return dists.reshape(shape)
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def compute(
+    country,
+    /,
+    *,
+      backend = "Vincenty",
+     cacheDir = "~/.cache/flffc",
+    cacheSize = 1073741824,
+      cascade = False,
+         conv = 1000.0,
+        debug = __debug__,
+      density = 1.0,
+        dtype = "float64",
+          eps = 1.0e-12,
+       method = "UniformGrid",
+        nIter = 100,
+    onlyValid = False,
+        prune = False,
+      profile = False,
+     ramLimit = 1073741824,
+       repair = False,
+        steps = 50,
+    useKDTree = False,
+      workers = 1,
+):
+    """Find the location furthest from the coast in a country
+
+    This function loads a country from the on-disk cache of the Natural Earth
+    countries and finds the location within it which is the furthest from the
+    coast. It does not import any plotting modules, see :func:`flffc.plot` for
+    how to draw the answer. If the same country has already been done with the
+    same parameters (and the same Natural Earth Shapefile) then the answer is
+    loaded from the on-disk cache of results instead.
+
+    Parameters
+    ----------
+    country : str
+        the name of the country
+    backend : str, optional
+        the formula to use for the distances ("Haversine", "AndoyerLambert",
+        "Vincenty", "Karney" or "Hybrid"), see
+        :func:`flffc.calc_dists_between_locs` and :func:`flffc.calc_min_dists`
+    cacheDir : str, optional
+        the directory to store the cache in
+    cacheSize : int, optional
+        the maximum size of the cache of results (in bytes), if it is zero then
+        results are neither loaded from nor saved to the cache
+    cascade : bool, optional
+        use the coasts of the country in the 110m and 50m Natural Earth
+        Shapefiles to discard the sampled locations which cannot be the
+        furthest from the coast before using the coast in the 10m Natural Earth
+        Shapefile, see :func:`flffc.calc_cascade_min_dists`
+    conv : float, optional
+        the distance that defines the branch-and-bound search as being
+        converged (in metres)
+    debug : bool, optional
+        print debug messages
+    density : float, optional
+        the number of locations per 1,000 km² in the Fibonacci lattice
+    dtype : str, optional
+        the type of the arrays of the sampled locations and their distances
+        which are returned and cached ("float64" or "float32")
+    eps : float, optional
+        the tolerance of the Vincenty formula iterations
+    method : str, optional
+        the method for finding the location ("UniformGrid", "PolygonGrid",
+        "FibonacciLattice" or "BranchAndBound")
+    nIter : int, optional
+        the maximum number of iterations (particularly the Vincenty formula)
+    onlyValid : bool, optional
+        only return valid Polygons (checks for validity can take a while, if
+        being called often)
+    prune : bool, optional
+        stop calculating the distance from a sampled location to the coast as
+        soon as it cannot be the furthest from the coast (the distances of the
+        pruned locations are then only upper bounds)
+    profile : bool, optional
+        record how long each phase takes, how much memory it uses and how many
+        distances are calculated (see the notes below)
+    ramLimit : int, optional
+        the maximum RAM usage of each "large" array (in bytes)
+    repair : bool, optional
+        attempt to repair invalid Polygons
+    steps : int, optional
+        the number of longitudes and latitudes in the uniform grid
+    useKDTree : bool, optional
+        use a KD-tree to find the nearest coordinates of the coast
+    workers : int, optional
+        the number of processes to spread the uniform grid across (which cannot
+        be more than 1 if "prune" is True)
+
+    Returns
+    -------
+    result : dict, None
+        the answer (or None if the country is not in the Natural Earth
+        Shapefile), with the following keys:
+
+        * "bestDist" - the distance from the location furthest from the coast
+          to the coast (in metres);
+        * "bestLat" - the latitude of the location furthest from the coast (in
+          degrees);
+        * "bestLon" - the longitude of the location furthest from the coast (in
+          degrees);
+        * "bounds" - the bounding box of the (repaired) Polygons of the country
+          (in degrees);
+        * "cached" - whether the answer was loaded from the cache of results;
+        * "country" - the name of the country;
+        * "dists" - the distances from the sampled locations to the coast (in
+          metres);
+        * "key" - the key of the answer in the cache of results (see
+          :func:`flffc.make_result_key`);
+        * "lats" - the latitudes of the sampled locations (in degrees);
+        * "lons" - the longitudes of the sampled locations (in degrees);
+        * "method" - the method used to find the location;
+        * "middle" - the middle of the sampled locations and the furthest
+          distance from it to any of them (in degrees, degrees and metres), if
+          it has been found by :func:`flffc.plot`, or None;
+        * "middleFrom" - the set of sampled locations which the middle was
+          found from ("all" or "hull"), or None;
+        * "profile" - the profile of each phase (if requested), or None;
+        * "steps" - the number of longitudes and latitudes in the uniform
+          grid; and
+        * "timings" - how long it took to load the country and to find the
+          location (in seconds).
+
+    Notes
+    -----
+    The distances are always calculated using 64-bit floats, "dtype" only sets
+    how the arrays are stored afterwards. The 32-bit floats halve the memory
+    and the size of the cache of results (and are still accurate to within
+    about 2 m), but "bestDist", "bestLat" and "bestLon" are always 64-bit.
+
+    If "method" is "UniformGrid" then :func:`flffc.make_grid` puts the sampled
+    locations back onto the grid, as a masked 2-D array.
+
+    If "profile" is True then the wall time, the CPU time, how much the peak RSS
+    of the process went up by and the peak memory traced by :mod:`tracemalloc`
+    are recorded for each phase ("shapefile scan", "polygon extraction", "land
+    mask" and "distance kernel"), along with how many times each phase ran and
+    how many distances were calculated by :func:`flffc.calc_dists_between_locs`.
+    The peak RSS of a process never goes down, so a phase which does not need
+    more memory than the phases before it records an increase of zero. The
+    profile carries on in :func:`flffc.plot`, which saves it as a JSON file next
+    to the PNG. Tracing memory slows everything down, and anything done by other
+    processes (if "workers" is more than 1) is not recorded.
+
+    Copyright 2017 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FLFFC, https://github.com/Guymer/flffc
+    """
+
+    # Import standard modules ...
+    import time
+
+    # Import sub-functions ...
+    from ._profile import _start, _stop
+    from .find_furthest import find_furthest
+    from .load_countries import load_countries
+    from .load_country import load_country
+    from .load_result import load_result
+    from .make_result_key import make_result_key
+    from .save_result import save_result
+
+    # **************************************************************************
+
+    # Start timer ...
+    start = time.perf_counter()                                                 # [s]
+
+    # Stop any profile which was left running (for example, by an exception)
+    # and start a new one (if requested) ...
+    _stop()
+    if profile:
+        _start()
+
+    # Check what type the user wants ...
+    match dtype:
+        case "float32" | "float64":
+            pass
+        case _:
+            # Crash ...
+            raise ValueError(f"\"dtype\" is an unexpected value ({repr(dtype)})") from None
+
+    # Check that the user has not asked to prune the locations and to spread
+    # them across a pool of processes (the locations are pruned one at a time)
+    # ...
+    if prune and workers > 1:
+        raise ValueError(f"\"prune\" cannot be used with more than one worker ({workers:,d} were requested)") from None
+
+    # Load the index of the cache of countries and skip if the country is
+    # missing ...
+    _, index, sha256 = load_countries(
+          cacheDir = cacheDir,
+             debug = debug,
+         onlyValid = onlyValid,
+            repair = repair,
+        resolution = "10m",
+    )
+    if country not in index:
+        print(f"WARNING: \"{country}\" is not a country in the 10m Natural Earth Shapefile.")
+        _stop()
+        return None
+
+    # Make the key of the answer in the cache of results ...
+    key = make_result_key(
+        country,
+        sha256,
+          backend = backend,
+          cascade = cascade,
+             conv = conv,
+          density = density,
+            dtype = dtype,
+              eps = eps,
+           method = method,
+            nIter = nIter,
+        onlyValid = onlyValid,
+            prune = prune,
+           repair = repair,
+            steps = steps,
+    )
+
+    # Return the answer from the cache of results (if it is there) ...
+    if cacheSize > 0:
+        result = load_result(key, cacheDir = cacheDir)
+        if result is not None:
+            if debug:
+                print(f"INFO: Loaded the answer for {country} from the cache of results.")
+            result["cached"] = True
+            result["profile"] = _stop() if profile else None
+            result["timings"] = {
+                "find [s]" : 0.0,
+                "load [s]" : time.perf_counter() - start,
+            }
+            return result
+
+    # Load the (repaired) Polygons and the coordinates of the coast ...
+    polys, coastLons, coastLats = load_country(
+        country,
+          cacheDir = cacheDir,
+             debug = debug,
+         onlyValid = onlyValid,
+            repair = repair,
+        resolution = "10m",
+    )                                                                           # [°], [°]
+
+    # Load the coordinates of the coarser coasts (if requested) ...
+    coarseCoasts = []
+    if cascade and method != "BranchAndBound":
+        for resolution in ["110m", "50m"]:
+            # Load the index of the cache of countries and skip if the country
+            # is missing ...
+            _, coarseIndex, _ = load_countries(
+                  cacheDir = cacheDir,
+                     debug = debug,
+                 onlyValid = onlyValid,
+                    repair = repair,
+                resolution = resolution,
+            )
+            if country not in coarseIndex:
+                if debug:
+                    print(f"INFO: \"{country}\" is not a country in the {resolution} Natural Earth Shapefile.")
+                continue
+
+            # Load the coordinates of the coarser coast ...
+            _, cLons, cLats = load_country(
+                country,
+                  cacheDir = cacheDir,
+                     debug = debug,
+                 onlyValid = onlyValid,
+                    repair = repair,
+                resolution = resolution,
+            )                                                                   # [°], [°]
+            coarseCoasts.append((cLons, cLats))
+
+    # Stop timer and start another one ...
+    stop = time.perf_counter()                                                  # [s]
+    loadTime = stop - start                                                     # [s]
+    start = stop                                                                # [s]
+
+    # Find the location furthest from the coast and the distance from each
+    # sampled point to the coast ...
+    bestLon, bestLat, bestDist, lons, lats, dists = find_furthest(
+        polys,
+             backend = backend,
+        coarseCoasts = coarseCoasts,
+           coastLats = coastLats,
+           coastLons = coastLons,
+                conv = conv,
+               debug = debug,
+             density = density,
+                 eps = eps,
+              method = method,
+               nIter = nIter,
+           onlyValid = onlyValid,
+               prune = prune,
+            ramLimit = ramLimit,
+              repair = repair,
+               steps = steps,
+           useKDTree = useKDTree,
+             workers = workers,
+    )                                                                           # [°], [°], [m], [°], [°], [m]
+
+    # Stop timer ...
+    findTime = time.perf_counter() - start                                      # [s]
+
+    # Convert the arrays to the requested type (without copying them if they
+    # are already that type) ...
+    dists = dists.astype(dtype, copy = False)                                   # [m]
+    lats = lats.astype(dtype, copy = False)                                     # [°]
+    lons = lons.astype(dtype, copy = False)                                     # [°]
+
+    # Create answer ...
+    result = {
+          "bestDist" : bestDist,
+           "bestLat" : bestLat,
+           "bestLon" : bestLon,
+            "bounds" : tuple(polys.bounds),
+            "cached" : False,
+           "country" : country,
+             "dists" : dists,
+               "key" : key,
+              "lats" : lats,
+              "lons" : lons,
+            "method" : method,
+            "middle" : None,
+        "middleFrom" : None,
+           "profile" : _stop() if profile else None,
+             "steps" : steps,
+           "timings" : {
+            "find [s]" : findTime,
+            "load [s]" : loadTime,
+        },
+    }
+
+    # Save the answer to the cache of results ...
+    if cacheSize > 0:
+        save_result(
+            result,
+             cacheDir = cacheDir,
+            cacheSize = cacheSize,
+        )
+
+    # Return answer ...
+    return result
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def extract_coast(
+    geom,
+    /,
+    *,
+    onlyValid = False,
+       repair = False,
+):
+    """Extract the coordinates of the coast of a country
+
+    This function accepts any Shapely geometry and returns flat arrays of the
+    longitudes and latitudes of all of the coordinates in the exterior rings of
+    all of the Polygons contained within.
+
+    Parameters
+    ----------
+    geom : shapely.geometry.polygon.Polygon, shapely.geometry.multipolygon.MultiPolygon
+        the Shapely geometry of the country
+    onlyValid : bool, optional
+        only return valid Polygons (checks for validity can take a while, if
+        being called often)
+    repair : bool, optional
+        attempt to repair invalid Polygons
+
+    Returns
+    -------
+    coastLons : numpy.ndarray
+        the longitudes of the coast (in degrees)
+    coastLats : numpy.ndarray
+        the latitudes of the coast (in degrees)
+
+    Notes
+    -----
+    Copyright 2017 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FLFFC, https://github.com/Guymer/flffc
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+        import pyguymer3.geo
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # **************************************************************************
+
+    # Initialize list ...
+    coords = [numpy.zeros((0, 2), dtype = numpy.float64)]
+
+    # Loop over Polygons ...
+    for poly in pyguymer3.geo.extract_polys(
+        geom,
+        onlyValid = onlyValid,
+           repair = repair,
+    ):
+        # Append coordinates in exterior ring to list ...
+        coords.append(numpy.array(poly.exterior.coords, dtype = numpy.float64)[:, :2])
+
+    # Convert list to array ...
+    coords = numpy.concatenate(coords)                                          # [°]
+
+    # Return answer ...
+    return coords[:, 0].copy(), coords[:, 1].copy()
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def find_furthest(
+    geom,
+    /,
+    *,
+         backend = "Vincenty",
+    coarseCoasts = None,
+       coastLats = None,
+       coastLons = None,
+            conv = 1000.0,
+           debug = __debug__,
+         density = 1.0,
+             eps = 1.0e-12,
+          method = "UniformGrid",
+           nIter = 100,
+       onlyValid = False,
+           prune = False,
+        ramLimit = 1073741824,
+          repair = False,
+           steps = 50,
+       useKDTree = False,
+         workers = 1,
+):
+    """Find the location furthest from the coast in a geometry
+
+    This function finds the location within the geometry which is the furthest
+    from the coast (the exterior rings of the Polygons in the geometry), either
+    by sampling a uniform grid of longitudes and latitudes (across the whole
+    geometry or across each Polygon in the geometry), by sampling an equal-area
+    lattice or by performing a branch-and-bound search.
+
+    Parameters
+    ----------
+    geom : shapely.geometry.polygon.Polygon, shapely.geometry.multipolygon.MultiPolygon
+        the Shapely geometry of the country
+    backend : str, optional
+        the formula to use for the distances ("Haversine", "AndoyerLambert",
+        "Vincenty", "Karney" or "Hybrid"), see
+        :func:`flffc.calc_dists_between_locs` and :func:`flffc.calc_min_dists`
+    coarseCoasts : list of tuple of numpy.ndarray, optional
+        the longitudes and latitudes of coarser versions of the coast (in
+        degrees), with the coarsest first, if provided then they are used to
+        discard the sampled locations which cannot be the furthest from the
+        coast, see :func:`flffc.calc_cascade_min_dists`
+    coastLats : numpy.ndarray, optional
+        the latitudes of the coast (in degrees), if not provided then they are
+        extracted from the geometry
+    coastLons : numpy.ndarray, optional
+        the longitudes of the coast (in degrees), if not provided then they are
+        extracted from the geometry
+    conv : float, optional
+        the distance that defines the branch-and-bound search as being
+        converged (in metres)
+    debug : bool, optional
+        print debug messages
+    density : float, optional
+        the number of locations per 1,000 km² in the Fibonacci lattice
+    eps : float, optional
+        the tolerance of the Vincenty formula iterations
+    method : str, optional
+        the method for finding the location ("UniformGrid", "PolygonGrid",
+        "FibonacciLattice" or "BranchAndBound")
+    nIter : int, optional
+        the maximum number of iterations (particularly the Vincenty formula)
+    onlyValid : bool, optional
+        only return valid Polygons (checks for validity can take a while, if
+        being called often)
+    prune : bool, optional
+        stop calculating the distance from a sampled location to the coast as
+        soon as it cannot be the furthest from the coast (the distances of the
+        pruned locations are then only upper bounds)
+    ramLimit : int, optional
+        the maximum RAM usage of each "large" array (in bytes)
+    repair : bool, optional
+        attempt to repair invalid Polygons
+    steps : int, optional
+        the number of longitudes and latitudes in the uniform grid (for
+        "PolygonGrid", "steps" × "steps" is the number of locations which are
+        shared between the Polygons)
+    useKDTree : bool, optional
+        use a KD-tree to find the nearest coordinates of the coast
+    workers : int, optional
+        the number of processes to spread the uniform grid across (which cannot
+        be more than 1 if "prune" is True)
+
+    Returns
+    -------
+    bestLon : float
+        the longitude of the location furthest from the coast (in degrees)
+    bestLat : float
+        the latitude of the location furthest from the coast (in degrees)
+    bestDist : float
+        the distance from the location furthest from the coast to the coast (in
+        metres)
+    lons : numpy.ndarray
+        the longitudes of the sampled locations which are within the geometry
+        (in degrees)
+    lats : numpy.ndarray
+        the latitudes of the sampled locations which are within the geometry
+        (in degrees)
+    dists : numpy.ndarray
+        the distances from the sampled locations which are within the geometry
+        to the coast (in metres)
+
+    Notes
+    -----
+    If the "PolygonGrid" method is requested then the coordinates of the coast
+    which are where Natural Earth has split the Polygons of countries which
+    cross the anti-meridian (such as Russia and Fiji) are ignored, as they are
+    not where the actual coast is. The coordinates where the actual coast
+    crosses the anti-meridian are kept. The other methods use every coordinate
+    of the coast, as they always have.
+
+    The "BranchAndBound" method does not use the coarser coasts, as it already
+    discards the parts of the geometry which cannot contain the answer.
+
+    Copyright 2017 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FLFFC, https://github.com/Guymer/flffc
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from ._antimeridian import _off_antimeridian
+    from ._profile import _phase
+    from .branch_and_bound import branch_and_bound
+    from .calc_cascade_min_dists import calc_cascade_min_dists
+    from .calc_min_dists import calc_min_dists
+    from .calc_pruned_min_dists import calc_pruned_min_dists
+    from .extract_coast import extract_coast
+    from .fibonacci_lattice import fibonacci_lattice
+    from .land_mask import land_mask
+    from .make_coast_tree import make_coast_tree
+    from .polygon_grid import polygon_grid
+
+    # **************************************************************************
+
+    # Check that the user has not asked to prune the locations and to spread
+    # them across a pool of processes (the locations are pruned one at a time)
+    # ...
+    if prune and workers > 1:
+        raise ValueError(f"\"prune\" cannot be used with more than one worker ({workers:,d} were requested)") from None
+
+    # Find extent of the country ...
+    lon_min, lat_min, lon_max, lat_max = geom.bounds                            # [°], [°], [°], [°]
+
+    # Extract the coordinates of the coast (once) if they were not provided ...
+    if coastLons is None or coastLats is None:
+        coastLons, coastLats = extract_coast(
+            geom,
+            onlyValid = onlyValid,
+               repair = repair,
+        )                                                                       # [°], [°]
+
+    # Check if the user wants a grid for each Polygon ...
+    if method == "PolygonGrid":
+        # Remove the coordinates of the coast which are where Natural Earth has
+        # split the Polygons on the anti-meridian ...
+        keep = _off_antimeridian(coastLons)
+        coastLons = coastLons[keep]                                             # [°]
+        coastLats = coastLats[keep]                                             # [°]
+        del keep
+
+        # Remove the coordinates of the coarser coasts which are where Natural
+        # Earth has split the Polygons on the anti-meridian too ...
+        if coarseCoasts is not None:
+            keeps = [_off_antimeridian(cLons) for cLons, _ in coarseCoasts]
+            coarseCoasts = [
+                (cLons[keep], cLats[keep])
+                for (cLons, cLats), keep in zip(coarseCoasts, keeps, strict = True)
+            ]
+            del keeps
+
+    if debug:
+        print(f"INFO: The coast has {coastLons.size:,d} coordinates.")
+
+    # Make a KD-tree of the coast (if requested) ...
+    tree = make_coast_tree(coastLons, coastLats) if useKDTree else None
+
+    # Check what method the user wants ...
+    match method:
+        case "UniformGrid":
+            # Make longitude and latitude grid ...
+            xcoords = numpy.linspace(lon_min, lon_max, num = steps)             # [°]
+            ycoords = numpy.linspace(lat_min, lat_max, num = steps)             # [°]
+
+            # Find out which points on the grid are within the geometry ...
+            xgrid, ygrid = numpy.meshgrid(xcoords, ycoords, indexing = "ij")    # [°], [°]
+            mask = land_mask(geom, xgrid, ygrid)
+            del xgrid, ygrid
+
+            if debug:
+                print(f"INFO: {mask.sum():,d} of the {mask.size:,d} points in the grid are within the geometry.")
+
+            # Check that there is something to do ...
+            if not mask.any():
+                raise Exception(f"none of the {mask.size:,d} points in the grid are within the geometry") from None
+
+            # Make arrays of the points which are within the geometry ...
+            # NOTE: The points are in the same order as looping over longitudes
+            #       and then looping over latitudes.
+            ix, iy = numpy.nonzero(mask)
+            lons = xcoords[ix]                                                  # [°]
+            lats = ycoords[iy]                                                  # [°]
+            del ix, iy
+        case "FibonacciLattice":
+            # Make arrays of the points which are within the geometry, using an
+            # equal-area lattice ...
+            lons, lats = fibonacci_lattice(
+                geom,
+                density = density,
+            )                                                                   # [°], [°]
+
+            if debug:
+                print(f"INFO: {lons.size:,d} points are within the geometry.")
+
+            # Check that there is something to do ...
+            if lons.size == 0:
+                raise Exception(f"none of the points in the lattice are within the geometry (try a density larger than {density:g} per 1,000 km²)") from None
+        case "PolygonGrid":
+            # Make arrays of the points which are within the geometry, using a
+            # grid for each Polygon ...
+            lons, lats = polygon_grid(
+                geom,
+                onlyValid = onlyValid,
+                   repair = repair,
+                    steps = steps,
+            )                                                                   # [°], [°]
+
+            if debug:
+                print(f"INFO: {lons.size:,d} points are within the geometry.")
+
+            # Check that there is something to do ...
+            if lons.size == 0:
+                raise Exception(f"none of the points in the grids of the Polygons are within the geometry (check that the geometry has valid Polygons or try a larger \"steps\" than {steps:,d})") from None
+        case "BranchAndBound":
+            # Search for the location furthest from the coast ...
+            with _phase("distance kernel"):
+                bestLon, bestLat, bestDist, lons, lats, dists = branch_and_bound(
+                    geom,
+                    coastLons,
+                    coastLats,
+                     backend = backend,
+                        conv = conv,
+                       debug = debug,
+                         eps = eps,
+                       nIter = nIter,
+                    ramLimit = ramLimit,
+                        tree = tree,
+                )                                                               # [°], [°], [m], [°], [°], [m]
+        case _:
+            # Crash ...
+            raise ValueError(f"\"method\" is an unexpected value ({repr(method)})") from None
+
+    # Check if the method sampled the geometry ...
+    if method in ["FibonacciLattice", "PolygonGrid", "UniformGrid"]:
+        # Find the distance from each point to the coast (discarding the
+        # points which cannot be the furthest from the coast using the coarser
+        # coasts and/or pruning them, if requested) ...
+        with _phase("distance kernel"):
+            if coarseCoasts:
+                dists = calc_cascade_min_dists(
+                    lons,
+                    lats,
+                    coastLons,
+                    coastLats,
+                    coarseCoasts,
+                     backend = backend,
+                       debug = debug,
+                         eps = eps,
+                       nIter = nIter,
+                       prune = prune,
+                    ramLimit = ramLimit,
+                        tree = tree,
+                     workers = workers,
+                )                                                               # [m]
+            elif prune:
+                dists = calc_pruned_min_dists(
+                    lons,
+                    lats,
+                    coastLons,
+                    coastLats,
+                     backend = backend,
+                       debug = debug,
+                         eps = eps,
+                       nIter = nIter,
+                    ramLimit = ramLimit,
+                        tree = tree,
+                )                                                               # [m]
+            else:
+                dists = calc_min_dists(
+                    lons,
+                    lats,
+                    coastLons,
+                    coastLats,
+                     backend = backend,
+                       debug = debug,
+                         eps = eps,
+                       nIter = nIter,
+                    ramLimit = ramLimit,
+                        tree = tree,
+                     workers = workers,
+                )                                                               # [m]
+
+        # Find the point which is furthest from the coast ...
+        i = numpy.argmax(dists)
+        bestLon = float(lons[i])                                                # [°]
+        bestLat = float(lats[i])                                                # [°]
+        bestDist = float(dists[i])                                              # [m]
+
+    # Return answers ...
+    return bestLon, bestLat, bestDist, lons, lats, dists
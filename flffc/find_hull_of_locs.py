@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def find_hull_of_locs(
+    lons,
+    lats,
+    /,
+):
+    """Find the locations which are on the convex hull of lots of locations
+
+    This function reads in arrays of locations (in degrees) and returns the
+    locations which are the vertices of their convex hull on the sphere. The
+    location which is furthest from any point within a hemisphere is always one
+    of these vertices, so the middle of the locations (and the furthest
+    distance from it to any of them) can be found using just the vertices.
+
+    Parameters
+    ----------
+    lons : numpy.ndarray
+        the longitudes of the locations (in degrees)
+    lats : numpy.ndarray
+        the latitudes of the locations (in degrees)
+
+    Returns
+    -------
+    lons : numpy.ndarray
+        the longitudes of the locations which are on the convex hull (in
+        degrees)
+    lats : numpy.ndarray
+        the latitudes of the locations which are on the convex hull (in
+        degrees)
+
+    Notes
+    -----
+    The locations are projected using a gnomonic projection centred on their
+    mean unit vector, which maps great circles to straight lines, so the convex
+    hull on the sphere is the convex hull of the projected locations. If the
+    locations are not all within 80° of their mean unit vector, or if there
+    are too few locations to make a convex hull, then all of the locations are
+    returned.
+
+    The convex hull is on the sphere rather than on the WGS84 ellipsoid, so
+    the middle found using just the vertices can (very rarely) differ slightly
+    from the one found using all of the locations.
+
+    Copyright 2017 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FLFFC, https://github.com/Guymer/flffc
+    """
+
+    # Import standard modules ...
+    import math
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+    try:
+        import scipy
+        import scipy.spatial
+    except:
+        raise Exception("\"scipy\" is not installed; run \"pip install --user scipy\"") from None
+
+    # Import sub-functions ...
+    from .ll2xyz import ll2xyz
+
+    # **************************************************************************
+
+    # Flatten the arrays ...
+    lons = numpy.asarray(lons).flatten()                                        # [°]
+    lats = numpy.asarray(lats).flatten()                                        # [°]
+
+    # Return early if there are too few locations to make a convex hull ...
+    if lons.size < 4:
+        return lons, lats
+
+    # Find the unit vectors and their (normalized) mean ...
+    xyz = ll2xyz(
+        lons.astype(numpy.float64),
+        lats.astype(numpy.float64),
+    )
+    mid = xyz.mean(axis = 0)
+    if numpy.linalg.norm(mid) == 0.0:
+        return lons, lats
+    mid /= numpy.linalg.norm(mid)
+
+    # Return early if the locations are not all well within the hemisphere ...
+    cosAng = xyz @ mid
+    if cosAng.min() <= math.cos(math.radians(80.0)):
+        return lons, lats
+
+    # Make two unit vectors which are perpendicular to the mean ...
+    e1 = numpy.cross(mid, [0.0, 0.0, 1.0] if abs(mid[2]) < 0.9 else [1.0, 0.0, 0.0])
+    e1 /= numpy.linalg.norm(e1)
+    e2 = numpy.cross(mid, e1)
+
+    # Project the locations using a gnomonic projection ...
+    xy = numpy.stack(
+        [
+            (xyz @ e1) / cosAng,
+            (xyz @ e2) / cosAng,
+        ],
+        axis = 1,
+    )
+    del xyz, cosAng
+
+    # Find the vertices of the convex hull (or use all of the locations if the
+    # locations are all in a line) ...
+    try:
+        keep = scipy.spatial.ConvexHull(xy).vertices
+    except scipy.spatial.QhullError:
+        return lons, lats
+    keep.sort()
+
+    # Return answers ...
+    return lons[keep], lats[keep]
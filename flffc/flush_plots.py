@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def flush_plots(
+    *,
+    debug = __debug__,
+):
+    """Wait for all of the plots in the background queue to finish
+
+    This function waits for all of the plots which have been added to the
+    background queue (see :func:`flffc.submit_plot`) to finish, reports each
+    one as it finishes and then shuts down the pool of plotters. If a plot
+    fails then the error is reported and the other plots carry on.
+
+    Parameters
+    ----------
+    debug : bool, optional
+        print debug messages
+
+    Returns
+    -------
+    plots : list of dict
+        the outcome of each plot (in the order that they finished), with the
+        keys "country", "file" (the name of the PNG, or None if it failed) and
+        "error" (the error, or None if it succeeded)
+
+    Notes
+    -----
+    Copyright 2017 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FLFFC, https://github.com/Guymer/flffc
+    """
+
+    # Import standard modules ...
+    import concurrent.futures
+
+    # Import sub-functions ...
+    from ._plot_worker import _queue
+
+    # **************************************************************************
+
+    # Return early if there is nothing to do ...
+    if _queue["pool"] is None:
+        return []
+
+    # Create short-hand ...
+    countries = {future : country for country, future in _queue["futures"]}
+
+    # Initialize list ...
+    plots = []
+
+    # Loop over plots as they complete ...
+    for future in concurrent.futures.as_completed(countries):
+        # Save the outcome of the plot ...
+        try:
+            plots.append(
+                {
+                    "country" : countries[future],
+                      "error" : None,
+                       "file" : future.result(),
+                }
+            )
+        except Exception as err:
+            plots.append(
+                {
+                    "country" : countries[future],
+                      "error" : str(err),
+                       "file" : None,
+                }
+            )
+
+        if plots[-1]["error"] is not None:
+            print(f"WARNING: Failed to plot {plots[-1]['country']} ({plots[-1]['error']}).")
+        elif debug:
+            print(f"INFO: Saved \"{plots[-1]['file']}\".")
+
+    # Shut down the pool of plotters and empty the queue ...
+    _queue["pool"].shutdown()
+    _queue["futures"].clear()
+    _queue["pool"] = None
+
+    # Return answers ...
+    return plots
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def land_mask(
+    geom,
+    lons,
+    lats,
+    /,
+):
+    """Find which locations are on land
+
+    This function accepts any Shapely geometry and arrays of locations and
+    returns a boolean array which is ``True`` wherever the location is within
+    the geometry. The geometry is prepared once and all of the locations are
+    tested in a single vectorised call, rather than creating a Point for each
+    location and testing them one at a time.
+
+    Parameters
+    ----------
+    geom : shapely.geometry.polygon.Polygon, shapely.geometry.multipolygon.MultiPolygon
+        the Shapely geometry of the land
+    lons : numpy.ndarray
+        the longitudes (in degrees)
+    lats : numpy.ndarray
+        the latitudes (in degrees)
+
+    Returns
+    -------
+    mask : numpy.ndarray
+        the boolean array, which has the same shape as the longitudes and
+        latitudes
+
+    Notes
+    -----
+    Copyright 2017 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FLFFC, https://github.com/Guymer/flffc
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+    try:
+        import shapely
+    except:
+        raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+    # Import sub-functions ...
+    from ._profile import _phase
+
+    # **************************************************************************
+
+    # Prepare the geometry (so that the spatial index is only built once) ...
+    # NOTE: "shapely.prepare()" modifies the geometry in place and does nothing
+    #       if the geometry is already prepared.
+    with _phase("land mask"):
+        shapely.prepare(geom)
+
+        # Return answer ...
+        return shapely.contains_xy(
+            geom,
+            numpy.asarray(lons, dtype = numpy.float64),
+            numpy.asarray(lats, dtype = numpy.float64),
+        )
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def ll2xyz(
+    lons,
+    lats,
+    /,
+):
+    """Transform from longitudes/latitudes to unit vectors
+
+    This function reads in arrays of longitudes and latitudes (in degrees) and
+    returns an array of the Cartesian unit vectors which point at those
+    locations on a sphere. The straight-line (chord) distance between two unit
+    vectors increases monotonically with the great-circle distance between the
+    two locations, so the unit vectors can be put into a KD-tree.
+
+    Parameters
+    ----------
+    lons : numpy.ndarray
+        the longitudes (in degrees)
+    lats : numpy.ndarray
+        the latitudes (in degrees)
+
+    Returns
+    -------
+    xyz : numpy.ndarray
+        the unit vectors, which have an extra trailing dimension of length 3
+
+    Notes
+    -----
+    Copyright 2017 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FLFFC, https://github.com/Guymer/flffc
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Convert to radians ...
+    lons = numpy.radians(lons)                                                  # [rad]
+    lats = numpy.radians(lats)                                                  # [rad]
+
+    # Return answer ...
+    return numpy.stack(
+        [
+            numpy.cos(lats) * numpy.cos(lons),
+            numpy.cos(lats) * numpy.sin(lons),
+            numpy.sin(lats),
+        ],
+        axis = -1,
+    )
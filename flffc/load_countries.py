@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def load_countries(
+    *,
+      cacheDir = "~/.cache/flffc",
+         debug = __debug__,
+     onlyValid = False,
+        repair = False,
+    resolution = "10m",
+):
+    """Load the index of the cache of countries
+
+    This function returns the index of the on-disk cache of the Natural Earth
+    countries. If the cache does not exist, or if the Natural Earth Shapefile
+    has been modified since the cache was made, then the Shapefile is read once
+    and the cache of every country in it is (re-)made.
+
+    Parameters
+    ----------
+    cacheDir : str, optional
+        the directory to store the cache in
+    debug : bool, optional
+        print debug messages
+    onlyValid : bool, optional
+        only return valid Polygons (checks for validity can take a while, if
+        being called often)
+    repair : bool, optional
+        attempt to repair invalid Polygons
+    resolution : str, optional
+        the resolution of the Natural Earth Shapefile
+
+    Returns
+    -------
+    dName : str
+        the directory which contains the cache
+    index : dict
+        the index of the cache, with the name of each country as the key
+    sha256 : str
+        the SHA-256 hash of the Natural Earth Shapefile (including its ".dbf"
+        and ".shx" files) which the cache was made from
+
+    Notes
+    -----
+    Each country is stored in its own directory which contains:
+
+    * "polys.wkb" - the (repaired) Polygons as a WKB MultiPolygon; and
+    * "coastLons.npy" and "coastLats.npy" - the flattened coordinates of the
+      exterior rings of the (repaired) Polygons, which can be memory-mapped.
+
+    The index stores the directory, the bounds and the number of coordinates in
+    the coast of each country, as well as the name of the Shapefile which the
+    cache was made from, and the modification times and the SHA-256 hash of
+    the ".shp", ".dbf" and ".shx" files which make it up. The countries are
+    looked up by name, so if two records in the Shapefile have the same name
+    then only the first one is cached (and a warning is printed).
+
+    Copyright 2017 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FLFFC, https://github.com/Guymer/flffc
+    """
+
+    # Import standard modules ...
+    import hashlib
+    import json
+    import os
+    import pathlib
+
+    # Import special modules ...
+    try:
+        import cartopy
+        cartopy.config.update(
+            {
+                "cache_dir" : pathlib.PosixPath("~/.local/share/cartopy").expanduser(),
+            }
+        )
+    except:
+        raise Exception("\"cartopy\" is not installed; run \"pip install --user Cartopy\"") from None
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+    try:
+        import shapely
+        import shapely.geometry
+    except:
+        raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+        import pyguymer3.geo
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # Import sub-functions ...
+    from ._profile import _phase
+    from .extract_coast import extract_coast
+
+    # **************************************************************************
+
+    # Create short-hands ...
+    dName = f"{pathlib.PosixPath(cacheDir).expanduser()}/resolution={resolution}_onlyValid={onlyValid}_repair={repair}"
+    jName = f"{dName}/index.json"
+
+    # Find file containing all the country shapes ...
+    sfile = cartopy.io.shapereader.natural_earth(
+          category = "cultural",
+              name = "admin_0_countries",
+        resolution = resolution,
+    )
+
+    # Find the files which make up the Shapefile and when they were last
+    # modified ...
+    # NOTE: The names of the countries are in the ".dbf" file and the offsets
+    #       of the shapes are in the ".shx" file, so they change the cache too.
+    fNames = [f"{os.path.splitext(sfile)[0]}{ext}" for ext in [".shp", ".dbf", ".shx"]]
+    mtimes = [os.path.getmtime(fName) for fName in fNames]                      # [s]
+
+    # Check if the cache exists and is up-to-date ...
+    if os.path.exists(jName):
+        # Load index ...
+        with open(jName, mode = "rt", encoding = "utf-8") as fObj:
+            index = json.load(fObj)
+
+        # Return answers if the cache was made from this Shapefile ...
+        if index["source"] == str(sfile) and index.get("mtimes") == mtimes and "sha256" in index:
+            return dName, index["countries"], index["sha256"]
+
+    if debug:
+        print(f"INFO: Making the cache of \"{sfile}\" in \"{dName}\" ...")
+
+    # Scan the Shapefile ...
+    # NOTE: The Shapefile is only scanned when the cache is (re-)made.
+    with _phase("shapefile scan"):
+        # Hash the files which make up the Shapefile (in order) ...
+        hObj = hashlib.sha256()
+        for fName in fNames:
+            with open(fName, mode = "rb") as fObj:
+                hObj.update(hashlib.file_digest(fObj, "sha256").digest())
+        sha256 = hObj.hexdigest()
+
+        # Initialize index ...
+        index = {
+            "countries" : {},
+               "mtimes" : mtimes,
+               "sha256" : sha256,
+               "source" : str(sfile),
+        }
+
+        # Loop over records ...
+        for iRecord, record in enumerate(cartopy.io.shapereader.Reader(sfile).records()):
+            # Create short-hand ...
+            neName = pyguymer3.geo.getRecordAttribute(record, "NAME")
+
+            # Skip if there is already a country with this name (the countries
+            # are looked up by name, so only the first one can be used) ...
+            if neName in index["countries"]:
+                print(f"WARNING: There is more than one country called \"{neName}\" in \"{sfile}\" (records {int(index['countries'][neName]['dir']):d} and {iRecord:d}), so only the first one is cached.")
+                continue
+
+            # Create short-hand and make output folder if it is missing ...
+            cName = f"{dName}/{iRecord:04d}"
+            if not os.path.exists(cName):
+                os.makedirs(cName)
+
+            # Extract the (repaired) Polygons and the coordinates of the coast ...
+            with _phase("polygon extraction"):
+                polys = shapely.geometry.multipolygon.MultiPolygon(
+                    pyguymer3.geo.extract_polys(
+                        record.geometry,
+                        onlyValid = onlyValid,
+                           repair = repair,
+                    )
+                )
+                coastLons, coastLats = extract_coast(
+                    polys,
+                    onlyValid = False,
+                       repair = False,
+                )                                                               # [°], [°]
+
+            # Save the Polygons and the coordinates of the coast ...
+            with open(f"{cName}/polys.wkb", mode = "wb") as fObj:
+                fObj.write(shapely.to_wkb(polys))
+            numpy.save(f"{cName}/coastLons.npy", coastLons)
+            numpy.save(f"{cName}/coastLats.npy", coastLats)
+
+            # Add the country to the index ...
+            index["countries"][neName] = {
+                "bounds" : list(record.bounds),
+                   "dir" : f"{iRecord:04d}",
+                "nCoast" : int(coastLons.size),
+            }
+
+    # Save index ...
+    # NOTE: The index is written last (and atomically) so that a partially
+    #       made cache is never used.
+    with open(f"{jName}.tmp", mode = "wt", encoding = "utf-8") as fObj:
+        json.dump(
+            index,
+            fObj,
+            ensure_ascii = False,
+                  indent = 4,
+               sort_keys = True,
+        )
+    os.replace(f"{jName}.tmp", jName)
+
+    # Return answers ...
+    return dName, index["countries"], index["sha256"]
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def load_country(
+    country,
+    /,
+    *,
+      cacheDir = "~/.cache/flffc",
+         debug = __debug__,
+     onlyValid = False,
+        repair = False,
+    resolution = "10m",
+):
+    """Load a country from the cache of countries
+
+    This function loads the (repaired) Polygons and the coordinates of the coast
+    of a country from the on-disk cache of the Natural Earth countries, making
+    the cache first if required (see :func:`flffc.load_countries`). Only the
+    files for the requested country are read and the coordinates of the coast
+    are memory-mapped.
+
+    Parameters
+    ----------
+    country : str
+        the name of the country
+    cacheDir : str, optional
+        the directory to store the cache in
+    debug : bool, optional
+        print debug messages
+    onlyValid : bool, optional
+        only return valid Polygons (checks for validity can take a while, if
+        being called often)
+    repair : bool, optional
+        attempt to repair invalid Polygons
+    resolution : str, optional
+        the resolution of the Natural Earth Shapefile
+
+    Returns
+    -------
+    polys : shapely.geometry.multipolygon.MultiPolygon
+        the (repaired) Polygons of the country
+    coastLons : numpy.ndarray
+        the longitudes of the coast (in degrees)
+    coastLats : numpy.ndarray
+        the latitudes of the coast (in degrees)
+
+    Notes
+    -----
+    Copyright 2017 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FLFFC, https://github.com/Guymer/flffc
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+    try:
+        import shapely
+    except:
+        raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+    # Import sub-functions ...
+    from ._profile import _phase
+    from .load_countries import load_countries
+
+    # **************************************************************************
+
+    # Load the index of the cache ...
+    dName, index, _ = load_countries(
+          cacheDir = cacheDir,
+             debug = debug,
+         onlyValid = onlyValid,
+            repair = repair,
+        resolution = resolution,
+    )
+
+    # Check that the country is in the cache ...
+    if country not in index:
+        raise Exception(f"\"{country}\" is not a country in the {resolution} Natural Earth Shapefile") from None
+
+    # Create short-hand ...
+    cName = f"{dName}/{index[country]['dir']}"
+
+    # Load the Polygons ...
+    with _phase("polygon extraction"):
+        with open(f"{cName}/polys.wkb", mode = "rb") as fObj:
+            polys = shapely.from_wkb(fObj.read())
+
+    # Return answers ...
+    return polys, numpy.load(f"{cName}/coastLons.npy", mmap_mode = "r"), numpy.load(f"{cName}/coastLats.npy", mmap_mode = "r")
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def load_result(
+    key,
+    /,
+    *,
+    cacheDir = "~/.cache/flffc",
+):
+    """Load a result from the cache of results
+
+    This function loads a result from the on-disk cache of results and marks it
+    as recently used (so that it is the last to be evicted).
+
+    Parameters
+    ----------
+    key : str
+        the key of the result (as made by :func:`flffc.make_result_key`)
+    cacheDir : str, optional
+        the directory to store the cache in
+
+    Returns
+    -------
+    result : dict, None
+        the result (as returned by :func:`flffc.compute`), or None if it is not
+        in the cache
+
+    Notes
+    -----
+    Copyright 2017 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FLFFC, https://github.com/Guymer/flffc
+    """
+
+    # Import standard modules ...
+    import json
+    import os
+    import pathlib
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Create short-hand ...
+    fName = f"{pathlib.PosixPath(cacheDir).expanduser()}/results/{key}.npz"
+
+    # Return early if the result is not in the cache ...
+    if not os.path.exists(fName):
+        return None
+
+    # Load the result ...
+    # NOTE: Another process may have evicted the result since it was checked.
+    try:
+        with numpy.load(fName) as fObj:
+            result = json.loads(str(fObj["meta"]))
+            result["dists"] = fObj["dists"]                                     # [m]
+            result["lats"] = fObj["lats"]                                       # [°]
+            result["lons"] = fObj["lons"]                                       # [°]
+        os.utime(fName)
+    except FileNotFoundError:
+        return None
+
+    # Convert the lists that JSON made back to tuples ...
+    result["bounds"] = tuple(result["bounds"])                                  # [°], [°], [°], [°]
+    if result["middle"] is not None:
+        result["middle"] = tuple(result["middle"])                              # [°], [°], [m]
+
+    # Return answer ...
+    return result
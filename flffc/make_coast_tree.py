@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def make_coast_tree(
+    coastLons,
+    coastLats,
+    /,
+):
+    """Make a KD-tree of the coordinates of the coast
+
+    This function reads in arrays of the coordinates of the coast (in degrees)
+    and builds a KD-tree of their unit vectors, so that the coordinates which
+    are nearest to any location can be found without checking all of them.
+
+    Parameters
+    ----------
+    coastLons : numpy.ndarray
+        the longitudes of the coast (in degrees)
+    coastLats : numpy.ndarray
+        the latitudes of the coast (in degrees)
+
+    Returns
+    -------
+    tree : scipy.spatial.KDTree
+        the KD-tree of the unit vectors of the coast
+
+    Notes
+    -----
+    Copyright 2017 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FLFFC, https://github.com/Guymer/flffc
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+    try:
+        import scipy
+        import scipy.spatial
+    except:
+        raise Exception("\"scipy\" is not installed; run \"pip install --user scipy\"") from None
+
+    # Import sub-functions ...
+    from .ll2xyz import ll2xyz
+
+    # **************************************************************************
+
+    # Return answer ...
+    return scipy.spatial.KDTree(
+        ll2xyz(
+            numpy.asarray(coastLons, dtype = numpy.float64).flatten(),
+            numpy.asarray(coastLats, dtype = numpy.float64).flatten(),
+        )
+    )
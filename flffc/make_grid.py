@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def make_grid(
+    result,
+    /,
+):
+    """Put the sampled locations of an answer back onto the uniform grid
+
+    This function reads in an answer (as returned by :func:`flffc.compute`)
+    which was found by sampling a uniform grid of longitudes and latitudes and
+    returns the longitudes and latitudes of the grid and a masked 2-D array of
+    the distances, where the points on the grid which are not within the
+    country are masked.
+
+    Parameters
+    ----------
+    result : dict
+        the answer (as returned by :func:`flffc.compute`)
+
+    Returns
+    -------
+    xcoords : numpy.ndarray
+        the longitudes of the grid (in degrees)
+    ycoords : numpy.ndarray
+        the latitudes of the grid (in degrees)
+    dists : numpy.ma.MaskedArray
+        the distances from the points on the grid to the coast (in metres),
+        with the same type as the distances in the answer, indexed by
+        longitude and then by latitude
+
+    Notes
+    -----
+    The grid is remade from the bounding box and the number of steps in the
+    answer, in exactly the same way as :func:`flffc.find_furthest` makes it,
+    and each sampled location is put in the nearest cell (so the answer can
+    have been stored using 32-bit floats).
+
+    Copyright 2017 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FLFFC, https://github.com/Guymer/flffc
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Check what method the answer was found with ...
+    match result["method"]:
+        case "UniformGrid":
+            pass
+        case _:
+            # Crash ...
+            raise ValueError(f"\"method\" of the answer is not \"UniformGrid\" ({repr(result['method'])})") from None
+
+    # Make longitude and latitude grid ...
+    lon_min, lat_min, lon_max, lat_max = result["bounds"]                       # [°], [°], [°], [°]
+    xcoords = numpy.linspace(lon_min, lon_max, num = result["steps"])           # [°]
+    ycoords = numpy.linspace(lat_min, lat_max, num = result["steps"])           # [°]
+
+    # Find the nearest longitude and latitude of the grid to each sampled
+    # location ...
+    indices = []
+    for coords, locs in [(xcoords, result["lons"]), (ycoords, result["lats"])]:
+        locs = numpy.asarray(locs, dtype = numpy.float64)                       # [°]
+        i = numpy.clip(numpy.searchsorted(coords, locs), 1, coords.size - 1)
+        i -= (locs - coords[i - 1] < coords[i] - locs).astype(i.dtype)
+        indices.append(numpy.clip(i, 0, coords.size - 1))
+
+    # Make the masked array of distances ...
+    dists = numpy.ma.masked_all(
+        (xcoords.size, ycoords.size),
+        dtype = result["dists"].dtype,
+    )                                                                           # [m]
+    dists[indices[0], indices[1]] = result["dists"]                             # [m]
+
+    # Return answers ...
+    return xcoords, ycoords, dists
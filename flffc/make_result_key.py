@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def make_result_key(
+    country,
+    sha256,
+    /,
+    *,
+      backend = "Vincenty",
+      cascade = False,
+         conv = 1000.0,
+      density = 1.0,
+        dtype = "float64",
+          eps = 1.0e-12,
+       method = "UniformGrid",
+        nIter = 100,
+    onlyValid = False,
+        prune = False,
+       repair = False,
+        steps = 50,
+):
+    """Make the key of a result in the cache of results
+
+    This function makes the key of a result in the on-disk cache of results,
+    which is the SHA-256 hash of all of the parameters which change the result
+    and of the Natural Earth Shapefile which the country was loaded from.
+
+    Parameters
+    ----------
+    country : str
+        the name of the country
+    sha256 : str
+        the SHA-256 hash of the Natural Earth Shapefile
+    backend : str, optional
+        the formula to use for the distances ("Haversine", "AndoyerLambert",
+        "Vincenty", "Karney" or "Hybrid"), see
+        :func:`flffc.calc_dists_between_locs` and :func:`flffc.calc_min_dists`
+    cascade : bool, optional
+        use the coarser coasts to discard the sampled locations which cannot be
+        the furthest from the coast (the distances of the discarded locations
+        are then only estimates)
+    conv : float, optional
+        the distance that defines the branch-and-bound search as being
+        converged (in metres)
+    density : float, optional
+        the number of locations per 1,000 km² in the Fibonacci lattice
+    dtype : str, optional
+        the type of the arrays of the sampled locations and their distances
+        ("float64" or "float32")
+    eps : float, optional
+        the tolerance of the Vincenty formula iterations
+    method : str, optional
+        the method for finding the location ("UniformGrid", "PolygonGrid",
+        "FibonacciLattice" or "BranchAndBound")
+    nIter : int, optional
+        the maximum number of iterations (particularly the Vincenty formula)
+    onlyValid : bool, optional
+        only return valid Polygons (checks for validity can take a while, if
+        being called often)
+    prune : bool, optional
+        stop calculating the distance from a sampled location to the coast as
+        soon as it cannot be the furthest from the coast (the distances of the
+        pruned locations are then only upper bounds)
+    repair : bool, optional
+        attempt to repair invalid Polygons
+    steps : int, optional
+        the number of longitudes and latitudes in the uniform grid
+
+    Returns
+    -------
+    key : str
+        the key of the result
+
+    Notes
+    -----
+    The parameters which do not change the result (such as "ramLimit",
+    "useKDTree" and "workers") are not part of the key, and nor are the
+    parameters which the method does not use (for example, "conv" is only part
+    of the key of the "BranchAndBound" method and "density" is only part of the
+    key of the "FibonacciLattice" method).
+
+    Copyright 2017 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FLFFC, https://github.com/Guymer/flffc
+    """
+
+    # Import standard modules ...
+    import hashlib
+    import json
+
+    # **************************************************************************
+
+    # Create the parameters which change the result for every method ...
+    params = {
+          "backend" : backend,
+          "country" : country,
+            "dtype" : dtype,
+              "eps" : float(eps),
+           "method" : method,
+            "nIter" : int(nIter),
+        "onlyValid" : bool(onlyValid),
+           "repair" : bool(repair),
+           "sha256" : sha256,
+    }
+
+    # Add the parameters which only change the result for some methods ...
+    match method:
+        case "UniformGrid" | "PolygonGrid":
+            params["cascade"] = bool(cascade)
+            params["prune"] = bool(prune)
+            params["steps"] = int(steps)
+        case "FibonacciLattice":
+            params["cascade"] = bool(cascade)
+            params["density"] = float(density)
+            params["prune"] = bool(prune)
+        case "BranchAndBound":
+            params["conv"] = float(conv)
+        case _:
+            # Crash ...
+            raise ValueError(f"\"method\" is an unexpected value ({repr(method)})") from None
+
+    # Return answer ...
+    return hashlib.sha256(
+        json.dumps(
+            params,
+            ensure_ascii = False,
+               sort_keys = True,
+        ).encode("utf-8")
+    ).hexdigest()
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def plot(
+    dirOut,
+    result,
+    /,
+    *,
+         debug = __debug__,
+           eps = 1.0e-12,
+         nIter = 100,
+     onlyValid = False,
+        render = "Scatter",
+        repair = False,
+       timeout = 60.0,
+       useHull = False,
+    verifyHull = False,
+):
+    """Plot the location furthest from the coast in a country
+
+    This function draws the sampled locations (coloured by their distance to
+    the coast) on a map and saves it as a PNG named after the country. The
+    middle of the sampled locations (which the map is centred on) is only found
+    if it is not already in the result (having been found from the same set of
+    locations), in which case it is added to the result.
+
+    Parameters
+    ----------
+    dirOut : str
+        the directory to save the PNG in
+    result : dict
+        the answer (as returned by :func:`flffc.compute`)
+    debug : bool, optional
+        print debug messages
+    eps : float, optional
+        the tolerance of the Vincenty formula iterations
+    nIter : int, optional
+        the maximum number of iterations (particularly the Vincenty formula)
+    onlyValid : bool, optional
+        only return valid Polygons (checks for validity can take a while, if
+        being called often)
+    render : str, optional
+        how to draw the sampled locations ("Scatter" or "PColorMesh"), see
+        the notes below
+    repair : bool, optional
+        attempt to repair invalid Polygons
+    timeout : float, optional
+        the timeout for any requests/subprocess calls (in seconds)
+    useHull : bool, optional
+        find the middle of just the sampled locations which are on their
+        convex hull, see :func:`flffc.find_hull_of_locs`
+    verifyHull : bool, optional
+        find the middle of all of the sampled locations and of just the ones
+        which are on their convex hull, and warn if they differ (the middle of
+        all of the sampled locations is then used)
+
+    Notes
+    -----
+    On a sphere, the furthest distance from any point to the sampled locations
+    is always the distance to one of the vertices of their convex hull, so
+    "useHull" only removes locations which cannot change the middle (see
+    :func:`flffc.find_hull_of_locs` for the caveats on the WGS84 ellipsoid).
+    The search for the middle evaluates the furthest distance lots of times, so
+    it is much quicker with just the vertices.
+
+    The "Scatter" render draws a circle for every sampled location, which takes
+    longer and longer as "steps" increases. The "PColorMesh" render puts the
+    sampled locations back onto the uniform grid (see :func:`flffc.make_grid`)
+    and draws it as a single mesh of pixels, so it takes roughly the same time
+    whatever the number of sampled locations (but it can only be used if the
+    answer was found with the "UniformGrid" method).
+
+    Copyright 2017 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FLFFC, https://github.com/Guymer/flffc
+    """
+
+    # Import standard modules ...
+    import json
+    import os
+    import pathlib
+
+    # Import special modules ...
+    try:
+        import cartopy
+        cartopy.config.update(
+            {
+                "cache_dir" : pathlib.PosixPath("~/.local/share/cartopy").expanduser(),
+            }
+        )
+    except:
+        raise Exception("\"cartopy\" is not installed; run \"pip install --user Cartopy\"") from None
+    try:
+        import matplotlib
+        matplotlib.rcParams.update(
+            {
+                       "axes.xmargin" : 0.01,
+                       "axes.ymargin" : 0.01,
+                            "backend" : "Agg",                                  # NOTE: See https://matplotlib.org/stable/gallery/user_interfaces/canvasagg.html
+                         "figure.dpi" : 300,
+                     "figure.figsize" : (9.6, 7.2),                             # NOTE: See https://github.com/Guymer/misc/blob/main/README.md#matplotlib-figure-sizes
+                          "font.size" : 8,
+                "image.interpolation" : "none",                                 # NOTE: See https://matplotlib.org/stable/gallery/images_contours_and_fields/interpolation_methods.html
+                     "image.resample" : False,
+            }
+        )
+        import matplotlib.pyplot
+    except:
+        raise Exception("\"matplotlib\" is not installed; run \"pip install --user matplotlib\"") from None
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+        import pyguymer3.geo
+        import pyguymer3.image
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # Import sub-functions ...
+    from ._profile import _phase, _start, _stop
+    from .find_hull_of_locs import find_hull_of_locs
+    from .make_grid import make_grid
+
+    # **************************************************************************
+
+    # Make output directory ...
+    if not os.path.exists(dirOut):
+        os.makedirs(dirOut)
+
+    # Carry on with the profile of the answer (if there is one) ...
+    if result.get("profile") is not None:
+        _start(result["profile"])
+
+    # Create short-hand ...
+    middleFrom = "all" if not useHull or verifyHull else "hull"
+
+    # Find middle of points and the furthest distance (if they are not already
+    # known from the same set of locations, or if they need verifying) ...
+    if result.get("middle") is None or result.get("middleFrom") != middleFrom or verifyHull:
+        # Initialize dictionary (with the middle which is already known, if
+        # the set of locations which it was found from is known) ...
+        middles = {}
+        if result.get("middle") is not None and result.get("middleFrom") is not None:
+            middles[result["middleFrom"]] = result["middle"]
+
+        # Loop over sets of locations ...
+        for name, use in [("all", not useHull or verifyHull), ("hull", useHull or verifyHull)]:
+            # Skip this set if it is not needed (or if it is already known) ...
+            if not use or name in middles:
+                continue
+
+            # Find the locations ...
+            if name == "hull":
+                lons, lats = find_hull_of_locs(result["lons"], result["lats"])  # [°], [°]
+
+                if debug:
+                    print(f"INFO: {lons.size:,d} of the {result['lons'].size:,d} sampled locations are on the convex hull.")
+            else:
+                lons, lats = result["lons"], result["lats"]                     # [°], [°]
+
+            # Find middle of the locations and the furthest distance ...
+            with _phase("find_middle_of_locs"):
+                middles[name] = pyguymer3.geo.find_middle_of_locs(
+                    lons,
+                    lats,
+                     angConv = 0.1,
+                        conv = 10000.0,                                         # 10 km
+                       debug = debug,
+                         eps = eps,
+                      method = "GeodesicCircle",
+                        nAng = 9,
+                       nIter = nIter,
+                     nRefine = 6,                                               # 156.25 m
+                         pad = 12.0 * 1852.0,
+                    useSciPy = False,
+                )                                                               # [°], [°], [m]
+
+        # Check that the middles are the same (if requested) ...
+        if verifyHull and middles["all"] != middles["hull"]:
+            print(f"WARNING: The middle of the sampled locations in {result['country']} is {middles['all']} but the middle of just the ones which are on the convex hull is {middles['hull']}.")
+
+        # Save the middle (and which set of locations it was found from) ...
+        result["middle"] = middles[middleFrom]
+        result["middleFrom"] = middleFrom
+    midLon, midLat, maxDist = result["middle"]                                  # [°], [°], [m]
+
+    # Draw the figure ...
+    with _phase("figure render"):
+        # Create figure ...
+        fg = matplotlib.pyplot.figure()
+
+        # Create axis ...
+        ax = pyguymer3.geo.add_axis(
+            fg,
+              add_coastlines = True,
+               add_gridlines = True,
+                       debug = debug,
+                        dist = maxDist,
+                         eps = eps,
+                         lat = midLat,
+                         lon = midLon,
+                       nIter = nIter,
+                   onlyValid = onlyValid,
+                      repair = repair,
+            satellite_height = False,
+        )
+
+        # Configure axis ...
+        pyguymer3.geo.add_map_background(
+            ax,
+              debug = debug,
+            subName = "large8192px",
+        )
+
+        # Check how the user wants to draw the sampled locations ...
+        match render:
+            case "Scatter":
+                # Plot points ...
+                # NOTE: Default value of the optional keyword argument "s" (as of
+                #       November 2016) is "20 points ^ 2". Therefore, the nominal
+                #       width/height is approximately "4.5 points" (assuming that
+                #       the circles are actually sized like squares). I want to
+                #       scale the width/height so that the circles do not overlap.
+                #       The following tweak should do that as different users
+                #       request different numbers of steps. With the default value
+                #       of "steps = 50" the size will be "16 points ^ 2" - a
+                #       slightly smaller area than default.
+                # NOTE: As of 5/Dec/2023, the default "zorder" of the coastlines is
+                #       1.5, the default "zorder" of the gridlines is 2.0 and the
+                #       default "zorder" of the scattered points is 1.0.
+                sc = ax.scatter(
+                    result["lons"],
+                    result["lats"],
+                            c = result["dists"] / 1000.0,
+                         cmap = matplotlib.colormaps["turbo"],
+                    linewidth = 0.5,
+                            s = pow(200.0 / result["steps"], 2),
+                    transform = cartopy.crs.Geodetic(),
+                         vmin = 0.0,
+                       zorder = 5.0,
+                )
+            case "PColorMesh":
+                # Put the sampled locations back onto the grid and find the edges
+                # of the cells ...
+                xcoords, ycoords, dists = make_grid(result)                     # [°], [°], [m]
+                dx = (xcoords[-1] - xcoords[0]) / max(1, xcoords.size - 1)      # [°]
+                dy = (ycoords[-1] - ycoords[0]) / max(1, ycoords.size - 1)      # [°]
+                xedges = xcoords[0] - 0.5 * dx                                  # [°]
+                xedges = xedges + dx * numpy.arange(xcoords.size + 1)           # [°]
+                yedges = ycoords[0] - 0.5 * dy                                  # [°]
+                yedges = yedges + dy * numpy.arange(ycoords.size + 1)           # [°]
+
+                # Plot cells ...
+                # NOTE: The masked cells (which are not within the country) are
+                #       not drawn.
+                sc = ax.pcolormesh(
+                    xedges,
+                    yedges,
+                    dists.T / 1000.0,
+                         cmap = matplotlib.colormaps["turbo"],
+                    transform = cartopy.crs.PlateCarree(),
+                         vmin = 0.0,
+                       zorder = 5.0,
+                )
+            case _:
+                # Crash ...
+                raise ValueError(f"\"render\" is an unexpected value ({repr(render)})") from None
+
+        # Add colour bar ...
+        cb = fg.colorbar(sc, ax = ax, orientation = "vertical")
+
+        # Configure colour bar ...
+        cb.set_label("Distance [km]")
+
+        # Configure axis ...
+        ax.set_title("Location Furthest From Coast")
+
+        # Configure figure ...
+        fg.tight_layout()
+
+        # Save figure ...
+        fg.savefig(f"{dirOut}/{result['country']}.png")
+        matplotlib.pyplot.close(fg)
+
+    # Optimize PNG ...
+    with _phase("optimise_image"):
+        pyguymer3.image.optimise_image(
+            f"{dirOut}/{result['country']}.png",
+              debug = debug,
+              strip = True,
+            timeout = timeout,
+        )
+
+    # Save the profile of the answer next to the PNG (if there is one) ...
+    if result.get("profile") is not None:
+        result["profile"] = _stop()
+        with open(f"{dirOut}/{result['country']}.json", mode = "wt", encoding = "utf-8") as fObj:
+            json.dump(
+                {
+                       "country" : result["country"],
+                        "method" : result["method"],
+                    "points [#]" : int(result["lons"].size),
+                       "profile" : result["profile"],
+                         "steps" : result["steps"],
+                },
+                fObj,
+                ensure_ascii = False,
+                      indent = 4,
+                   sort_keys = True,
+            )
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def polygon_grid(
+    geom,
+    /,
+    *,
+    onlyValid = False,
+       repair = False,
+        steps = 50,
+):
+    """Sample each Polygon in a geometry with its own grid
+
+    This function shares a budget of "steps" × "steps" points between the
+    Polygons in the geometry, in proportion to their areas, and then samples
+    each Polygon with a grid of longitudes and latitudes which covers only its
+    own bounding box. The locations which are within each Polygon are returned.
+
+    Parameters
+    ----------
+    geom : shapely.geometry.polygon.Polygon, shapely.geometry.multipolygon.MultiPolygon
+        the Shapely geometry of the country
+    onlyValid : bool, optional
+        only return valid Polygons (checks for validity can take a while, if
+        being called often)
+    repair : bool, optional
+        attempt to repair invalid Polygons
+    steps : int, optional
+        the square root of the number of locations to share between the
+        Polygons
+
+    Returns
+    -------
+    lons : numpy.ndarray
+        the longitudes of the sampled locations which are within the geometry
+        (in degrees)
+    lats : numpy.ndarray
+        the latitudes of the sampled locations which are within the geometry
+        (in degrees)
+
+    Notes
+    -----
+    The area of each Polygon is approximated as its area in degrees squared
+    multiplied by the cosine of the latitude of its centroid. Each grid samples
+    the centres of the cells, rather than the edges, so no location is ever on
+    the bounding box of a Polygon. If none of the locations of a grid are
+    within its Polygon (for example, if the Polygon is a tiny island which gets
+    less than one location) then a single location which is guaranteed to be
+    within the Polygon is used instead, so every Polygon is sampled at least
+    once.
+
+    Countries which cross the anti-meridian (such as Russia and Fiji) are split
+    into separate Polygons either side of it by Natural Earth, so sampling each
+    Polygon on its own means that the grid never spans the whole globe.
+
+    Copyright 2017 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FLFFC, https://github.com/Guymer/flffc
+    """
+
+    # Import standard modules ...
+    import math
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+        import pyguymer3.geo
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # Import sub-functions ...
+    from .land_mask import land_mask
+
+    # **************************************************************************
+
+    # Extract the Polygons and find their (approximate) areas ...
+    polys = pyguymer3.geo.extract_polys(
+        geom,
+        onlyValid = onlyValid,
+           repair = repair,
+    )
+    areas = numpy.array(
+        [poly.area * math.cos(math.radians(poly.centroid.y)) for poly in polys],
+        dtype = numpy.float64,
+    )                                                                           # [°2]
+
+    # Initialize lists ...
+    lons = []                                                                   # [°]
+    lats = []                                                                   # [°]
+
+    # Loop over Polygons ...
+    for poly, area in zip(polys, areas, strict = True):
+        # Find extent of the Polygon and how many of the locations it gets ...
+        lon_min, lat_min, lon_max, lat_max = poly.bounds                        # [°], [°], [°], [°]
+        width = max(lon_max - lon_min, 1.0e-9)                                  # [°]
+        height = max(lat_max - lat_min, 1.0e-9)                                 # [°]
+        nPoly = float(steps * steps) * area / areas.sum()                       # [#]
+
+        # Find the spacing of the grid such that about "nPoly" of its locations
+        # are within the Polygon ...
+        nBox = nPoly * width * height / max(poly.area, 1.0e-18)                 # [#]
+        size = math.sqrt(width * height / max(nBox, 1.0))                       # [°]
+        nx = max(1, round(width / size))                                        # [#]
+        ny = max(1, round(height / size))                                       # [#]
+
+        # Make longitude and latitude grid (of the centres of the cells) ...
+        xcoords = lon_min + (numpy.arange(nx) + 0.5) * width / nx               # [°]
+        ycoords = lat_min + (numpy.arange(ny) + 0.5) * height / ny              # [°]
+        xgrid, ygrid = numpy.meshgrid(xcoords, ycoords, indexing = "ij")        # [°], [°]
+
+        # Find out which points on the grid are within the Polygon ...
+        mask = land_mask(poly, xgrid, ygrid)
+
+        # Append the points which are within the Polygon (or a point which is
+        # guaranteed to be within the Polygon) to the lists ...
+        if mask.any():
+            lons.append(xgrid[mask])                                            # [°]
+            lats.append(ygrid[mask])                                            # [°]
+        else:
+            pnt = poly.representative_point()
+            lons.append(numpy.array([pnt.x], dtype = numpy.float64))            # [°]
+            lats.append(numpy.array([pnt.y], dtype = numpy.float64))            # [°]
+
+    # Return answers (which are empty if there are no Polygons) ...
+    if not lons:
+        return numpy.zeros(0, dtype = numpy.float64), numpy.zeros(0, dtype = numpy.float64)
+    return numpy.concatenate(lons), numpy.concatenate(lats)
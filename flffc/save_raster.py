@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def save_raster(
+    dirOut,
+    result,
+    /,
+    *,
+    debug = __debug__,
+):
+    """Save the distances of an answer as a georeferenced raster
+
+    This function reads in an answer (as returned by :func:`flffc.compute`)
+    which was found by sampling a uniform grid of longitudes and latitudes and
+    saves the distances as a 2-D NumPy array named after the country, along
+    with a JSON header which describes where the raster is on the globe.
+
+    Parameters
+    ----------
+    dirOut : str
+        the directory to save the raster in
+    result : dict
+        the answer (as returned by :func:`flffc.compute`)
+    debug : bool, optional
+        print debug messages
+
+    Notes
+    -----
+    The raster is laid out in the same way as a GeoTIFF: the first row is the
+    northernmost latitude, the first column is the westernmost longitude and
+    each value is the distance (in metres) at the centre of its pixel, with the
+    points on the grid which are not within the country set to NaN. The JSON
+    header contains the GDAL-style affine transform ("transform") from the
+    column and row of the top-left corner of a pixel to its longitude and
+    latitude, so the raster can be passed straight to (for example) rasterio
+    or GDAL.
+
+    Copyright 2017 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FLFFC, https://github.com/Guymer/flffc
+    """
+
+    # Import standard modules ...
+    import json
+    import os
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .make_grid import make_grid
+
+    # **************************************************************************
+
+    # Make output directory ...
+    if not os.path.exists(dirOut):
+        os.makedirs(dirOut)
+
+    # Put the sampled locations back onto the grid and flip it so that it is
+    # indexed by row (north first) and then by column (west first) ...
+    xcoords, ycoords, dists = make_grid(result)                                 # [°], [°], [m]
+    raster = dists.filled(numpy.nan).T[::-1, :]                                 # [m]
+
+    # Find the size of each pixel ...
+    dx = (xcoords[-1] - xcoords[0]) / max(1, xcoords.size - 1)                  # [°]
+    dy = (ycoords[-1] - ycoords[0]) / max(1, ycoords.size - 1)                  # [°]
+
+    # Save the raster ...
+    numpy.save(f"{dirOut}/{result['country']}.npy", numpy.ascontiguousarray(raster))
+
+    # Save the header ...
+    with open(f"{dirOut}/{result['country']}.npy.json", mode = "wt", encoding = "utf-8") as fObj:
+        json.dump(
+            {
+                 "bestDist" : result["bestDist"],
+                  "bestLat" : result["bestLat"],
+                  "bestLon" : result["bestLon"],
+                  "country" : result["country"],
+                      "crs" : "EPSG:4326",
+                    "dtype" : raster.dtype.name,
+                   "height" : raster.shape[0],
+                   "nodata" : "NaN",
+                "transform" : [
+                    float(xcoords[0] - 0.5 * dx),
+                    float(dx),
+                    0.0,
+                    float(ycoords[-1] + 0.5 * dy),
+                    0.0,
+                    float(-dy),
+                ],
+                    "units" : "m",
+                    "width" : raster.shape[1],
+            },
+            fObj,
+            ensure_ascii = False,
+                  indent = 4,
+               sort_keys = True,
+        )
+
+    if debug:
+        print(f"INFO: Saved a {raster.shape[1]:,d} × {raster.shape[0]:,d} raster of the distances to \"{dirOut}/{result['country']}.npy\".")
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def save_result(
+    result,
+    /,
+    *,
+     cacheDir = "~/.cache/flffc",
+    cacheSize = 1073741824,
+):
+    """Save a result to the cache of results
+
+    This function saves a result to the on-disk cache of results and then
+    evicts the least recently used results until the cache is no larger than
+    "cacheSize".
+
+    Parameters
+    ----------
+    result : dict
+        the result (as returned by :func:`flffc.compute`)
+    cacheDir : str, optional
+        the directory to store the cache in
+    cacheSize : int, optional
+        the maximum size of the cache of results (in bytes)
+
+    Notes
+    -----
+    Each result is stored as a NPZ file named after its key, containing the
+    sampled locations, the distances from them to the coast and the other
+    entries of the result (as JSON), apart from the profile (which only
+    describes the run that made the result). The result which has just been
+    saved is never evicted.
+
+    Copyright 2017 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FLFFC, https://github.com/Guymer/flffc
+    """
+
+    # Import standard modules ...
+    import json
+    import os
+    import pathlib
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Create short-hands and make output folder if it is missing ...
+    dName = f"{pathlib.PosixPath(cacheDir).expanduser()}/results"
+    fName = f"{dName}/{result['key']}.npz"
+    if not os.path.exists(dName):
+        os.makedirs(dName)
+
+    # Save the result ...
+    # NOTE: The result is written to a temporary file first (and then moved)
+    #       so that a partially written result is never loaded.
+    with open(f"{fName}.{os.getpid():d}.tmp", mode = "wb") as fObj:
+        numpy.savez(
+            fObj,
+            dists = result["dists"],
+             lats = result["lats"],
+             lons = result["lons"],
+             meta = numpy.array(
+                json.dumps(
+                    {k : v for k, v in result.items() if k not in ["dists", "lats", "lons", "profile"]},
+                    ensure_ascii = False,
+                       sort_keys = True,
+                )
+            ),
+        )
+    os.replace(f"{fName}.{os.getpid():d}.tmp", fName)
+
+    # Find the size and the last time that each result was used, most recently
+    # used first ...
+    entries = []
+    for entry in os.scandir(dName):
+        if entry.name.endswith(".npz") and entry.path != fName:
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+    entries.sort(reverse = True)
+
+    # Evict the least recently used results which do not fit in the cache ...
+    total = os.path.getsize(fName)                                              # [B]
+    for _, size, path in entries:
+        total += size                                                           # [B]
+        if total > cacheSize:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def submit_plot(
+    dirOut,
+    result,
+    /,
+    *,
+      cacheDir = "~/.cache/flffc",
+     cacheSize = 1073741824,
+         debug = __debug__,
+           eps = 1.0e-12,
+         nIter = 100,
+     onlyValid = False,
+      plotters = 1,
+        raster = False,
+        render = "Scatter",
+        repair = False,
+       timeout = 60.0,
+       useHull = False,
+    verifyHull = False,
+):
+    """Plot the location furthest from the coast in a country in the background
+
+    This function adds an answer (as returned by :func:`flffc.compute`) to a
+    background queue of plots and returns straight away. The queue is worked
+    through by a pool of "plotters" processes, each of which draws the answer
+    (see :func:`flffc.plot`), optimizes the PNG, saves the raster (if
+    requested, see :func:`flffc.save_raster`) and saves the middle of the
+    sampled locations to the cache of results. Call :func:`flffc.flush_plots`
+    to wait for all of the plots to finish.
+
+    Parameters
+    ----------
+    dirOut : str
+        the directory to save the PNG in
+    result : dict
+        the answer (as returned by :func:`flffc.compute`)
+    cacheDir : str, optional
+        the directory to store the cache in
+    cacheSize : int, optional
+        the maximum size of the cache of results (in bytes), if it is zero then
+        results are not saved to the cache
+    debug : bool, optional
+        print debug messages
+    eps : float, optional
+        the tolerance of the Vincenty formula iterations
+    nIter : int, optional
+        the maximum number of iterations (particularly the Vincenty formula)
+    onlyValid : bool, optional
+        only return valid Polygons (checks for validity can take a while, if
+        being called often)
+    plotters : int, optional
+        the number of processes to draw the plots with (this is only used by
+        the first call after the queue has been flushed)
+    raster : bool, optional
+        save the distances as a raster too
+    render : str, optional
+        how to draw the sampled locations ("Scatter" or "PColorMesh")
+    repair : bool, optional
+        attempt to repair invalid Polygons
+    timeout : float, optional
+        the timeout for any requests/subprocess calls (in seconds)
+    useHull : bool, optional
+        find the middle of just the sampled locations which are on their
+        convex hull
+    verifyHull : bool, optional
+        find the middle of all of the sampled locations and of just the ones
+        which are on their convex hull, and warn if they differ
+
+    Returns
+    -------
+    future : concurrent.futures.Future
+        the future of the plot, whose result is the name of the PNG
+
+    Notes
+    -----
+    The processes are started using the "spawn" method, so scripts which call
+    this function must use the ``if __name__ == "__main__":`` idiom, see `the
+    Python documentation
+    <https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods>`_ .
+
+    Copyright 2017 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FLFFC, https://github.com/Guymer/flffc
+    """
+
+    # Import standard modules ...
+    import concurrent.futures
+    import multiprocessing
+
+    # Import sub-functions ...
+    from ._plot_worker import _plot, _queue
+
+    # **************************************************************************
+
+    # Create the pool of plotters (if it does not exist yet) ...
+    if _queue["pool"] is None:
+        _queue["pool"] = concurrent.futures.ProcessPoolExecutor(
+            max_workers = max(1, plotters),
+             mp_context = multiprocessing.get_context("spawn"),
+        )
+
+    # Submit the plot to the pool ...
+    future = _queue["pool"].submit(
+        _plot,
+        dirOut,
+        result,
+        {
+              "cacheDir" : cacheDir,
+             "cacheSize" : cacheSize,
+                 "debug" : debug,
+                   "eps" : eps,
+                 "nIter" : nIter,
+             "onlyValid" : onlyValid,
+                "raster" : raster,
+                "render" : render,
+                "repair" : repair,
+               "timeout" : timeout,
+               "useHull" : useHull,
+            "verifyHull" : verifyHull,
+        },
+    )
+    _queue["futures"].append((result["country"], future))
+
+    # Return answer ...
+    return future
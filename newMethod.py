@@ -5,8 +5,12 @@
 if __name__ == "__main__":
     # Import standard modules ...
     import argparse
+    import concurrent.futures
+    import contextlib
     import copy
+    import functools
     import gzip
+    import multiprocessing
     import os
     import pathlib
 
@@ -41,6 +45,10 @@ if __name__ == "__main__":
         import matplotlib.pyplot
     except:
         raise Exception("\"matplotlib\" is not installed; run \"pip install --user matplotlib\"") from None
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
     try:
         import shapely
         import shapely.geometry
@@ -56,6 +64,11 @@ if __name__ == "__main__":
     except:
         raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
 
+    # Import local modules ...
+    # NOTE: The helper functions are in their own module (next to this script)
+    #       so that the processes in the pool of workers can import them.
+    import newMethodHelpers
+
     # **************************************************************************
 
     # Create argument parser and parse the arguments ...
@@ -64,11 +77,30 @@ if __name__ == "__main__":
             description = "Demonstrate a potential new method.",
         formatter_class = argparse.ArgumentDefaultsHelpFormatter,
     )
+    parser.add_argument(
+        "--adaptive",
+        action = "store_true",
+          help = "find the furthest distance from the coast automatically (by stepping coarsely until there aren't any holes and then bisecting) rather than by calculating the hard-coded ranges of distances (the bisection assumes that the holes only ever shrink as the buffering distance increases, so that there are holes at every distance up to the answer and none beyond it)",
+    )
+    parser.add_argument(
+        "--coarse-step",
+        default = 250,
+           dest = "coarseStep",
+           help = "the buffering distance of each coarse step of the automatic search (in kilometres)",
+           type = int,
+    )
     parser.add_argument(
         "--debug",
         action = "store_true",
           help = "print debug messages",
     )
+    parser.add_argument(
+        "--dist-tolerance",
+        default = 2,
+           dest = "distTol",
+           help = "the width of the bracket of the furthest distance from the coast at which the automatic search stops (in kilometres)",
+           type = int,
+    )
     parser.add_argument(
         "--eps",
         default = 1.0e-12,
@@ -111,11 +143,18 @@ if __name__ == "__main__":
            help = "the maximum number of iterations (particularly the Vincenty formula)",
            type = int,
     )
+    parser.add_argument(
+        "--pruning-factor",
+        default = 0.0,
+           dest = "pruneFact",
+           help = "the multiplication factor to shrink the smallest circle which a shape must contain to have a hole by, relative to the buffering distance (zero turns off pruning, a positive value skips the shapes which are too small to have a hole but the areas and lengths of the shapes are only estimated on a sphere, so a value which is too large may skip shapes which would have had a hole)",
+           type = float,
+    )
     parser.add_argument(
         "--RAM-limit",
         default = 1073741824,
            dest = "ramLimit",
-           help = "the maximum RAM usage of each \"large\" array (in bytes)",
+           help = "the maximum RAM usage of each \"large\" array (in bytes), which is shared equally between the processes",
            type = int,
     )
     parser.add_argument(
@@ -138,8 +177,21 @@ if __name__ == "__main__":
            help = "the Euclidean distance that defines two points as being the same (in degrees)",
            type = float,
     )
+    parser.add_argument(
+        "--workers",
+        default = 1,
+           dest = "workers",
+           help = "the number of processes to buffer the Polygons with",
+           type = int,
+    )
     args = parser.parse_args()
 
+    # Check arguments ...
+    if args.fillFact < 0.0:
+        parser.error(f"argument --fill-factor: must not be negative (not {args.fillFact:.2e})")
+    if args.pruneFact > 0.0 and args.nAng < 3:
+        parser.error(f"argument --nAng: must be at least 3 when pruning (not {args.nAng:d})")
+
     # **************************************************************************
 
     # Create short-hands ...
@@ -147,8 +199,13 @@ if __name__ == "__main__":
     repair = True
 
     # Create short-hands and make output folder if it is missing ...
+    # NOTE: Pruning may skip shapes which would have had a hole (if the pruning
+    #       factor is too large), so the output files of runs which prune are
+    #       kept apart from the output files of runs which do not.
     dName1 = f"newOutput/gshhgRes={args.gshhgRes}"
     dName2 = f"{dName1}/eps={args.eps:.2e}_fillFact=×{args.fillFact:.2e}_nAng={args.nAng:d}_nIter={args.nIter:d}_simpFact=×{args.simpFact:.2e}_tol={args.tol:.2e}°"
+    if args.pruneFact > 0.0:
+        dName2 += f"_pruneFact=×{args.pruneFact:.2e}"
     if not os.path.exists(dName2):
         os.makedirs(dName2)
 
@@ -200,135 +257,288 @@ if __name__ == "__main__":
 
     # **************************************************************************
 
-    # Loop over buffering steps ...
-    for distStep in [
-        250,
-         50,
-         10,
-          2,
-    ]:
-        # Create short-hands ...
-        fill = args.fillFact * float(1000 * distStep)                           # [m]
-        simp = args.simpFact * float(1000 * distStep) / pyguymer3.RESOLUTION_OF_EARTH   # [°]
+    # Define function ...
+    def buffer_level(
+        dName,
+        buffPolys,
+        dist,
+        distStep,
+        /,
+    ):
+        # Create short-hands and skip calculating this distance if the
+        # output files already exist and just load them ...
+        # NOTE: Given how the Polygons were made, we know that there aren't
+        #       any invalid Polygons, so don't bother checking for them.
+        gName = f"{dName}/dist={dist:03d}km.geojson"
+        wName = f"{dName}/dist={dist:03d}km.wkb.gz"
+        if os.path.exists(gName) and os.path.exists(wName):
+            print(f"Loading \"{wName}\" ...")
+            with gzip.open(wName, mode = "rb") as gzObj:
+                return pyguymer3.geo.extract_polys(
+                    shapely.wkb.loads(gzObj.read()),
+                    onlyValid = False,
+                       repair = False,
+                )
 
-        # Set the list of Polygons to be the un-buffered list of Polygons ...
-        buffPolys = copy.copy(polys)
+        print(f"Making \"{wName}\" (and GeoJSON too) ...")
 
-        # Loop over buffering distances ...
-        for dist in range(distStep, 250 + distStep, distStep):
-            # Skip short buffering steps if they are a long away from the known
-            # solution ...
-            if distStep == 50:
-                if dist <   0 or dist > 250:
-                    continue
-            if distStep == 10:
-                if dist < 200 or dist > 250:
-                    continue
-            if distStep == 2:
-                if dist < 220 or dist > 230:
-                    continue
+        # **********************************************************************
 
-            # Create short-hands and skip calculating this distance if the
-            # output files already exist and just load them ...
-            # NOTE: Given how the Polygons were made, we know that there aren't
-            #       any invalid Polygons, so don't bother checking for them.
-            gName = f"{dName2}/dist={dist:03d}km.geojson"
-            wName = f"{dName2}/dist={dist:03d}km.wkb.gz"
-            if os.path.exists(gName) and os.path.exists(wName):
-                print(f"Loading \"{wName}\" ...")
-                with gzip.open(wName, mode = "rb") as gzObj:
-                    buffPolys = pyguymer3.geo.extract_polys(
-                        shapely.wkb.loads(gzObj.read()),
-                        onlyValid = False,
-                           repair = False,
-                    )
+        # Create short-hands ...
+        fill = args.fillFact * float(1000 * distStep)                           # [m]
+        simp = args.simpFact * float(1000 * distStep) / pyguymer3.RESOLUTION_OF_EARTH   # [°]
+        kwargs = {
+               "debug" : args.debug,
+                 "eps" : args.eps,
+                "fill" : fill,
+                "nAng" : args.nAng,
+               "nIter" : args.nIter,
+            "ramLimit" : max(1, args.ramLimit // args.workers),
+                "simp" : simp,
+                 "tol" : args.tol,
+        }
+        nPolys = len(buffPolys)                                                 # [#]
+
+        # Find the number of coordinates in, the length of and the area
+        # inside the exterior ring of each Polygon ...
+        nVerts, lengths, areas = newMethodHelpers.measure(
+            buffPolys,
+            ramLimit = args.ramLimit,
+        )                                                                       # [#], [m], [m2]
+
+        # Find the Polygons which are too small to have a hole ...
+        # NOTE: A Polygon can only have a hole if there is a location inside
+        #       it which is at least "distStep" from its exterior ring, in
+        #       which case its exterior ring surrounds a circle of radius
+        #       "distStep". Therefore, the area inside the exterior ring
+        #       cannot be less than the area of the circle and the exterior
+        #       ring cannot be shorter than the circumference of the circle.
+        #       The circle is shrunk to allow for the circles in the buffer
+        #       being polygons with "nAng" angles and for the areas and
+        #       lengths only being estimates.
+        rad = args.pruneFact * numpy.cos(numpy.pi / float(args.nAng - 1)) * float(1000 * distStep) / pyguymer3.RADIUS_OF_EARTH   # [rad]
+        minArea = 2.0 * numpy.pi * (1.0 - numpy.cos(rad)) * pyguymer3.RADIUS_OF_EARTH ** 2   # [m2]
+        minLength = 2.0 * numpy.pi * numpy.sin(rad) * pyguymer3.RADIUS_OF_EARTH # [m]
+        keep = (areas >= minArea) & (lengths >= minLength)
+
+        print(f"  Skipping {nPolys - int(keep.sum()):,d} of {nPolys:,d} Polygons (they are too small to have a hole) ...")
+
+        # Estimate how long it will take to buffer each Polygon ...
+        # NOTE: The Polygons range from the whole of Eurasia to tiny
+        #       islets, so the number of Polygons which have been buffered
+        #       says very little about how long is left to go.
+        # NOTE: The buffer of a ring is the union of a circle around every
+        #       coordinate of the ring after it has been filled in every
+        #       "fill" metres, so the cost is roughly proportional to the
+        #       number of filled in coordinates.
+        # NOTE: If the rings are not filled in at all then the cost is just
+        #       the number of coordinates in the ring.
+        costs = nVerts.astype(numpy.float64)
+        if fill > 0.0:
+            costs += lengths / fill
+        totalCost = costs[keep].sum()
+
+        # Split the Polygons into jobs, starting with the most expensive
+        # Polygons, where each job is either a single expensive Polygon or
+        # lots of cheap Polygons ...
+        # NOTE: The jobs are started in this order, so a worker which
+        #       finishes a job just takes the next one. This means that no
+        #       worker is left buffering Eurasia on its own at the end.
+        maxCost = totalCost / float(64 * args.workers)
+        jobs = []
+        job = []
+        jobCost = 0.0
+        for iPoly in numpy.argsort(-costs, kind = "stable"):
+            if not keep[iPoly]:
                 continue
-
-            print(f"Making \"{wName}\" (and GeoJSON too) ...")
-
-            # ******************************************************************
-
-            # Initialize list ...
-            holes = []
-
-            # Create short-hands ...
-            nPolys = len(buffPolys)                                             # [#]
+            if job and jobCost + costs[iPoly] > maxCost:
+                jobs.append(job)
+                job = []
+                jobCost = 0.0
+            job.append(int(iPoly))
+            jobCost += costs[iPoly]
+        if job:
+            jobs.append(job)
+
+        # Check if the user wants to use more than one process ...
+        # NOTE: The holes of each Polygon do not depend on any other
+        #       Polygon, so the jobs are spread across a pool of workers.
+        #       The answers are put back into the same order as the
+        #       Polygons, so the output files are identical to the ones
+        #       made using one process.
+        # NOTE: The pool of workers (if there is one) is shut down when the
+        #       "with" block is left, even if one of the workers raises an
+        #       exception.
+        with contextlib.ExitStack() as stack:
+            if args.workers > 1:
+                pool = stack.enter_context(
+                    concurrent.futures.ProcessPoolExecutor(
+                        initializer = functools.partial(
+                            newMethodHelpers.init,
+                            **kwargs,
+                        ),
+                           initargs = (float(1000 * distStep),),
+                        max_workers = args.workers,
+                         mp_context = multiprocessing.get_context("spawn"),
+                    )
+                )
+                futures = {pool.submit(newMethodHelpers.holes_of_polys, [buffPolys[iPoly] for iPoly in job]) : job for job in jobs}
+                answers = ((futures[future], future.result()) for future in concurrent.futures.as_completed(futures))
+            else:
+                newMethodHelpers.init(float(1000 * distStep), **kwargs)
+                answers = ((job, newMethodHelpers.holes_of_polys([buffPolys[iPoly] for iPoly in job])) for job in jobs)
+
+            # Initialize list and start timer ...
+            polyHoles = [[] for _ in range(nPolys)]
+            doneCost = 0.0
             start = pyguymer3.now()
 
-            # Loop over Polygons ...
-            for iPoly, poly in enumerate(buffPolys):
+            # Loop over jobs as they complete ...
+            for job, holesOfPolys in answers:
+                # Store the holes of each Polygon ...
+                for iPoly, holesOfPoly in zip(job, holesOfPolys, strict = True):
+                    polyHoles[iPoly] = holesOfPoly
+                doneCost += costs[job].sum()
+
                 # Print progress ...
+                # NOTE: The progress is weighted by the estimated cost of each
+                #       Polygon rather than by the number of Polygons.
                 # NOTE: The progress string needs padding with extra spaces so
                 #       that the line is fully overwritten when it inevitably
                 #       gets shorter (as the remaining time gets shorter).
                 #       Assume that the longest it will ever be is
                 #       "???.???% (~??h ??m ??.?s still to go)" (which is 37
                 #       characters).
-                fraction = float(iPoly + 1) / float(nPolys)
-                durationSoFar = pyguymer3.now() - start
-                totalDuration = durationSoFar / fraction
-                remaining = (totalDuration - durationSoFar).total_seconds()     # [s]
-                progress = f"{100.0 * fraction:.3f}% (~{pyguymer3.convert_seconds_to_pretty_time(remaining)} still to go)"
+                # NOTE: The fraction cannot be found if the total cost is zero
+                #       or not finite.
+                if 0.0 < totalCost < numpy.inf and doneCost > 0.0:
+                    fraction = doneCost / totalCost
+                    durationSoFar = pyguymer3.now() - start
+                    totalDuration = durationSoFar / fraction
+                    remaining = (totalDuration - durationSoFar).total_seconds() # [s]
+                    progress = f"{100.0 * fraction:.3f}% (~{pyguymer3.convert_seconds_to_pretty_time(remaining)} still to go)"
+                else:
+                    progress = "???.???%"
                 print(f"  Buffering Polygons ... {progress:37s}", end = "\r")
 
-                # Loop over the Polygons in the buffer of the Polygon ...
-                # NOTE: Given how the buffer is made, we know that there aren't
-                #       any invalid Polygons, so don't bother checking for them.
-                for buffPoly in pyguymer3.geo.extract_polys(
-                    pyguymer3.geo.buffer(
-                        poly.exterior,
-                        float(1000 * distStep),
-                                debug = args.debug,
-                                  eps = args.eps,
-                                 fill = fill,
-                            fillSpace = "GeodesicSpace",
-                        keepInteriors = True,
-                                 nAng = args.nAng,
-                                nIter = args.nIter,
-                             ramLimit = args.ramLimit,
-                                 simp = simp,
-                                  tol = args.tol,
-                    ),
-                    onlyValid = False,
-                       repair = False,
-                ):
-                    # Loop over interior rings ...
-                    for interior in buffPoly.interiors:
-                        # Convert LinearRing to Polygon and skip this hole if it
-                        # is outside the original Polygon ...
-                        hole = shapely.geometry.polygon.Polygon(interior)
-                        if hole.disjoint(poly):
-                            continue
-
-                        # Append Polygon to list ...
-                        holes.append(hole)
-
-            # Clear the line ...
-            print()
-
-            # Convert list of Polygons to a MultiPolygon ...
-            multiHoles = shapely.geometry.multipolygon.MultiPolygon(holes)
-
-            # Save MultiPolygon ...
-            with gzip.open(wName, mode = "wb", compresslevel = 9) as gzObj:
-                gzObj.write(shapely.wkb.dumps(multiHoles))
-
-            # Save MultiPolygon ...
-            with open(gName, mode = "wt", encoding = "utf-8") as fObj:
-                geojson.dump(
-                    multiHoles,
-                    fObj,
-                    ensure_ascii = False,
-                          indent = 4,
-                       sort_keys = True,
-                )
+        # Join the holes of each Polygon together (in the same order as the
+        # Polygons) ...
+        holes = [hole for holesOfPoly in polyHoles for hole in holesOfPoly]
 
-            # Clean up ...
-            del multiHoles
+        # Clear the line ...
+        print()
 
-            # ******************************************************************
+        # Convert list of Polygons to a MultiPolygon ...
+        multiHoles = shapely.geometry.multipolygon.MultiPolygon(holes)
 
-            # Replace the old list of Polygons with the new list of Polygons and
-            # clean up ...
-            buffPolys = copy.copy(holes)
-            del holes
+        # Save MultiPolygon ...
+        with gzip.open(wName, mode = "wb", compresslevel = 9) as gzObj:
+            gzObj.write(shapely.wkb.dumps(multiHoles))
+
+        # Save MultiPolygon ...
+        with open(gName, mode = "wt", encoding = "utf-8") as fObj:
+            geojson.dump(
+                multiHoles,
+                fObj,
+                ensure_ascii = False,
+                      indent = 4,
+                   sort_keys = True,
+            )
+
+        # Clean up ...
+        del multiHoles
+
+        # Return answer ...
+        return holes
+
+    # **************************************************************************
+
+    # Check if the user wants to find the distance automatically ...
+    if args.adaptive:
+        # Create short-hand and make output folder if it is missing ...
+        # NOTE: The holes at each distance depend on the buffering steps which
+        #       were taken to reach it (as "fill", "simp" and the pruning all
+        #       depend on the step), so the automatic search cannot share the
+        #       output files of the hard-coded ranges of distances. The steps
+        #       which it takes only depend on the coarse step.
+        dName3 = f"{dName2}/adaptive_coarseStep={max(1, args.coarseStep):d}km"
+        if not os.path.exists(dName3):
+            os.makedirs(dName3)
+
+        # Initialize the bracket ...
+        # NOTE: "distLo" is the furthest distance which is known to have holes
+        #       (which are "polysLo") and "distHi" is the nearest distance which
+        #       is known to not have any holes.
+        distLo = 0                                                              # [km]
+        distHi = None                                                           # [km]
+        polysLo = copy.copy(polys)
+
+        # Loop until the bracket is narrow enough ...
+        # NOTE: The number of buffering steps only depends on how many coarse
+        #       steps it takes to get past the answer and on the logarithm of
+        #       the ratio of the coarse step to the tolerance.
+        while distHi is None or distHi - distLo > max(1, args.distTol):
+            # Step coarsely until there aren't any holes, then bisect the
+            # bracket ...
+            if distHi is None:
+                distStep = max(1, args.coarseStep)                              # [km]
+            else:
+                distStep = (distHi - distLo) // 2                               # [km]
+            dist = distLo + distStep                                            # [km]
+
+            # Buffer the holes at the bottom of the bracket and update the
+            # bracket ...
+            holes = buffer_level(dName3, polysLo, dist, distStep)
+            if holes:
+                distLo = dist                                                   # [km]
+                polysLo = holes
+            else:
+                distHi = dist                                                   # [km]
+
+        print(f"The furthest that you can get from the coast is between {distLo:,d} km and {distHi:,d} km.")
+    else:
+        # Loop over buffering steps (and the range of distances which are
+        # worth calculating with each step, given the known solution) ...
+        for distStep, distMin, distMax in [
+            (250,   0, 250),
+            ( 50,   0, 250),
+            ( 10, 200, 250),
+            (  2, 220, 230),
+        ]:
+            # Set the list of Polygons to be the un-buffered list of Polygons
+            # ...
+            buffPolys = copy.copy(polys)
+            distStart = 0                                                       # [km]
+
+            # Loop over the distances which this step could start from
+            # (furthest first) ...
+            # NOTE: The distances are a whole number of steps short of the start
+            #       of the range, so that every distance in the range is
+            #       reached.
+            for dist in range(distMin, 0, -distStep):
+                # Skip this distance if it has not been calculated yet (by this
+                # step or by a coarser step) ...
+                wName = f"{dName2}/dist={dist:03d}km.wkb.gz"
+                if not os.path.exists(f"{dName2}/dist={dist:03d}km.geojson") or not os.path.exists(wName):
+                    continue
+
+                # Start from this distance instead of from the coastline ...
+                # NOTE: Given how the Polygons were made, we know that there
+                #       aren't any invalid Polygons, so don't bother checking
+                #       for them.
+                print(f"Starting from \"{wName}\" ...")
+                with gzip.open(wName, mode = "rb") as gzObj:
+                    buffPolys = pyguymer3.geo.extract_polys(
+                        shapely.wkb.loads(gzObj.read()),
+                        onlyValid = False,
+                           repair = False,
+                    )
+                distStart = dist                                                # [km]
+                break
+
+            # Loop over buffering distances ...
+            # NOTE: If the step could not start from an existing distance then
+            #       the distances before the start of the range are calculated
+            #       too, as they are needed to reach it.
+            for dist in range(distStart + distStep, distMax + distStep, distStep):
+                buffPolys = buffer_level(dName2, buffPolys, dist, distStep)
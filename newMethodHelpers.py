@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+
+# Initialize the buffering settings which are shared by all of the jobs in this
+# process ...
+_settings = {}
+
+# Define function ...
+def init(
+    dist,
+    /,
+    *,
+       debug = __debug__,
+         eps = 1.0e-12,
+        fill = 1.0,
+        nAng = 9,
+       nIter = 100,
+    ramLimit = 1073741824,
+        simp = 0.1,
+         tol = 1.0e-10,
+):
+    # Store the buffering settings for this process ...
+    # NOTE: This is called once per process, so the settings are only pickled
+    #       once per process rather than once per job.
+    _settings.clear()
+    _settings.update(
+        {
+               "debug" : debug,
+                "dist" : dist,
+                 "eps" : eps,
+                "fill" : fill,
+                "nAng" : nAng,
+               "nIter" : nIter,
+            "ramLimit" : ramLimit,
+                "simp" : simp,
+                 "tol" : tol,
+        }
+    )
+
+# Define function ...
+def holes(
+    poly,
+    /,
+):
+    # Import special modules ...
+    try:
+        import shapely
+        import shapely.geometry
+    except:
+        raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+        import pyguymer3.geo
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # **************************************************************************
+
+    # Initialize list ...
+    polyHoles = []
+
+    # Loop over the Polygons in the buffer of the Polygon ...
+    # NOTE: Given how the buffer is made, we know that there aren't any invalid
+    #       Polygons, so don't bother checking for them.
+    for buffPoly in pyguymer3.geo.extract_polys(
+        pyguymer3.geo.buffer(
+            poly.exterior,
+            _settings["dist"],
+                    debug = _settings["debug"],
+                      eps = _settings["eps"],
+                     fill = _settings["fill"],
+                fillSpace = "GeodesicSpace",
+            keepInteriors = True,
+                     nAng = _settings["nAng"],
+                    nIter = _settings["nIter"],
+                 ramLimit = _settings["ramLimit"],
+                     simp = _settings["simp"],
+                      tol = _settings["tol"],
+        ),
+        onlyValid = False,
+           repair = False,
+    ):
+        # Loop over interior rings ...
+        for interior in buffPoly.interiors:
+            # Convert LinearRing to Polygon and skip this hole if it is outside
+            # the original Polygon ...
+            hole = shapely.geometry.polygon.Polygon(interior)
+            if hole.disjoint(poly):
+                continue
+
+            # Append Polygon to list ...
+            polyHoles.append(hole)
+
+    # Return answer ...
+    return polyHoles
+
+# Define function ...
+def holes_of_polys(
+    polys,
+    /,
+):
+    # Return answer ...
+    return [holes(poly) for poly in polys]
+
+# Define function ...
+def measure(
+    polys,
+    /,
+    *,
+    ramLimit = 1073741824,
+):
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+    try:
+        import flffc
+    except:
+        raise Exception("\"flffc\" is not installed; run \"pip install --user flffc\"") from None
+
+    # **************************************************************************
+
+    # Return early if there is nothing to do ...
+    if not polys:
+        return numpy.zeros(0, dtype = numpy.int64), numpy.zeros(0, dtype = numpy.float64), numpy.zeros(0, dtype = numpy.float64)
+
+    # Join the exterior rings of all of the Polygons together ...
+    coords = [numpy.array(poly.exterior.coords) for poly in polys]
+    nVerts = numpy.array([coord.shape[0] for coord in coords], dtype = numpy.int64)   # [#]
+    coords = numpy.concatenate(coords)
+
+    # Find the length of every segment (in blocks, to limit the RAM usage) ...
+    # NOTE: The lengths do not need to be exact, so the great-circle distance
+    #       is used.
+    nPair = max(1, ramLimit // (32 * 8))                                        # [#]
+    dists = numpy.zeros(coords.shape[0] - 1, dtype = numpy.float64)             # [m]
+    for i in range(0, dists.size, nPair):
+        j = min(i + nPair, dists.size)
+        dists[i:j] = flffc.calc_dists_between_locs(
+            coords[i:j, 0],
+            coords[i:j, 1],
+            coords[i + 1:j + 1, 0],
+            coords[i + 1:j + 1, 1],
+            backend = "Haversine",
+        )                                                                       # [m]
+
+    # Find the area under every segment in the Lambert cylindrical equal-area
+    # projection (on a sphere) ...
+    # NOTE: The areas do not need to be exact either, so each segment is
+    #       treated as a straight line in the projection rather than as a
+    #       Geodesic.
+    x = numpy.radians(coords[:, 0])                                             # [rad]
+    y = numpy.sin(numpy.radians(coords[:, 1]))
+    areas = 0.5 * (x[1:] - x[:-1]) * (y[1:] + y[:-1]) * pyguymer3.RADIUS_OF_EARTH ** 2   # [m2]
+
+    # Remove the segments which join the end of one ring to the start of the
+    # next ring and find the length of, and the area inside, each ring ...
+    ends = numpy.cumsum(nVerts)                                                 # [#]
+    dists[ends[:-1] - 1] = 0.0                                                  # [m]
+    areas[ends[:-1] - 1] = 0.0                                                  # [m2]
+    lengths = numpy.add.reduceat(dists, ends - nVerts)                          # [m]
+    areas = numpy.abs(numpy.add.reduceat(areas, ends - nVerts))                 # [m2]
+
+    # Return answers ...
+    return nVerts, lengths, areas
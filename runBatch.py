@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import argparse
+    import os
+
+    # Import my modules ...
+    try:
+        import flffc
+    except:
+        raise Exception("\"flffc\" is not installed; run \"pip install --user flffc\"") from None
+
+    # **************************************************************************
+
+    # Create argument parser and parse the arguments ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Find the location furthest from the coast in lots of countries.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--backend",
+        choices = [
+            "AndoyerLambert",
+            "Haversine",
+            "Hybrid",
+            "Karney",
+            "Vincenty",
+        ],
+        default = "Vincenty",
+           dest = "backend",
+           help = "the formula to use for the distances",
+           type = str,
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default = "~/.cache/flffc",
+           dest = "cacheDir",
+           help = "the directory to store the cache of countries in",
+           type = str,
+    )
+    parser.add_argument(
+        "--cache-size",
+        default = 1073741824,
+           dest = "cacheSize",
+           help = "the maximum size of the cache of results (in bytes), if it is zero then results are neither loaded from nor saved to the cache",
+           type = int,
+    )
+    parser.add_argument(
+        "--cascade",
+        action = "store_true",
+          dest = "cascade",
+          help = "use the coasts of the countries in the 110m and 50m Natural Earth Shapefiles to discard the sampled locations which cannot be the furthest from the coast",
+    )
+    parser.add_argument(
+        "--conv",
+        default = 1000.0,
+           dest = "conv",
+           help = "the distance that defines the branch-and-bound search as being converged (in metres)",
+           type = float,
+    )
+    parser.add_argument(
+        "--countries",
+        default = None,
+           dest = "countries",
+           help = "the names of the countries (if not provided then all of the countries are done)",
+          nargs = "+",
+           type = str,
+    )
+    parser.add_argument(
+        "--debug",
+        action = "store_true",
+          help = "print debug messages",
+    )
+    parser.add_argument(
+        "--density",
+        default = 1.0,
+           dest = "density",
+           help = "the number of locations per 1,000 km² in the Fibonacci lattice",
+           type = float,
+    )
+    parser.add_argument(
+        "--dtype",
+        choices = [
+            "float32",
+            "float64",
+        ],
+        default = "float64",
+           dest = "dtype",
+           help = "the type of the arrays of the sampled locations and their distances which are cached",
+           type = str,
+    )
+    parser.add_argument(
+        "--eps",
+        default = 1.0e-12,
+           dest = "eps",
+           help = "the tolerance of the Vincenty formula iterations",
+           type = float,
+    )
+    parser.add_argument(
+        "--method",
+        choices = [
+            "BranchAndBound",
+            "FibonacciLattice",
+            "PolygonGrid",
+            "UniformGrid",
+        ],
+        default = "UniformGrid",
+           dest = "method",
+           help = "the method for finding the location",
+           type = str,
+    )
+    parser.add_argument(
+        "--nIter",
+        default = 100,
+           dest = "nIter",
+           help = "the maximum number of iterations (particularly the Vincenty formula)",
+           type = int,
+    )
+    parser.add_argument(
+        "--only-valid",
+        action = "store_true",
+          dest = "onlyValid",
+          help = "only use valid Polygons",
+    )
+    parser.add_argument(
+        "--output",
+        default = "batchOutput/results.ndjson",
+           dest = "fname",
+           help = "the name of the output file (a CSV file if it ends in \".csv\", otherwise a newline-delimited JSON file)",
+           type = str,
+    )
+    parser.add_argument(
+        "--plot-dir",
+        default = None,
+           dest = "dirOut",
+           help = "the directory to save the PNGs in (if not provided then no PNGs are made)",
+           type = str,
+    )
+    parser.add_argument(
+        "--plotters",
+        default = 1,
+           dest = "plotters",
+           help = "the number of processes to make the PNGs with (in the background)",
+           type = int,
+    )
+    parser.add_argument(
+        "--profile",
+        action = "store_true",
+          help = "record how long each phase takes and how much memory it uses, and save it as a JSON file next to each PNG",
+    )
+    parser.add_argument(
+        "--prune",
+        action = "store_true",
+          dest = "prune",
+          help = "stop calculating the distance from a sampled location to the coast as soon as it cannot be the furthest from the coast",
+    )
+    parser.add_argument(
+        "--RAM-limit",
+        default = 1073741824,
+           dest = "ramLimit",
+           help = "the maximum RAM usage of each \"large\" array (in bytes), which is shared equally between the processes",
+           type = int,
+    )
+    parser.add_argument(
+        "--raster",
+        action = "store_true",
+          help = "save the distances as rasters too (next to the PNGs, so --plot-dir is needed)",
+    )
+    parser.add_argument(
+        "--render",
+        choices = [
+            "PColorMesh",
+            "Scatter",
+        ],
+        default = "Scatter",
+           dest = "render",
+           help = "how to draw the sampled locations",
+           type = str,
+    )
+    parser.add_argument(
+        "--repair",
+        action = "store_true",
+          help = "attempt to repair invalid Polygons",
+    )
+    parser.add_argument(
+        "--steps",
+        default = 50,
+           dest = "steps",
+           help = "the number of longitudes and latitudes in the uniform grid",
+           type = int,
+    )
+    parser.add_argument(
+        "--timeout",
+        default = 60.0,
+           dest = "timeout",
+           help = "the timeout for any requests/subprocess calls (in seconds)",
+           type = float,
+    )
+    parser.add_argument(
+        "--use-hull",
+        action = "store_true",
+          dest = "useHull",
+          help = "find the middle of just the sampled locations which are on their convex hull",
+    )
+    parser.add_argument(
+        "--use-KD-tree",
+        action = "store_true",
+          dest = "useKDTree",
+          help = "use a KD-tree to find the nearest coordinates of the coast",
+    )
+    parser.add_argument(
+        "--verify-hull",
+        action = "store_true",
+          dest = "verifyHull",
+          help = "find the middle of all of the sampled locations and of just the ones which are on their convex hull, and warn if they differ",
+    )
+    parser.add_argument(
+        "--workers",
+        default = os.cpu_count(),
+           dest = "workers",
+           help = "the number of processes to spread the countries across",
+           type = int,
+    )
+    args = parser.parse_args()
+
+    # Check arguments ...
+    if args.conv <= 0.0:
+        parser.error(f"argument --conv: must be positive (not {args.conv:.2e})")
+    if args.raster and args.dirOut is None:
+        parser.error("argument --raster: not allowed without --plot-dir")
+    if args.method != "UniformGrid":
+        if args.raster:
+            parser.error(f"argument --raster: not allowed with --method {args.method}")
+        if args.render == "PColorMesh":
+            parser.error(f"argument --render: PColorMesh is not allowed with --method {args.method}")
+
+    # **************************************************************************
+
+    # Find the location furthest from the coast in lots of countries ...
+    flffc.batch(
+        args.fname,
+           backend = args.backend,
+          cacheDir = args.cacheDir,
+         cacheSize = args.cacheSize,
+           cascade = args.cascade,
+              conv = args.conv,
+         countries = args.countries,
+             debug = args.debug,
+           density = args.density,
+            dirOut = args.dirOut,
+             dtype = args.dtype,
+               eps = args.eps,
+            method = args.method,
+             nIter = args.nIter,
+         onlyValid = args.onlyValid,
+          plotters = args.plotters,
+           profile = args.profile,
+             prune = args.prune,
+          ramLimit = args.ramLimit,
+            raster = args.raster,
+            render = args.render,
+            repair = args.repair,
+             steps = args.steps,
+           timeout = args.timeout,
+           useHull = args.useHull,
+         useKDTree = args.useKDTree,
+        verifyHull = args.verifyHull,
+           workers = args.workers,
+    )
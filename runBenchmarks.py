@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import argparse
+    import datetime
+    import json
+    import os
+    import pathlib
+    import platform
+    import statistics
+    import tempfile
+
+    # Import special modules ...
+    try:
+        import cartopy
+        cartopy.config.update(
+            {
+                "cache_dir" : pathlib.PosixPath("~/.local/share/cartopy").expanduser(),
+            }
+        )
+    except:
+        raise Exception("\"cartopy\" is not installed; run \"pip install --user Cartopy\"") from None
+    try:
+        import geojson
+    except:
+        raise Exception("\"geojson\" is not installed; run \"pip install --user geojson\"") from None
+    try:
+        import shapefile
+    except:
+        raise Exception("\"shapefile\" is not installed; run \"pip install --user pyshp\"") from None
+    try:
+        import shapely
+        import shapely.geometry
+    except:
+        raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+    # Import my modules ...
+    try:
+        import flffc
+    except:
+        raise Exception("\"flffc\" is not installed; run \"pip install --user flffc\"") from None
+
+    # **************************************************************************
+
+    # Create argument parser and parse the arguments ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Time how long it takes to find the location furthest from the coast in some small countries (without needing an internet connection).",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--backend",
+        choices = [
+            "AndoyerLambert",
+            "Haversine",
+            "Hybrid",
+            "Karney",
+            "Vincenty",
+        ],
+        default = "Vincenty",
+           dest = "backend",
+           help = "the formula to use for the distances",
+           type = str,
+    )
+    parser.add_argument(
+        "--countries",
+        default = None,
+           dest = "countries",
+           help = "the names of the countries (if not provided then all of the countries in the GeoJSON file are done)",
+          nargs = "+",
+           type = str,
+    )
+    parser.add_argument(
+        "--debug",
+        action = "store_true",
+          help = "print debug messages",
+    )
+    parser.add_argument(
+        "--geojson",
+        default = f"{os.path.dirname(os.path.abspath(__file__))}/benchmarks/countries.geojson",
+           dest = "gName",
+           help = "the GeoJSON file of the countries (each Feature must have a \"NAME\" property)",
+           type = str,
+    )
+    parser.add_argument(
+        "--history",
+        default = f"{os.path.dirname(os.path.abspath(__file__))}/benchmarks/history.ndjson",
+           dest = "hName",
+           help = "the newline-delimited JSON file to add the timings to (and to compare the timings with)",
+           type = str,
+    )
+    parser.add_argument(
+        "--max-slowdown",
+        default = 1.25,
+           dest = "maxSlowdown",
+           help = "the largest ratio of the new timing to the previous timing (of the same country, with the same parameters and on the same computer) which is allowed",
+           type = float,
+    )
+    parser.add_argument(
+        "--prune",
+        action = "store_true",
+          dest = "prune",
+          help = "stop calculating the distance from a sampled location to the coast as soon as it cannot be the furthest from the coast",
+    )
+    parser.add_argument(
+        "--RAM-limit",
+        default = 1073741824,
+           dest = "ramLimit",
+           help = "the maximum RAM usage of each \"large\" array (in bytes)",
+           type = int,
+    )
+    parser.add_argument(
+        "--repeats",
+        default = 3,
+           dest = "repeats",
+           help = "the number of times to time each country (the fastest time is used)",
+           type = int,
+    )
+    parser.add_argument(
+        "--steps",
+        default = [
+            25,
+            50,
+            100,
+        ],
+           dest = "steps",
+           help = "the numbers of longitudes and latitudes in the uniform grid",
+          nargs = "+",
+           type = int,
+    )
+    parser.add_argument(
+        "--use-KD-tree",
+        action = "store_true",
+          dest = "useKDTree",
+          help = "use a KD-tree to find the nearest coordinates of the coast",
+    )
+    parser.add_argument(
+        "--workers",
+        default = 1,
+           dest = "workers",
+           help = "the number of processes to spread the points of the uniform grid across",
+           type = int,
+    )
+    args = parser.parse_args()
+
+    # Check arguments ...
+    if args.prune and args.workers > 1:
+        parser.error("argument --prune: not allowed with more than one worker")
+
+    # **************************************************************************
+
+    # Create short-hands ...
+    # NOTE: Only previous timings which were made with exactly the same
+    #       parameters on the same computer are compared with the new timings.
+    kwargs = {
+          "backend" : args.backend,
+            "prune" : args.prune,
+         "ramLimit" : args.ramLimit,
+        "useKDTree" : args.useKDTree,
+          "workers" : args.workers,
+    }
+    machine = {
+            "host" : platform.node(),
+         "machine" : platform.machine(),
+          "python" : platform.python_version(),
+    }
+
+    # Load the countries ...
+    with open(args.gName, mode = "rt", encoding = "utf-8") as fObj:
+        features = geojson.load(fObj)["features"]
+    if args.countries is None:
+        args.countries = [feature["properties"]["NAME"] for feature in features]
+
+    # Load the previous timings (if there are any) ...
+    history = []
+    if os.path.exists(args.hName):
+        with open(args.hName, mode = "rt", encoding = "utf-8") as fObj:
+            for line in fObj:
+                if line.strip():
+                    history.append(json.loads(line))
+
+    # Make output directory ...
+    if os.path.dirname(args.hName) and not os.path.exists(os.path.dirname(args.hName)):
+        os.makedirs(os.path.dirname(args.hName))
+
+    # Initialize list ...
+    failures = []
+
+    # Create a temporary directory which contains both the Shapefile and the
+    # cache of countries ...
+    # NOTE: The Shapefile is saved where cartopy looks for pre-existing Natural
+    #       Earth Shapefiles, so that it is found instead of downloading the
+    #       real one, and the cache of countries is kept separate from the
+    #       user's real cache so that neither of them is re-made.
+    with tempfile.TemporaryDirectory(prefix = "flffc.") as dName:
+        # Save the countries as a Natural Earth-style Shapefile ...
+        sfile = f"{dName}/shapefiles/natural_earth/cultural/ne_10m_admin_0_countries.shp"
+        os.makedirs(os.path.dirname(sfile))
+        with shapefile.Writer(sfile) as sObj:
+            sObj.field("NAME", "C")
+            for feature in features:
+                sObj.shape(shapely.geometry.shape(feature["geometry"]).__geo_interface__)
+                sObj.record(feature["properties"]["NAME"])
+        cartopy.config["pre_existing_data_dir"] = pathlib.PosixPath(dName)
+
+        # Loop over countries ...
+        for country in args.countries:
+            # Make the cache of this country (so that the first timing is not
+            # slower than the others) ...
+            if flffc.compute(
+                country,
+                 cacheDir = f"{dName}/cache",
+                cacheSize = 0,
+                    debug = args.debug,
+                    steps = min(args.steps),
+                 **kwargs,
+            ) is None:
+                print(f"WARNING: Skipping \"{country}\" (it is not in \"{args.gName}\").")
+                continue
+
+            # Loop over steps ...
+            for steps in args.steps:
+                # Time how long it takes to find the location furthest from the
+                # coast several times ...
+                # NOTE: The cache of results is turned off so that the location
+                #       is found every time.
+                timings = []                                                    # [s]
+                for _ in range(args.repeats):
+                    result = flffc.compute(
+                        country,
+                         cacheDir = f"{dName}/cache",
+                        cacheSize = 0,
+                            debug = args.debug,
+                            steps = steps,
+                         **kwargs,
+                    )
+                    timings.append(result["timings"]["find [s]"])
+
+                # Create the record ...
+                record = {
+                    "bestDist [m]" : result["bestDist"],
+                         "country" : country,
+                            "date" : datetime.datetime.now(tz = datetime.UTC).isoformat(),
+                        "find [s]" : {
+                        "fastest" : min(timings),                               # [s]
+                         "median" : statistics.median(timings),                 # [s]
+                    },
+                          "kwargs" : kwargs,
+                         "machine" : machine,
+                          "method" : "UniformGrid",
+                      "points [#]" : int(result["lons"].size),
+                        "slowdown" : None,
+                           "steps" : steps,
+                }
+
+                # Find the most recent previous timing which was made with
+                # exactly the same parameters on the same computer and which
+                # was not too slow ...
+                for previous in reversed(history):
+                    if previous["country"] != country or previous["steps"] != steps:
+                        continue
+                    if previous["kwargs"] != kwargs or previous["machine"] != machine:
+                        continue
+                    if previous["slowdown"] is not None and previous["slowdown"] > args.maxSlowdown:
+                        continue
+
+                    # Compare the new timing with the previous timing ...
+                    record["slowdown"] = record["find [s]"]["fastest"] / previous["find [s]"]["fastest"]
+                    if record["slowdown"] > args.maxSlowdown:
+                        failures.append(f"{country} with {steps:d} steps ({record['slowdown']:.2f}x)")
+                    if record["bestDist [m]"] != previous["bestDist [m]"]:
+                        print(f"WARNING: The furthest distance from the coast in {country} with {steps:d} steps has changed from {previous['bestDist [m]']:.6f} m to {record['bestDist [m]']:.6f} m.")
+                    break
+
+                if record["slowdown"] is None:
+                    print(f"{country} with {steps:d} steps ({record['points [#]']:,d} points) took {record['find [s]']['fastest']:.3f} s.")
+                else:
+                    print(f"{country} with {steps:d} steps ({record['points [#]']:,d} points) took {record['find [s]']['fastest']:.3f} s ({record['slowdown']:.2f}x the previous timing).")
+
+                # Add the record to the history ...
+                history.append(record)
+                with open(args.hName, mode = "at", encoding = "utf-8") as fObj:
+                    json.dump(
+                        record,
+                        fObj,
+                        ensure_ascii = False,
+                           sort_keys = True,
+                    )
+                    fObj.write("\n")
+
+    # Fail if any of the timings were too slow ...
+    if failures:
+        raise Exception(f"the following timings are more than {args.maxSlowdown:.2f}x the previous timings: {', '.join(failures)}")
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+# Import standard modules ...
+import functools
+import json
+import os
+
+# Import special modules ...
+try:
+    import cartopy
+except:
+    raise Exception("\"cartopy\" is not installed; run \"pip install --user Cartopy\"") from None
+try:
+    import pytest
+except:
+    raise Exception("\"pytest\" is not installed; run \"pip install --user pytest\"") from None
+try:
+    import shapefile
+except:
+    raise Exception("\"shapefile\" is not installed; run \"pip install --user pyshp\"") from None
+try:
+    import shapely
+    import shapely.geometry
+except:
+    raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+# Import my modules ...
+try:
+    import flffc
+except:
+    raise Exception("\"flffc\" is not installed; run \"pip install --user flffc\"") from None
+
+# ******************************************************************************
+
+# Load the countries which are used for the benchmarks ...
+gName = f"{os.path.dirname(os.path.abspath(__file__))}/../benchmarks/countries.geojson"
+with open(gName, mode = "rt", encoding = "utf-8") as fObj:
+    features = json.load(fObj)["features"]
+geoms = {
+    feature["properties"]["NAME"] : shapely.geometry.shape(feature["geometry"])
+    for feature in features
+}
+
+# ******************************************************************************
+
+# Define function ...
+def pytest_generate_tests(
+    metafunc,
+):
+    # Run each test which needs a country once for every country (unless the
+    # test chooses its own countries) ...
+    chosen = [marker.args[0] for marker in metafunc.definition.iter_markers("parametrize")]
+    if "country" in metafunc.fixturenames and "country" not in chosen:
+        metafunc.parametrize("country", sorted(geoms))
+
+# Define fixture ...
+@pytest.fixture
+def geom(
+    country,
+):
+    # Return answer ...
+    return geoms[country]
+
+# Define fixture ...
+@pytest.fixture
+def coast(
+    geom,
+):
+    # Return answer ...
+    return flffc.extract_coast(geom)
+
+# Define fixture ...
+@pytest.fixture
+def find(
+    geom,
+):
+    # Return a function which finds the location furthest from the coast of the
+    # country (with a small grid, so that the tests are quick) ...
+    return functools.partial(
+        flffc.find_furthest,
+        geom,
+        debug = False,
+        steps = 25,
+    )
+
+# Define fixture ...
+@pytest.fixture(scope = "session")
+def naturalEarth(
+    tmp_path_factory,
+):
+    # Save the countries as a Natural Earth-style Shapefile ...
+    dName = tmp_path_factory.mktemp("naturalEarth")
+    sfile = f"{dName}/shapefiles/natural_earth/cultural/ne_10m_admin_0_countries.shp"
+    os.makedirs(os.path.dirname(sfile))
+    with shapefile.Writer(sfile) as sObj:
+        sObj.field("NAME", "C")
+        for feature in features:
+            sObj.shape(shapely.geometry.shape(feature["geometry"]).__geo_interface__)
+            sObj.record(feature["properties"]["NAME"])
+
+    # Tell cartopy to look for pre-existing Natural Earth Shapefiles in the
+    # directory, so that it is found instead of downloading the real one ...
+    # NOTE: The environment variable is set too, so that processes which are
+    #       spawned find it as well.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(cartopy.config, "pre_existing_data_dir", dName)
+        mp.setenv("CARTOPY_DATA_DIR", str(dName))
+        yield dName
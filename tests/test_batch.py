@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+# Import standard modules ...
+import csv
+import json
+
+# Import special modules ...
+try:
+    import pytest
+except:
+    raise Exception("\"pytest\" is not installed; run \"pip install --user pytest\"") from None
+
+# Import my modules ...
+try:
+    import flffc
+except:
+    raise Exception("\"flffc\" is not installed; run \"pip install --user flffc\"") from None
+
+# ******************************************************************************
+
+# Define test ...
+@pytest.mark.parametrize("ext", [".csv", ".ndjson"])
+@pytest.mark.parametrize("workers", [1, 2])
+def test_batch(
+    naturalEarth,
+    tmp_path,
+    ext,
+    workers,
+):
+    # Find the location furthest from the coast in every country (and in one
+    # which does not exist) ...
+    fname = f"{tmp_path}/batch{ext}"
+    results = flffc.batch(
+        fname,
+         cacheDir = f"{tmp_path}/cache",
+        cacheSize = 0,
+        countries = ["Discland", "Nowhere", "Ringland", "United Kingdom"],
+            debug = False,
+            steps = 25,
+          workers = workers,
+    )
+
+    # Load the output file ...
+    with open(fname, mode = "rt", encoding = "utf-8", newline = "") as fObj:
+        if ext == ".csv":
+            rows = list(csv.DictReader(fObj))
+        else:
+            rows = [json.loads(line) for line in fObj]
+
+    # Check that each country which exists was done once and that the output
+    # file matches what was returned ...
+    assert sorted(row["country"] for row in rows) == ["Discland", "Ringland", "United Kingdom"]
+    assert sorted(result["country"] for result in results) == ["Discland", "Ringland", "United Kingdom"]
+    for row in rows:
+        result = next(result for result in results if result["country"] == row["country"])
+        assert float(row["distance [km]"]) == result["distance [km]"]
+        assert float(row["latitude [°]"]) == result["latitude [°]"]
+        assert float(row["longitude [°]"]) == result["longitude [°]"]
+        assert int(row["points [#]"]) == result["points [#]"]
+
+    # Check that each answer is the same as finding the location in just that
+    # country ...
+    for result in results:
+        assert result["error"] is None
+        answer = flffc.compute(
+            result["country"],
+             cacheDir = f"{tmp_path}/cache",
+            cacheSize = 0,
+                debug = False,
+                steps = 25,
+        )
+        assert result["distance [km]"] == answer["bestDist"] / 1000.0
+        assert result["latitude [°]"] == answer["bestLat"]
+        assert result["longitude [°]"] == answer["bestLon"]
+        assert result["points [#]"] == answer["lons"].size
+
+# Define test ...
+def test_batch_error(
+    naturalEarth,
+    tmp_path,
+):
+    # Check that a country which fails records the error and that the others
+    # carry on ...
+    results = flffc.batch(
+        f"{tmp_path}/batch.ndjson",
+         cacheDir = f"{tmp_path}/cache",
+        cacheSize = 0,
+            debug = False,
+            steps = 1,
+    )
+    assert len(results) == 3
+    assert all(isinstance(result["error"], str) for result in results)
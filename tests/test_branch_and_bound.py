@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+# Import special modules ...
+try:
+    import numpy
+except:
+    raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+try:
+    import pytest
+except:
+    raise Exception("\"pytest\" is not installed; run \"pip install --user pytest\"") from None
+try:
+    import shapely
+except:
+    raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+# Import my modules ...
+try:
+    import flffc
+except:
+    raise Exception("\"flffc\" is not installed; run \"pip install --user flffc\"") from None
+
+# ******************************************************************************
+
+# Define test ...
+def test_branch_and_bound(
+    find,
+    geom,
+    coast,
+):
+    # Find the location furthest from the coast using branch-and-bound ...
+    conv = 1000.0                                                               # [m]
+    bestLon, bestLat, bestDist, lons, lats, dists = find(
+          conv = conv,
+        method = "BranchAndBound",
+    )                                                                           # [°], [°], [m], [°], [°], [m]
+
+    # Check that the location is within the country and that its distance is
+    # the distance from it to the coast ...
+    coastLons, coastLats = coast
+    assert shapely.contains_xy(geom, bestLon, bestLat)
+    assert bestDist == flffc.calc_min_dists(
+        numpy.array([bestLon]),
+        numpy.array([bestLat]),
+        coastLons,
+        coastLats,
+        debug = False,
+    )[0]
+    assert bestDist == dists.max()
+    assert lons.size == lats.size == dists.size
+
+    # Check that a finer uniform grid cannot find a location which is further
+    # from the coast (by more than the convergence distance) ...
+    assert bestDist >= find(steps = 100)[2] - conv
+
+# Define test ...
+@pytest.mark.parametrize("conv", [-1.0, 0.0])
+@pytest.mark.parametrize("country", ["Discland"])
+def test_branch_and_bound_conv(
+    find,
+    conv,
+):
+    # Check that the search cannot be asked to converge perfectly ...
+    with pytest.raises(ValueError):
+        find(conv = conv, method = "BranchAndBound")
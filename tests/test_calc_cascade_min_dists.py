@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+# Import special modules ...
+try:
+    import numpy
+except:
+    raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+try:
+    import pytest
+except:
+    raise Exception("\"pytest\" is not installed; run \"pip install --user pytest\"") from None
+
+# Import my modules ...
+try:
+    import flffc
+except:
+    raise Exception("\"flffc\" is not installed; run \"pip install --user flffc\"") from None
+
+# ******************************************************************************
+
+# Define function ...
+def coarsen(
+    coastLons,
+    coastLats,
+    /,
+    *,
+    stride = 4,
+):
+    # Return every "stride"-th coordinate of the coast (and the last one) ...
+    keep = numpy.zeros(coastLons.size, dtype = bool)
+    keep[::stride] = True
+    keep[-1] = True
+    return coastLons[keep], coastLats[keep]
+
+# ******************************************************************************
+
+# Define test ...
+@pytest.mark.parametrize("workers", [1, 2])
+def test_cascade_min_dists(
+    find,
+    coast,
+    workers,
+):
+    # Make coarser versions of the coast (coarsest first) ...
+    coastLons, coastLats = coast
+    coarseCoasts = [
+        coarsen(coastLons, coastLats, stride = 16),
+        coarsen(coastLons, coastLats, stride = 4),
+    ]
+
+    # Check that the largest of the distances is the largest of the distances
+    # to the coast and that the locations which were not discarded have
+    # exactly the same distances as without the coarser coasts ...
+    _, _, bestDist, lons, lats, dists = find(backend = "Vincenty")
+    actual = flffc.calc_cascade_min_dists(lons, lats, coastLons, coastLats, coarseCoasts, debug = False, workers = workers)
+    assert actual.max() == bestDist
+    assert numpy.all((actual == dists) | (actual < bestDist))
+
+# Define test ...
+@pytest.mark.parametrize("prune", [False, True])
+def test_cascade(
+    find,
+    coast,
+    prune,
+):
+    # Make coarser versions of the coast (coarsest first) ...
+    coastLons, coastLats = coast
+    coarseCoasts = [
+        coarsen(coastLons, coastLats, stride = 16),
+        coarsen(coastLons, coastLats, stride = 4),
+    ]
+
+    # Check that using the coarser coasts gives exactly the same answer ...
+    expected = find(backend = "Vincenty")
+    actual = find(backend = "Vincenty", coarseCoasts = coarseCoasts, prune = prune)
+    assert actual[:3] == expected[:3]
+
+# Define test ...
+@pytest.mark.parametrize("country", ["Discland"])
+def test_cascade_prune_workers(
+    coast,
+):
+    # Check that pruning cannot be spread across a pool of processes ...
+    coastLons, coastLats = coast
+    with pytest.raises(ValueError):
+        flffc.calc_cascade_min_dists(coastLons, coastLats, coastLons, coastLats, [coarsen(coastLons, coastLats)], debug = False, prune = True, workers = 2)
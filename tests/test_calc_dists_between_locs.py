@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+
+# Import special modules ...
+try:
+    import numpy
+except:
+    raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+try:
+    import pytest
+except:
+    raise Exception("\"pytest\" is not installed; run \"pip install --user pytest\"") from None
+
+# Import my modules ...
+try:
+    import flffc
+except:
+    raise Exception("\"flffc\" is not installed; run \"pip install --user flffc\"") from None
+try:
+    import pyguymer3
+    import pyguymer3.geo
+except:
+    raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+# ******************************************************************************
+
+# Define function ...
+def make_pairs(
+    kind,
+    /,
+    *,
+    n = 500,
+):
+    # Make some random pairs of coordinates of the requested kind ...
+    rng = numpy.random.default_rng(0)
+    lons1 = rng.uniform(-180.0, 180.0, n)                                       # [°]
+    lats1 = rng.uniform(-90.0, 90.0, n)                                         # [°]
+    match kind:
+        case "random":
+            lons2 = rng.uniform(-180.0, 180.0, n)                               # [°]
+            lats2 = rng.uniform(-90.0, 90.0, n)                                 # [°]
+        case "nearly antipodal":
+            lats1 = rng.uniform(-80.0, 80.0, n)                                 # [°]
+            lons2 = (lons1 + rng.uniform(177.0, 183.0, n) + 180.0) % 360.0 - 180.0  # [°]
+            lats2 = rng.uniform(-3.0, 3.0, n) - lats1                           # [°]
+        case "nearly equatorial":
+            lats1 = rng.uniform(-0.01, 0.01, n)                                 # [°]
+            lons2 = rng.uniform(-180.0, 180.0, n)                               # [°]
+            lats2 = rng.uniform(-0.01, 0.01, n)                                 # [°]
+        case "meridional":
+            lons2 = lons1.copy()                                                # [°]
+            lats2 = rng.uniform(-90.0, 90.0, n)                                 # [°]
+        case "coincident":
+            lons2 = lons1.copy()                                                # [°]
+            lats2 = lats1.copy()                                                # [°]
+        case _:
+            # Crash ...
+            raise ValueError(f"\"kind\" is an unexpected value ({repr(kind)})") from None
+
+    # Return answers ...
+    return lons1, lats1, lons2, lats2
+
+# ******************************************************************************
+
+# Define test ...
+@pytest.mark.parametrize(
+    "kind",
+    [
+        "coincident",
+        "meridional",
+        "nearly antipodal",
+        "nearly equatorial",
+        "random",
+    ],
+)
+def test_vincenty(
+    kind,
+):
+    # Find the distance between each pair of coordinates, one pair at a time,
+    # skipping the pairs which the scalar Vincenty formula cannot do ...
+    lons1, lats1, lons2, lats2 = make_pairs(kind)
+    keep = []
+    expected = []                                                               # [m]
+    for i in range(lons1.size):
+        try:
+            s, _, _ = pyguymer3.geo.calc_dist_between_two_locs(
+                lons1[i],
+                lats1[i],
+                lons2[i],
+                lats2[i],
+            )                                                                   # [m]
+        except Exception:
+            continue
+        keep.append(i)
+        expected.append(s)                                                      # [m]
+
+    # Check that most of the pairs were done ...
+    assert len(keep) >= lons1.size // 2
+
+    # Check that the vectorised Vincenty formula gives the same distances (to
+    # within rounding) ...
+    actual = flffc.calc_dists_between_locs(
+        lons1[keep],
+        lats1[keep],
+        lons2[keep],
+        lats2[keep],
+        backend = "Vincenty",
+    )                                                                           # [m]
+    numpy.testing.assert_allclose(actual, expected, atol = 1.0e-6, rtol = 1.0e-14)
+
+# Define test ...
+def test_vincenty_equatorial():
+    # Make some pairs of coordinates which are both on the equator (but not
+    # nearly antipodal) ...
+    # NOTE: The scalar Vincenty formula divides by zero for these pairs, so they
+    #       are compared with the distance along the equator instead.
+    rng = numpy.random.default_rng(0)
+    lons1 = rng.uniform(-180.0, 180.0, 500)                                     # [°]
+    dlons = rng.uniform(-170.0, 170.0, 500)                                     # [°]
+    lons2 = (lons1 + dlons + 180.0) % 360.0 - 180.0                             # [°]
+
+    # Check that the vectorised Vincenty formula gives the distance along the
+    # equator ...
+    actual = flffc.calc_dists_between_locs(
+        lons1,
+        0.0,
+        lons2,
+        0.0,
+        backend = "Vincenty",
+    )                                                                           # [m]
+    numpy.testing.assert_allclose(actual, 6378137.0 * numpy.radians(numpy.abs(dlons)), rtol = 1.0e-11)
+
+# Define test ...
+def test_vincenty_broadcast():
+    # Check that broadcasting the arrays against each other gives the same
+    # distances as one pair at a time ...
+    lons1, lats1, lons2, lats2 = make_pairs("random", n = 20)
+    actual = flffc.calc_dists_between_locs(
+        lons1.reshape(-1, 1),
+        lats1.reshape(-1, 1),
+        lons2.reshape(1, -1),
+        lats2.reshape(1, -1),
+        backend = "Vincenty",
+    )                                                                           # [m]
+    assert actual.shape == (20, 20)
+    for i in range(20):
+        for j in range(20):
+            s, _, _ = pyguymer3.geo.calc_dist_between_two_locs(
+                lons1[i],
+                lats1[i],
+                lons2[j],
+                lats2[j],
+            )                                                                   # [m]
+            assert actual[i, j] == pytest.approx(s, abs = 1.0e-6, rel = 1.0e-14)
+
+# Define test ...
+@pytest.mark.parametrize(
+    "backend, rtol",
+    [
+        ("AndoyerLambert", 1.5e-6),
+        ("Haversine", 5.6e-3),
+        ("Karney", 1.0e-10),
+    ],
+)
+def test_backends(
+    backend,
+    rtol,
+):
+    # Make some random pairs of coordinates which are less than 10,000 km
+    # apart ...
+    lons1, lats1, lons2, lats2 = make_pairs("random", n = 2000)
+    expected = flffc.calc_dists_between_locs(
+        lons1,
+        lats1,
+        lons2,
+        lats2,
+        backend = "Vincenty",
+    )                                                                           # [m]
+    keep = expected < 1.0e7
+
+    # Check that the backend is within its worst-case error of the Vincenty
+    # formula ...
+    actual = flffc.calc_dists_between_locs(
+        lons1[keep],
+        lats1[keep],
+        lons2[keep],
+        lats2[keep],
+        backend = backend,
+    )                                                                           # [m]
+    numpy.testing.assert_allclose(actual, expected[keep], atol = 1.0e-3, rtol = rtol)
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+# Import special modules ...
+try:
+    import numpy
+except:
+    raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+try:
+    import pytest
+except:
+    raise Exception("\"pytest\" is not installed; run \"pip install --user pytest\"") from None
+
+# Import my modules ...
+try:
+    import flffc
+except:
+    raise Exception("\"flffc\" is not installed; run \"pip install --user flffc\"") from None
+
+# ******************************************************************************
+
+# Define test ...
+@pytest.mark.parametrize("useKDTree", [False, True])
+def test_workers(
+    find,
+    coast,
+    useKDTree,
+):
+    # Check that spreading the locations across a pool of processes gives
+    # exactly the same distances, in the same order, as one process ...
+    _, _, _, lons, lats, dists = find(backend = "Vincenty")
+    coastLons, coastLats = coast
+    tree = flffc.make_coast_tree(coastLons, coastLats) if useKDTree else None
+    assert numpy.array_equal(
+        flffc.calc_min_dists(lons, lats, coastLons, coastLats, debug = False, tree = tree, workers = 2),
+        dists,
+    )
+
+    # Check that the whole search gives exactly the same answer too ...
+    actual = find(backend = "Vincenty", useKDTree = useKDTree, workers = 2)
+    assert actual[:3] == find(backend = "Vincenty")[:3]
+    assert numpy.array_equal(actual[5], dists)
+
+# Define test ...
+def test_hybrid(
+    find,
+    coast,
+):
+    # Check that the "Hybrid" backend gives exactly the same distances as the
+    # "Vincenty" backend ...
+    _, _, _, lons, lats, dists = find(backend = "Vincenty")
+    coastLons, coastLats = coast
+    assert numpy.array_equal(
+        flffc.calc_min_dists(lons, lats, coastLons, coastLats, backend = "Hybrid", debug = False),
+        dists,
+    )
+
+    # Check that it still does when the coast is split into lots of chunks ...
+    assert numpy.array_equal(
+        flffc.calc_min_dists(lons, lats, coastLons, coastLats, backend = "Hybrid", debug = False, ramLimit = 32 * 8 * 64),
+        dists,
+    )
+
+# Define test ...
+def test_hybrid_far():
+    # Make some locations which are a long way from a small coast (but not so
+    # nearly antipodal that the Vincenty formula fails to converge) ...
+    rng = numpy.random.default_rng(0)
+    lons = rng.uniform(-120.0, 150.0, 400)                                      # [°]
+    lats = rng.uniform(-80.0, 80.0, 400)                                        # [°]
+    coastLons = rng.uniform(-10.0, 10.0, 300)                                   # [°]
+    coastLats = rng.uniform(-10.0, 10.0, 300)                                   # [°]
+
+    # Check that the "Hybrid" backend gives exactly the same distances as the
+    # "Vincenty" backend, even for the locations which are more than 10,000 km
+    # from the coast ...
+    dists = flffc.calc_min_dists(lons, lats, coastLons, coastLats, backend = "Vincenty", debug = False)
+    assert numpy.any(dists > 1.0e7)
+    assert numpy.array_equal(
+        flffc.calc_min_dists(lons, lats, coastLons, coastLats, backend = "Hybrid", debug = False),
+        dists,
+    )
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+
+# Import special modules ...
+try:
+    import numpy
+except:
+    raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+try:
+    import pytest
+except:
+    raise Exception("\"pytest\" is not installed; run \"pip install --user pytest\"") from None
+
+# Import my modules ...
+try:
+    import flffc
+except:
+    raise Exception("\"flffc\" is not installed; run \"pip install --user flffc\"") from None
+
+# ******************************************************************************
+
+# Define test ...
+@pytest.mark.parametrize("useKDTree", [False, True])
+def test_pruned_min_dists(
+    find,
+    coast,
+    useKDTree,
+):
+    # Check that the largest of the pruned distances is the largest of the
+    # distances and that the distances of the pruned locations are upper
+    # bounds which are less than it ...
+    _, _, bestDist, lons, lats, dists = find(backend = "Vincenty")
+    coastLons, coastLats = coast
+    tree = flffc.make_coast_tree(coastLons, coastLats) if useKDTree else None
+    pruned = flffc.calc_pruned_min_dists(lons, lats, coastLons, coastLats, debug = False, tree = tree)
+    assert pruned.max() == bestDist
+    assert numpy.all(pruned >= dists)
+    assert numpy.all((pruned == dists) | (pruned < bestDist))
+
+# Define test ...
+@pytest.mark.parametrize("useKDTree", [False, True])
+def test_prune(
+    find,
+    useKDTree,
+):
+    # Check that pruning gives exactly the same answer and that the distances
+    # of the pruned locations are upper bounds which are less than it ...
+    expected = find(backend = "Vincenty")
+    actual = find(backend = "Vincenty", prune = True, useKDTree = useKDTree)
+    assert actual[:3] == expected[:3]
+    assert numpy.all(actual[5] >= expected[5])
+    assert numpy.all((actual[5] == expected[5]) | (actual[5] < expected[2]))
+
+# Define test ...
+@pytest.mark.parametrize("country", ["Discland"])
+def test_prune_workers(
+    find,
+):
+    # Check that pruning cannot be spread across a pool of processes ...
+    with pytest.raises(ValueError):
+        find(prune = True, workers = 2)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+
+# Import standard modules ...
+import functools
+
+# Import special modules ...
+try:
+    import numpy
+except:
+    raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+try:
+    import pytest
+except:
+    raise Exception("\"pytest\" is not installed; run \"pip install --user pytest\"") from None
+try:
+    import shapely
+    import shapely.geometry
+except:
+    raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+# Import my modules ...
+try:
+    import pyguymer3
+    import pyguymer3.geo
+except:
+    raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+# ******************************************************************************
+
+# Define function ...
+@functools.cache
+def serial(
+    geom,
+    /,
+    *,
+    steps = 25,
+):
+    # Find extent of the country and make longitude and latitude grid ...
+    lon_min, lat_min, lon_max, lat_max = geom.bounds                            # [°], [°], [°], [°]
+    xcoords = numpy.linspace(lon_min, lon_max, num = steps)                     # [°]
+    ycoords = numpy.linspace(lat_min, lat_max, num = steps)                     # [°]
+
+    # Make empty lists of points ...
+    xpoints = []                                                                # [°]
+    ypoints = []                                                                # [°]
+    zpoints = []                                                                # [m]
+
+    # Loop over longitudes and latitudes (in the same way as the original
+    # version of FLFFC did, one point and one coordinate at a time) ...
+    for ix in range(steps):
+        for iy in range(steps):
+            # Skip this point if it is not within the geometry ...
+            if not geom.contains(shapely.geometry.Point(xcoords[ix], ycoords[iy])):
+                continue
+
+            # Set a silly initial minimum ...
+            zpoint1 = 2.0 * pyguymer3.CIRCUMFERENCE_OF_EARTH                    # [m]
+
+            # Loop over Polygons ...
+            for poly in pyguymer3.geo.extract_polys(geom):
+                # Loop over coordinates in exterior ring ...
+                for coord in poly.exterior.coords:
+                    # Find distance between points and replace current minimum
+                    # if required ...
+                    zpoint2, _, _ = pyguymer3.geo.calc_dist_between_two_locs(
+                        xcoords[ix],
+                        ycoords[iy],
+                        coord[0],
+                        coord[1],
+                    )                                                           # [m], [°], [°]
+                    zpoint1 = min(zpoint1, zpoint2)                             # [m]
+
+            # Add values to lists ...
+            xpoints.append(xcoords[ix])                                         # [°]
+            ypoints.append(ycoords[iy])                                         # [°]
+            zpoints.append(zpoint1)                                             # [m]
+
+    # Return answers ...
+    return numpy.array(xpoints), numpy.array(ypoints), numpy.array(zpoints)
+
+# ******************************************************************************
+
+# Define test ...
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"backend" : "Hybrid"},
+        {"useKDTree" : True},
+        {"workers" : 2},
+        {"prune" : True},
+        {"backend" : "Hybrid", "prune" : True, "useKDTree" : True},
+    ],
+    ids = [
+        "default",
+        "Hybrid",
+        "KD-tree",
+        "workers",
+        "prune",
+        "all",
+    ],
+)
+def test_serial(
+    find,
+    geom,
+    kwargs,
+):
+    # Find the location furthest from the coast, one point and one coordinate
+    # of the coast at a time, using the scalar Vincenty formula ...
+    lons, lats, dists = serial(geom)                                            # [°], [°], [m]
+    iBest = dists.argmax()
+
+    # Check that the quicker options sample exactly the same locations and
+    # find exactly the same location furthest from the coast (and the same
+    # distance, to within rounding) ...
+    bestLon, bestLat, bestDist, actualLons, actualLats, actualDists = find(**kwargs)   # [°], [°], [m], [°], [°], [m]
+    assert numpy.array_equal(actualLons, lons)
+    assert numpy.array_equal(actualLats, lats)
+    assert (bestLon, bestLat) == (lons[iBest], lats[iBest])
+    assert bestDist == pytest.approx(dists[iBest], abs = 1.0e-6, rel = 1.0e-14)
+
+    # Check that the distances are the same (to within rounding), apart from
+    # the distances of the pruned locations, which are upper bounds which are
+    # less than the furthest distance ...
+    same = numpy.isclose(actualDists, dists, atol = 1.0e-6, rtol = 1.0e-14)
+    if kwargs.get("prune", False):
+        assert numpy.all(same | ((actualDists > dists) & (actualDists < bestDist)))
+    else:
+        assert numpy.all(same)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+# Import special modules ...
+try:
+    import numpy
+except:
+    raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+try:
+    import pytest
+except:
+    raise Exception("\"pytest\" is not installed; run \"pip install --user pytest\"") from None
+try:
+    import shapely
+except:
+    raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+# Import my modules ...
+try:
+    import flffc
+except:
+    raise Exception("\"flffc\" is not installed; run \"pip install --user flffc\"") from None
+
+# ******************************************************************************
+
+# Define test ...
+@pytest.mark.parametrize("lat", [0.0, 40.0, 70.0])
+def test_fibonacci_lattice_density(
+    lat,
+):
+    # Make a box of longitudes and latitudes and find its area on the sphere
+    # which the lattice is equal-area on ...
+    geom = shapely.box(10.0, lat, 20.0, lat + 10.0)
+    area = 6371.0072 ** 2 * numpy.radians(10.0) * (numpy.sin(numpy.radians(lat + 10.0)) - numpy.sin(numpy.radians(lat)))  # [km2]
+
+    # Check that the locations are within the box and that the number of them
+    # is the density multiplied by the area, wherever the box is ...
+    lons, lats = flffc.fibonacci_lattice(geom, density = 2.0)                   # [°], [°]
+    assert numpy.all(shapely.contains_xy(geom, lons, lats))
+    assert lons.size == pytest.approx(2.0 * area / 1000.0, rel = 0.02)
+
+# Define test ...
+def test_fibonacci_lattice_find(
+    find,
+    geom,
+    coast,
+):
+    # Check that the location furthest from the coast is within the country
+    # and that its distance really is its distance to the coast ...
+    bestLon, bestLat, bestDist, lons, lats, dists = find(method = "FibonacciLattice")   # [°], [°], [m], [°], [°], [m]
+    coastLons, coastLats = coast
+    assert shapely.contains_xy(geom, bestLon, bestLat)
+    assert numpy.all(shapely.contains_xy(geom, lons, lats))
+    assert bestDist == dists.max()
+    assert numpy.array_equal(
+        dists,
+        flffc.calc_min_dists(lons, lats, coastLons, coastLats, debug = False),
+    )
+
+# Define test ...
+@pytest.mark.parametrize("country", ["Discland"])
+def test_fibonacci_lattice_empty(
+    find,
+):
+    # Check that a lattice which is too sparse to sample the country raises a
+    # clear exception ...
+    with pytest.raises(Exception, match = "density"):
+        find(density = 1.0e-9, method = "FibonacciLattice")
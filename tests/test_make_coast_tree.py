@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+
+# Import special modules ...
+try:
+    import numpy
+except:
+    raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+try:
+    import pytest
+except:
+    raise Exception("\"pytest\" is not installed; run \"pip install --user pytest\"") from None
+
+# Import my modules ...
+try:
+    import flffc
+except:
+    raise Exception("\"flffc\" is not installed; run \"pip install --user flffc\"") from None
+
+# ******************************************************************************
+
+# Define test ...
+def test_tree_nearest(
+    coast,
+):
+    # Make some random locations around the coast ...
+    coastLons, coastLats = coast                                                # [°], [°]
+    rng = numpy.random.default_rng(0)
+    lons = rng.uniform(coastLons.min() - 1.0, coastLons.max() + 1.0, 200)       # [°]
+    lats = rng.uniform(coastLats.min() - 1.0, coastLats.max() + 1.0, 200)       # [°]
+
+    # Check that the KD-tree finds the coordinate of the coast which is nearest
+    # (as the crow flies through the Earth) to each location ...
+    _, nearest = flffc.make_coast_tree(coastLons, coastLats).query(flffc.ll2xyz(lons, lats))
+    chords = numpy.linalg.norm(
+        flffc.ll2xyz(lons, lats)[:, numpy.newaxis, :] - flffc.ll2xyz(coastLons, coastLats)[numpy.newaxis, :, :],
+        axis = 2,
+    )
+    assert numpy.array_equal(chords[numpy.arange(lons.size), nearest], chords.min(axis = 1))
+
+# Define test ...
+@pytest.mark.parametrize("backend", ["Hybrid", "Vincenty"])
+def test_kdtree(
+    find,
+    backend,
+):
+    # Check that using a KD-tree gives exactly the same answer as comparing
+    # every location with every coordinate of the coast ...
+    expected = find(backend = "Vincenty")
+    actual = find(backend = backend, useKDTree = True)
+    assert actual[:3] == expected[:3]
+    assert numpy.array_equal(actual[5], expected[5])
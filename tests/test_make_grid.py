@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+# Import special modules ...
+try:
+    import numpy
+except:
+    raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+try:
+    import pytest
+except:
+    raise Exception("\"pytest\" is not installed; run \"pip install --user pytest\"") from None
+try:
+    import shapely
+except:
+    raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+# Import my modules ...
+try:
+    import flffc
+except:
+    raise Exception("\"flffc\" is not installed; run \"pip install --user flffc\"") from None
+
+# ******************************************************************************
+
+# Define test ...
+def test_float32(
+    naturalEarth,
+    tmp_path,
+    country,
+):
+    # Find the location furthest from the coast, storing the sampled locations
+    # using 64-bit and 32-bit floats ...
+    expected = flffc.compute(country, cacheDir = tmp_path, cacheSize = 0, debug = False, dtype = "float64", steps = 25)
+    actual = flffc.compute(country, cacheDir = tmp_path, cacheSize = 0, debug = False, dtype = "float32", steps = 25)
+
+    # Check that only the storage of the sampled locations changed ...
+    for key in ["bestDist", "bestLat", "bestLon"]:
+        assert actual[key] == expected[key]
+    for key in ["dists", "lats", "lons"]:
+        assert actual[key].dtype == numpy.float32
+        assert numpy.array_equal(actual[key], expected[key].astype(numpy.float32))
+
+# Define test ...
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_make_grid(
+    naturalEarth,
+    tmp_path,
+    country,
+    dtype,
+):
+    # Find the location furthest from the coast and put the sampled locations
+    # back onto the uniform grid ...
+    result = flffc.compute(country, cacheDir = tmp_path, cacheSize = 0, debug = False, dtype = dtype, steps = 25)
+    xcoords, ycoords, dists = flffc.make_grid(result)                           # [°], [°], [m]
+
+    # Check that the grid is the one which was sampled ...
+    lon_min, lat_min, lon_max, lat_max = result["bounds"]                       # [°], [°], [°], [°]
+    assert numpy.array_equal(xcoords, numpy.linspace(lon_min, lon_max, num = 25))
+    assert numpy.array_equal(ycoords, numpy.linspace(lat_min, lat_max, num = 25))
+
+    # Check that exactly the points on the grid which are within the country
+    # are not masked and that they have the distances of the sampled locations
+    # (in the same order as looping over longitudes and then latitudes) ...
+    xgrid, ygrid = numpy.meshgrid(xcoords, ycoords, indexing = "ij")            # [°], [°]
+    polys, _, _ = flffc.load_country(country, cacheDir = tmp_path, debug = False)
+    assert dists.dtype == numpy.dtype(dtype)
+    assert numpy.array_equal(~numpy.ma.getmaskarray(dists), shapely.contains_xy(polys, xgrid, ygrid))
+    assert numpy.array_equal(dists.compressed(), result["dists"])
+
+# Define test ...
+def test_make_grid_method():
+    # Check that an answer which was not found using a uniform grid cannot be
+    # put back onto one ...
+    with pytest.raises(ValueError):
+        flffc.make_grid({"method" : "FibonacciLattice"})
+
+# Define test ...
+@pytest.mark.parametrize("country", ["Discland"])
+def test_dtype(
+    naturalEarth,
+    tmp_path,
+    country,
+):
+    # Check that an unexpected type is rejected ...
+    with pytest.raises(ValueError):
+        flffc.compute(country, cacheDir = tmp_path, cacheSize = 0, debug = False, dtype = "float16")
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+
+# Import special modules ...
+try:
+    import numpy
+except:
+    raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+try:
+    import pytest
+except:
+    raise Exception("\"pytest\" is not installed; run \"pip install --user pytest\"") from None
+try:
+    import shapely
+except:
+    raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+# Import my modules ...
+try:
+    import flffc
+except:
+    raise Exception("\"flffc\" is not installed; run \"pip install --user flffc\"") from None
+
+# ******************************************************************************
+
+# Define test ...
+def test_polygon_grid(
+    geom,
+):
+    # Check that all of the sampled locations are within the country and that
+    # there are roughly as many of them as were asked for ...
+    lons, lats = flffc.polygon_grid(geom, steps = 25)                           # [°], [°]
+    assert numpy.all(shapely.contains_xy(geom, lons, lats))
+    assert 0.5 * 25 ** 2 <= lons.size <= 1.5 * 25 ** 2
+
+# Define test ...
+def test_polygon_grid_islands():
+    # Make a country which is a large island and a tiny islet ...
+    geom = shapely.MultiPolygon(
+        [
+            shapely.box(0.0, 0.0, 10.0, 10.0),
+            shapely.box(20.0, 20.0, 20.001, 20.001),
+        ]
+    )
+
+    # Check that both of them are sampled, even though the islet is much too
+    # small to get any of the locations of the grid ...
+    lons, lats = flffc.polygon_grid(geom, steps = 10)                           # [°], [°]
+    assert numpy.all(shapely.contains_xy(geom, lons, lats))
+    assert numpy.sum(lons > 15.0) == 1
+    assert numpy.sum(lons < 15.0) >= 50
+
+# Define test ...
+def test_polygon_grid_find(
+    find,
+    geom,
+    coast,
+):
+    # Check that the location furthest from the coast is within the country
+    # and that its distance really is its distance to the coast ...
+    bestLon, bestLat, bestDist, lons, lats, dists = find(method = "PolygonGrid")    # [°], [°], [m], [°], [°], [m]
+    coastLons, coastLats = coast
+    assert shapely.contains_xy(geom, bestLon, bestLat)
+    assert bestDist == dists.max()
+    assert numpy.array_equal(
+        dists,
+        flffc.calc_min_dists(lons, lats, coastLons, coastLats, debug = False),
+    )
+
+# Define test ...
+def test_polygon_grid_antimeridian():
+    # Make a square country and the same country split in half at the
+    # anti-meridian (in the same way as Natural Earth does) ...
+    whole = shapely.segmentize(shapely.box(-5.0, -5.0, 5.0, 5.0), 0.1)
+    split = shapely.segmentize(
+        shapely.MultiPolygon(
+            [
+                shapely.box(175.0, -5.0, 180.0, 5.0),
+                shapely.box(-180.0, -5.0, -175.0, 5.0),
+            ]
+        ),
+        0.1,
+    )
+
+    # Check that the split is not treated as part of the coast, so the
+    # location furthest from the coast is near the anti-meridian and is about
+    # as far from the coast as the middle of the whole square ...
+    expected = flffc.find_furthest(whole, debug = False, method = "PolygonGrid", steps = 25)
+    actual = flffc.find_furthest(split, debug = False, method = "PolygonGrid", steps = 25)
+    assert abs(actual[0]) > 179.0
+    assert actual[2] > 0.95 * expected[2]
+
+# Define test ...
+def test_polygon_grid_empty():
+    # Check that a country without any Polygons raises a clear exception ...
+    with pytest.raises(Exception, match = "steps"):
+        flffc.find_furthest(shapely.MultiPolygon(), debug = False, method = "PolygonGrid", steps = 25)
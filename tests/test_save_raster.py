@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+
+# Import standard modules ...
+import json
+
+# Import special modules ...
+try:
+    import numpy
+except:
+    raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+try:
+    import pytest
+except:
+    raise Exception("\"pytest\" is not installed; run \"pip install --user pytest\"") from None
+
+# Import my modules ...
+try:
+    import flffc
+except:
+    raise Exception("\"flffc\" is not installed; run \"pip install --user flffc\"") from None
+
+# ******************************************************************************
+
+# Define test ...
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_save_raster(
+    naturalEarth,
+    tmp_path,
+    country,
+    dtype,
+):
+    # Find the location furthest from the coast and save the distances as a
+    # raster ...
+    result = flffc.compute(country, cacheDir = tmp_path, cacheSize = 0, debug = False, dtype = dtype, steps = 25)
+    flffc.save_raster(f"{tmp_path}/rasters", result, debug = False)
+
+    # Load the raster and its header ...
+    raster = numpy.load(f"{tmp_path}/rasters/{country}.npy")                    # [m]
+    with open(f"{tmp_path}/rasters/{country}.npy.json", mode = "rt", encoding = "utf-8") as fObj:
+        header = json.load(fObj)
+
+    # Check that the raster is the grid of distances, laid out north-up (like
+    # a GeoTIFF), with NaN where the grid is not within the country ...
+    xcoords, ycoords, dists = flffc.make_grid(result)                           # [°], [°], [m]
+    assert raster.dtype == numpy.dtype(dtype)
+    assert raster.shape == (header["height"], header["width"]) == (ycoords.size, xcoords.size)
+    assert numpy.array_equal(raster, dists.filled(numpy.nan).T[::-1, :], equal_nan = True)
+    assert numpy.nanmax(raster) == numpy.float64(result["bestDist"]).astype(dtype)
+
+    # Check that the affine transform puts the centre of each pixel on its
+    # point of the grid ...
+    x0, dx, rx, y0, ry, dy = header["transform"]
+    assert rx == ry == 0.0
+    assert header["crs"] == "EPSG:4326"
+    numpy.testing.assert_allclose(x0 + (numpy.arange(raster.shape[1]) + 0.5) * dx, xcoords, atol = 1.0e-9)
+    numpy.testing.assert_allclose(y0 + (numpy.arange(raster.shape[0]) + 0.5) * dy, ycoords[::-1], atol = 1.0e-9)
+
+# Define test ...
+@pytest.mark.parametrize("method", ["BranchAndBound", "FibonacciLattice", "PolygonGrid"])
+def test_save_raster_method(
+    tmp_path,
+    method,
+):
+    # Check that the distances of an answer which was not found using a
+    # uniform grid cannot be saved as a raster (before finding any
+    # locations) ...
+    with pytest.raises(ValueError):
+        flffc.run(tmp_path, debug = False, method = method, raster = True)
+    with pytest.raises(ValueError):
+        flffc.batch(f"{tmp_path}/batch.csv", debug = False, dirOut = tmp_path, method = method, raster = True)
+
+# Define test ...
+def test_save_raster_dirOut(
+    tmp_path,
+):
+    # Check that the rasters cannot be asked for without the PNGs (which they
+    # are saved next to) ...
+    with pytest.raises(ValueError):
+        flffc.batch(f"{tmp_path}/batch.csv", debug = False, raster = True)
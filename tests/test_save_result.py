@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+# Import standard modules ...
+import os
+
+# Import special modules ...
+try:
+    import numpy
+except:
+    raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+# Import my modules ...
+try:
+    import flffc
+except:
+    raise Exception("\"flffc\" is not installed; run \"pip install --user flffc\"") from None
+
+# ******************************************************************************
+
+# Define test ...
+def test_cache(
+    naturalEarth,
+    tmp_path,
+):
+    # Find the location furthest from the coast twice ...
+    first = flffc.compute("Discland", cacheDir = tmp_path, debug = False, steps = 25)
+    second = flffc.compute("Discland", cacheDir = tmp_path, debug = False, steps = 25)
+
+    # Check that the second answer was loaded from the cache of results and
+    # that it is the same as the first one ...
+    assert not first["cached"]
+    assert second["cached"]
+    assert second["key"] == first["key"]
+    for key in ["bestDist", "bestLat", "bestLon", "bounds", "country", "method", "steps"]:
+        assert second[key] == first[key]
+    for key in ["dists", "lats", "lons"]:
+        assert numpy.array_equal(second[key], first[key])
+
+    # Check that changing a parameter which the method uses misses the cache
+    # but changing one which it does not use hits it ...
+    assert not flffc.compute("Discland", cacheDir = tmp_path, debug = False, steps = 26)["cached"]
+    assert flffc.compute("Discland", cacheDir = tmp_path, conv = 1.0, debug = False, steps = 25)["cached"]
+
+    # Check that the cache of results is not used if its size is zero ...
+    assert not flffc.compute("Discland", cacheDir = tmp_path, cacheSize = 0, debug = False, steps = 25)["cached"]
+
+# Define test ...
+def test_eviction(
+    naturalEarth,
+    tmp_path,
+):
+    # Save three copies of an answer (with different keys) to the cache of
+    # results and make the first one the least recently used ...
+    result = flffc.compute("Discland", cacheDir = tmp_path, cacheSize = 0, debug = False, steps = 25)
+    dName = f"{tmp_path}/results"
+    for i, key in enumerate(["a", "b"]):
+        flffc.save_result(result | {"key" : key}, cacheDir = tmp_path)
+        os.utime(f"{dName}/{key}.npz", (1000.0 * (i + 1), 1000.0 * (i + 1)))
+    size = os.path.getsize(f"{dName}/a.npz")                                    # [B]
+
+    # Load the first one (which makes it the most recently used) ...
+    assert flffc.load_result("a", cacheDir = tmp_path)["key"] == "a"
+
+    # Save another copy in a cache which only has room for two of them and
+    # check that the least recently used one was evicted ...
+    flffc.save_result(result | {"key" : "c"}, cacheDir = tmp_path, cacheSize = 2 * size)
+    assert sorted(os.listdir(dName)) == ["a.npz", "c.npz"]
+    assert flffc.load_result("b", cacheDir = tmp_path) is None
+
+    # Check that the result which has just been saved is never evicted ...
+    flffc.save_result(result | {"key" : "d"}, cacheDir = tmp_path, cacheSize = 1)
+    assert sorted(os.listdir(dName)) == ["d.npz"]